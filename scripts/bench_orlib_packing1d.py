@@ -1,14 +1,24 @@
+import argparse
 import time
+from functools import partial
+
 import pandas as pd
 
+from apsuite.common.metrics import packing_metrics
 from apsuite.packing1d.algorithms import (
-    first_fit, best_fit, first_fit_decreasing, best_fit_decreasing
+    best_fit,
+    best_fit_decreasing,
+    ffd_local_improve,
+    first_fit,
+    first_fit_decreasing,
+    hybrid_ffd_bf,
 )
+from apsuite.packing1d.exact import solve_exact
+from apsuite.packing1d.lns import ffd_lns
 from apsuite.packing1d.lower_bounds import volume_lower_bound  # keep consistent for now
-from apsuite.common.metrics import packing_metrics
-from apsuite.packing1d.orlib_parser import load_orlib_dir
-from apsuite.packing1d.algorithms import ffd_local_improve
-from apsuite.packing1d.algorithms import hybrid_ffd_bf
+from apsuite.packing1d.lp_bound import lp_lower_bound_info
+from apsuite.packing1d.orlib_parser import classify_instance
+from apsuite.packing1d.orlib_store import load_orlib_cached
 
 ALGS = {
     "FF": first_fit,
@@ -19,23 +29,40 @@ ALGS = {
     "HYB(FFD,BF)": hybrid_ffd_bf,
 }
 
-def classify_instance(name: str) -> str:
-    name = name.lower()
-    if name.startswith("u"):
-        return "uniform"
-    if name.startswith("t"):
-        return "triplets"
-    return "other"
-
 def main():
-    instances = load_orlib_dir("data/raw/orlib_1d", normalize_capacity=True)
+    ap = argparse.ArgumentParser()
+    # off by default: the heuristics alone take seconds for the whole library
+    ap.add_argument("--exact", type=float, default=None, metavar="SECONDS",
+                    help="run the exact solver with this budget per instance "
+                         "(certifies optima)")
+    ap.add_argument("--lp-bound", type=float, default=None, metavar="SECONDS",
+                    help="compute the column-generation LP bound with this time "
+                         "cap per instance")
+    ap.add_argument("--lns", type=float, default=None, metavar="SECONDS",
+                    help="also run FFD+LNS with this wall-clock budget per instance")
+    args = ap.parse_args()
+
+    algs = dict(ALGS)
+    if args.lns is not None:
+        algs["FFD+LNS"] = partial(ffd_lns, time_limit_s=args.lns)
+
+    # parsed once into data/raw/orlib_1d/.store, memory-mapped afterwards
+    instances = load_orlib_cached("data/raw/orlib_1d", normalize_capacity=True)
 
     rows = []
     for inst in instances:
         items = inst.items
         lb = volume_lower_bound(items, capacity=1.0)
+        exact = (
+            solve_exact(items, capacity=1.0, time_limit_s=args.exact)
+            if args.exact is not None else None
+        )
+        lp = (
+            lp_lower_bound_info(items, capacity=1.0, time_limit_s=args.lp_bound)
+            if args.lp_bound is not None else None
+        )
 
-        for alg_name, alg in ALGS.items():
+        for alg_name, alg in algs.items():
             t0 = time.perf_counter()
             res = alg(items, capacity=1.0)
             dt = time.perf_counter() - t0
@@ -64,6 +91,17 @@ def main():
                 "class": inst_class,
                 "source": inst.source,
                 "gap_vs_best": relative_gap,
+                "exact_bins": exact.num_bins if exact else None,
+                "exact_lb": exact.lower_bound if exact else None,
+                "exact_optimal": exact.optimal if exact else None,
+                "gap_vs_exact_lb": (
+                    (res.num_bins - exact.lower_bound) / exact.lower_bound
+                    if exact else None
+                ),
+                "lb_lp": lp.bound if lp else None,
+                "lp_converged": lp.converged if lp else None,
+                "ratio_vs_lp": res.num_bins / lp.bound if lp else None,
+                "gap_vs_lp": (res.num_bins - lp.bound) / lp.bound if lp else None,
             })
 
     df = pd.DataFrame(rows)
@@ -81,6 +119,10 @@ def main():
     print("\nMean ratio_vs_best by source file:")
     print(df.groupby(["source", "alg"])["ratio_vs_best"].mean().round(4))
 
+    if args.lp_bound is not None:
+        print("\nMean gap_vs_lp by class:")
+        print(df.groupby(["class", "alg"])["gap_vs_lp"].mean().round(4))
+
     print("\nMean gap_vs_best by class:")
     print(df.groupby(["class", "alg"])["gap_vs_best"].mean().round(4))
 if __name__ == "__main__":
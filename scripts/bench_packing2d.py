@@ -1,14 +1,27 @@
 import time
+from functools import partial
 import pandas as pd
 
 from apsuite.packing2d.instances import Instance2DSpec, generate_rectangles
 from apsuite.packing2d.lower_bounds import area_lower_bound
-from apsuite.packing2d.algorithms import shelf, guillotine, hybrid_shelf_guillotine
+from apsuite.packing2d.algorithms import (
+    shelf, ffdh, bfdh, guillotine, guillotine_multibin, hybrid_shelf_guillotine,
+    maxrects, skyline,
+)
 
 ALGS = {
     "SHELF": shelf,
+    "FFDH": ffdh,
+    "BFDH": bfdh,
     "GUILLOTINE": guillotine,
+    "GUILLOTINE-MB": guillotine_multibin,
     "HYB(SHELF,GUIL)": hybrid_shelf_guillotine,
+    "MAXRECTS": maxrects,  # best short side fit
+    "MAXRECTS-BAF": partial(maxrects, rule="best_area"),
+    "MAXRECTS-BL": partial(maxrects, rule="bottom_left"),
+    "MAXRECTS-CP": partial(maxrects, rule="contact_point"),
+    "SKYLINE": skyline,  # bottom-left with waste map
+    "SKYLINE-MW": partial(skyline, rule="min_waste"),
 }
 
 def run_one(n: int, dist: str, seed: int, W: float, H: float):
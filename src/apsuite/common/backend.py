@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import warnings
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+# Kernel backend for the interpreted hot loops:
+#   - 'python': reference pure-Python implementations
+#   - 'numba' : jitted kernels from apsuite.common.kernels (optional dependency)
+BACKENDS = ("python", "numba")
+
+try:
+    import numba as _numba
+except ImportError:  # optional dependency: pip install apsuite[numba]
+    _numba = None
+
+NUMBA_AVAILABLE = _numba is not None
+
+
+def jit(fn: Callable) -> Callable:
+    """numba.njit(cache=True) if numba is installed, otherwise fn unchanged."""
+    if _numba is None:
+        return fn
+    return _numba.njit(cache=True)(fn)
+
+
+def _resolve(name: str) -> str:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend: {name}")
+    if name == "numba" and not NUMBA_AVAILABLE:
+        warnings.warn(
+            "numba is not installed; falling back to the 'python' backend",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return "python"
+    return name
+
+
+# selected at import time: APSUITE_BACKEND if set, else numba when available
+_backend = _resolve(
+    os.environ.get("APSUITE_BACKEND", "numba" if NUMBA_AVAILABLE else "python")
+)
+
+
+def get_backend() -> str:
+    return _backend
+
+
+def set_backend(name: str) -> str:
+    """Switch backend; returns the backend actually in use (after fallback)."""
+    global _backend
+    _backend = _resolve(name)
+    return _backend
+
+
+def use_kernels() -> bool:
+    return _backend == "numba"
+
+
+@contextmanager
+def using_backend(name: Optional[str]) -> Iterator[str]:
+    """
+    Switch backend for a block and restore the previous one on exit;
+    name=None keeps the current backend. Yields the backend in use.
+    """
+    global _backend
+    previous = _backend
+    if name is not None:
+        set_backend(name)
+    try:
+        yield _backend
+    finally:
+        _backend = previous
@@ -0,0 +1,439 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from apsuite.common.backend import jit
+
+# Array kernels behind the 'numba' backend. Each mirrors a pure-Python
+# reference implementation exactly (same tie-breaking and tolerances) and
+# only uses NumPy arrays and scalars so that numba can compile it in
+# nopython mode. Without numba they run as plain (slow) Python.
+
+
+@jit
+def first_fit_kernel(
+    items: np.ndarray, capacity: float, track: bool = True
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    First Fit with a tournament max-tree; returns (assign, loads, num_bins).
+    track=False leaves assign empty (count-only mode).
+    """
+    n = items.shape[0]
+    size = 1
+    while size < max(n, 1):
+        size *= 2
+    tree = np.full(2 * size, capacity)
+    assign = np.empty(n if track else 0, dtype=np.int32)
+    loads = np.zeros(max(n, 1))
+    num_bins = 0
+    for t in range(n):
+        x = items[t]
+        node = 1
+        while node < size:
+            node *= 2
+            if tree[node] < x:
+                node += 1
+        b = node - size
+        if b >= num_bins:
+            num_bins = b + 1
+            rem = capacity - x
+            loads[b] = x
+        else:
+            rem = tree[node] - x
+            loads[b] += x
+        if track:
+            assign[t] = b
+        tree[node] = rem
+        node //= 2
+        while node:
+            left = tree[2 * node]
+            right = tree[2 * node + 1]
+            best = left if left >= right else right
+            if tree[node] == best:
+                break
+            tree[node] = best
+            node //= 2
+    return assign, loads[:num_bins], num_bins
+
+
+@jit
+def _key_less(rems: np.ndarray, a: int, b: int) -> bool:
+    """(rems[a], a) < (rems[b], b)."""
+    return rems[a] < rems[b] or (rems[a] == rems[b] and a < b)
+
+
+@jit
+def _treap_split(
+    rems: np.ndarray, left: np.ndarray, right: np.ndarray, t: int, k: int
+) -> Tuple[int, int]:
+    """Split subtree t into the keys below key k and the rest; returns both roots."""
+    l_root = -1
+    r_root = -1
+    last_l = -1  # node whose right child is the open slot of the left tree
+    last_r = -1  # node whose left child is the open slot of the right tree
+    while t != -1:
+        if _key_less(rems, t, k):
+            if last_l == -1:
+                l_root = t
+            else:
+                right[last_l] = t
+            last_l = t
+            t = right[t]
+        else:
+            if last_r == -1:
+                r_root = t
+            else:
+                left[last_r] = t
+            last_r = t
+            t = left[t]
+    if last_l != -1:
+        right[last_l] = -1
+    if last_r != -1:
+        left[last_r] = -1
+    return l_root, r_root
+
+
+@jit
+def _treap_merge(
+    left: np.ndarray, right: np.ndarray, prio: np.ndarray, a: int, b: int
+) -> int:
+    """Merge subtrees a and b (all keys of a below those of b); returns the root."""
+    root = -1
+    last = -1         # node owning the open slot (-1: the root)
+    slot_left = False
+    while a != -1 and b != -1:
+        if prio[a] > prio[b]:
+            node = a
+            a = right[a]  # a keeps its left subtree; merge the rest into its right
+            node_slot_left = False
+        else:
+            node = b
+            b = left[b]   # b keeps its right subtree; merge into its left
+            node_slot_left = True
+        if last == -1:
+            root = node
+        elif slot_left:
+            left[last] = node
+        else:
+            right[last] = node
+        last = node
+        slot_left = node_slot_left
+    rest = a if a != -1 else b
+    if last == -1:
+        root = rest
+    elif slot_left:
+        left[last] = rest
+    else:
+        right[last] = rest
+    return root
+
+
+@jit
+def _treap_insert(
+    rems: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    prio: np.ndarray,
+    root: int,
+    k: int,
+) -> int:
+    """Insert node k (key (rems[k], k)); returns the new root."""
+    parent = -1
+    went_left = False
+    t = root
+    while t != -1 and prio[t] > prio[k]:
+        parent = t
+        went_left = _key_less(rems, k, t)
+        t = left[t] if went_left else right[t]
+    left[k], right[k] = _treap_split(rems, left, right, t, k)
+    if parent == -1:
+        return k
+    if went_left:
+        left[parent] = k
+    else:
+        right[parent] = k
+    return root
+
+
+@jit
+def _treap_delete(
+    rems: np.ndarray,
+    left: np.ndarray,
+    right: np.ndarray,
+    prio: np.ndarray,
+    root: int,
+    k: int,
+) -> int:
+    """Remove node k (present, key unchanged since insert); returns the new root."""
+    parent = -1
+    went_left = False
+    t = root
+    while t != k:
+        parent = t
+        went_left = _key_less(rems, k, t)
+        t = left[t] if went_left else right[t]
+    m = _treap_merge(left, right, prio, left[k], right[k])
+    if parent == -1:
+        return m
+    if went_left:
+        left[parent] = m
+    else:
+        right[parent] = m
+    return root
+
+
+@jit
+def best_fit_kernel(
+    items: np.ndarray, capacity: float, track: bool = True
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Best Fit over a treap of (remaining, bin) keys with the same lookup and
+    tie-breaking as BestFitIndex; node b is bin b and priorities come from a
+    fixed-seed Lehmer generator, so every lookup and update is an expected
+    O(log bins) walk. track=False leaves assign empty (count-only mode).
+    """
+    n = items.shape[0]
+    m = max(n, 1)
+    rems = np.empty(m)
+    left = np.full(m, -1, dtype=np.int64)
+    right = np.full(m, -1, dtype=np.int64)
+    prio = np.empty(m, dtype=np.int64)
+    loads = np.zeros(m)
+    assign = np.empty(n if track else 0, dtype=np.int32)
+    root = -1
+    num_bins = 0
+    seed = 1
+    for t in range(n):
+        x = items[t]
+        # first key with remaining >= x
+        b = -1
+        node = root
+        while node != -1:
+            if rems[node] >= x:
+                b = node
+                node = left[node]
+            else:
+                node = right[node]
+        if b == -1:
+            b = num_bins
+            num_bins += 1
+            seed = (seed * 48271) % 2147483647
+            prio[b] = seed
+            loads[b] = x
+            rems[b] = capacity - x
+            root = _treap_insert(rems, left, right, prio, root, b)
+            if track:
+                assign[t] = b
+            continue
+
+        # distinct remainings whose remaining-after rounds to the same value:
+        # jump to the lowest bin of the next larger remaining
+        best_after = rems[b] - x
+        rem = rems[b]
+        while True:
+            nxt = -1
+            node = root
+            while node != -1:
+                if rems[node] > rem:
+                    nxt = node
+                    node = left[node]
+                else:
+                    node = right[node]
+            if nxt == -1 or rems[nxt] - x != best_after:
+                break
+            rem = rems[nxt]
+            if nxt < b:
+                b = nxt
+        root = _treap_delete(rems, left, right, prio, root, b)
+        rems[b] = rems[b] - x
+        loads[b] += x
+        left[b] = -1
+        right[b] = -1
+        root = _treap_insert(rems, left, right, prio, root, b)
+        if track:
+            assign[t] = b
+    return assign, loads[:num_bins], num_bins
+
+
+@jit
+def _guillotine_best(
+    fw: np.ndarray,
+    fh: np.ndarray,
+    nfree: int,
+    rw: float,
+    rh: float,
+    score: int,
+    rotate: bool,
+) -> Tuple[int, bool]:
+    """Best free rectangle and orientation, both scored in one pass; -1 if none fits."""
+    best_idx = -1
+    best_rot = False
+    best_score = 0.0
+    for i in range(nfree):
+        for o in range(2 if rotate else 1):
+            w = rw if o == 0 else rh
+            h = rh if o == 0 else rw
+            if not (w <= fw[i] and h <= fh[i]):
+                continue
+            if score == 0:
+                s = fw[i] * fh[i] - w * h
+            else:
+                s = min(fw[i] - w, fh[i] - h)
+            if best_idx < 0 or s < best_score:
+                best_score = s
+                best_idx = i
+                best_rot = o == 1
+    return best_idx, best_rot
+
+
+@jit
+def guillotine_kernel(
+    w: np.ndarray,
+    h: np.ndarray,
+    W: float,
+    H: float,
+    score: int,
+    rotate: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Guillotine packing of rectangles in the given order (see guillotine_pack).
+    score: 0 = best_area_fit, 1 = best_short_side. The free list is kept in
+    the same order as the reference list so ties resolve identically.
+    Returns per-rectangle (bin, x, y, rotated).
+    """
+    n = w.shape[0]
+    cap = 2 * n + 2
+    fx = np.empty(cap)
+    fy = np.empty(cap)
+    fw = np.empty(cap)
+    fh = np.empty(cap)
+    keep = np.empty(cap, dtype=np.bool_)
+    out_bin = np.empty(n, dtype=np.int32)
+    out_x = np.empty(n)
+    out_y = np.empty(n)
+    out_rot = np.zeros(n, dtype=np.bool_)
+
+    nfree = 1
+    fx[0], fy[0], fw[0], fh[0] = 0.0, 0.0, W, H
+    cur_bin = 0
+    placed_in_bin = 0
+    for t in range(n):
+        best_idx, rot = _guillotine_best(fw, fh, nfree, w[t], h[t], score, rotate)
+        if best_idx < 0:
+            if placed_in_bin:
+                cur_bin += 1
+            placed_in_bin = 0
+            nfree = 1
+            fx[0], fy[0], fw[0], fh[0] = 0.0, 0.0, W, H
+            best_idx, rot = _guillotine_best(fw, fh, nfree, w[t], h[t], score, rotate)
+        rw = h[t] if rot else w[t]
+        rh = w[t] if rot else h[t]
+
+        x0, y0, w0, h0 = fx[best_idx], fy[best_idx], fw[best_idx], fh[best_idx]
+        # pop best_idx, keeping the order of the others
+        for i in range(best_idx, nfree - 1):
+            fx[i], fy[i], fw[i], fh[i] = fx[i + 1], fy[i + 1], fw[i + 1], fh[i + 1]
+        nfree -= 1
+        out_bin[t] = cur_bin
+        out_x[t] = x0
+        out_y[t] = y0
+        out_rot[t] = rot
+        placed_in_bin += 1
+
+        if w0 - rw > 1e-12:
+            fx[nfree], fy[nfree], fw[nfree], fh[nfree] = x0 + rw, y0, w0 - rw, rh
+            nfree += 1
+        if h0 - rh > 1e-12:
+            fx[nfree], fy[nfree], fw[nfree], fh[nfree] = x0, y0 + rh, w0, h0 - rh
+            nfree += 1
+
+        # drop free rectangles contained in another one
+        for i in range(nfree):
+            keep[i] = True
+            for j in range(nfree):
+                if i == j:
+                    continue
+                if (fx[i] >= fx[j] - 1e-12 and fy[i] >= fy[j] - 1e-12
+                        and fx[i] + fw[i] <= fx[j] + fw[j] + 1e-12
+                        and fy[i] + fh[i] <= fy[j] + fh[j] + 1e-12):
+                    keep[i] = False
+                    break
+        k = 0
+        for i in range(nfree):
+            if keep[i]:
+                fx[k], fy[k], fw[k], fh[k] = fx[i], fy[i], fw[i], fh[i]
+                k += 1
+        nfree = k
+    return out_bin, out_x, out_y, out_rot
+
+
+@jit
+def round_argmax_kernel(x: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """Argmax rounding with load tie-break (see round_by_argmax_with_load_tiebreak)."""
+    m, n = p.shape
+    loads = np.zeros(m)
+    assignment = np.empty(n, dtype=np.int64)
+    for j in range(n):
+        best = x[0, j]
+        for i in range(1, m):
+            if x[i, j] > best:
+                best = x[i, j]
+        pick = -1
+        pick_val = 0.0
+        for i in range(m):
+            if abs(x[i, j] - best) <= 1e-12:
+                v = loads[i] + p[i, j]
+                if pick < 0 or v < pick_val:
+                    pick = i
+                    pick_val = v
+        assignment[j] = pick
+        loads[pick] += p[pick, j]
+    return assignment
+
+
+@jit
+def single_moves_pass_kernel(a: np.ndarray, loads: np.ndarray, p: np.ndarray) -> bool:
+    """
+    One pass of local_improve_single_moves: move jobs off the critical
+    machine while that lowers the makespan. Updates a and loads in place.
+    """
+    m, n = p.shape
+    crit = 0
+    for i in range(1, m):
+        if loads[i] > loads[crit]:
+            crit = i
+    C0 = 0.0
+    for i in range(m):
+        if loads[i] > C0:
+            C0 = loads[i]
+
+    improved = False
+    for j in range(n):
+        if a[j] != crit:
+            continue
+        best_i = crit
+        best_C = C0
+        for i in range(m):
+            if i == crit:
+                continue
+            new_load_crit = loads[crit] - p[crit, j]
+            new_load_i = loads[i] + p[i, j]
+            other_max = 0.0
+            for k in range(m):
+                if k == crit or k == i:
+                    continue
+                if loads[k] > other_max:
+                    other_max = loads[k]
+            new_C = max(new_load_crit, new_load_i, other_max)
+            if new_C + 1e-12 < best_C:
+                best_C = new_C
+                best_i = i
+        if best_i != crit:
+            old_i = a[j]
+            a[j] = best_i
+            loads[old_i] -= p[old_i, j]
+            loads[best_i] += p[best_i, j]
+            improved = True
+    return improved
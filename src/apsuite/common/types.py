@@ -1,16 +1,89 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List
+from functools import cached_property
+from typing import List, Optional, Sequence
 
-@dataclass(frozen=True)
+import numpy as np
+
+@dataclass(frozen=True, eq=False, init=False)
 class PackingResult:
-    # bins[b] is the list of item sizes in bin b (in insertion order)
-    bins: List[List[float]]
+    # items[i] is the size of input item i and assignment[i] its bin index.
+    # order lists item indices in the sequence they were placed (None = input
+    # order); it only affects the order of sizes inside the `bins` view.
+    items: np.ndarray        # float64, shape (n,)
+    assignment: np.ndarray   # int32, shape (n,)
+    bin_loads: np.ndarray    # float64, shape (num_bins,)
+    order: Optional[np.ndarray] = None
+
+    def __init__(
+        self,
+        items: Optional[np.ndarray] = None,
+        assignment: Optional[np.ndarray] = None,
+        bin_loads: Optional[np.ndarray] = None,
+        order: Optional[np.ndarray] = None,
+        *,
+        bins: Optional[Sequence[Sequence[float]]] = None,
+    ):
+        # PackingResult(bins=...) is the list-of-bins form of earlier versions
+        if bins is not None:
+            if items is not None or assignment is not None or bin_loads is not None:
+                raise TypeError(
+                    "PackingResult takes either bins or items/assignment/bin_loads"
+                )
+            compact = PackingResult.from_bins(bins)
+            items, assignment = compact.items, compact.assignment
+            bin_loads = compact.bin_loads
+        elif items is None or assignment is None or bin_loads is None:
+            raise TypeError(
+                "PackingResult needs items, assignment and bin_loads (or bins=)"
+            )
+        object.__setattr__(self, "items", items)
+        object.__setattr__(self, "assignment", assignment)
+        object.__setattr__(self, "bin_loads", bin_loads)
+        object.__setattr__(self, "order", order)
+
+    @classmethod
+    def from_bins(cls, bins: Sequence[Sequence[float]]) -> "PackingResult":
+        """Build a compact result from the list-of-bins representation."""
+        items = [float(x) for b in bins for x in b]
+        assignment = [i for i, b in enumerate(bins) for _ in b]
+        return cls(
+            items=np.asarray(items, dtype=np.float64),
+            assignment=np.asarray(assignment, dtype=np.int32),
+            bin_loads=np.asarray(
+                [sum(float(x) for x in b) for b in bins], dtype=np.float64
+            ),
+        )
 
     @property
     def num_bins(self) -> int:
-        return len(self.bins)
+        return int(self.bin_loads.shape[0])
+
+    @property
+    def loads(self) -> List[float]:
+        return self.bin_loads.tolist()
+
+    @cached_property
+    def bins(self) -> List[List[float]]:
+        # bins[b] is the list of item sizes in bin b (in insertion order);
+        # materialized lazily for callers that still need the nested view
+        bins: List[List[float]] = [[] for _ in range(self.num_bins)]
+        items = self.items.tolist()
+        assignment = self.assignment.tolist()
+        order = range(len(items)) if self.order is None else self.order.tolist()
+        for i in order:
+            bins[assignment[i]].append(items[i])
+        return bins
+
+
+@dataclass(frozen=True, eq=False)
+class BinCountResult:
+    # Count-only outcome of a packing heuristic: no item->bin mapping or
+    # placements are kept. bin_loads is the total item size per bin (1D)
+    # or the used area per bin (2D).
+    num_bins: int
+    bin_loads: np.ndarray    # float64, shape (num_bins,)
 
     @property
     def loads(self) -> List[float]:
-        return [sum(b) for b in self.bins]
\ No newline at end of file
+        return self.bin_loads.tolist()
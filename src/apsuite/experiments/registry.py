@@ -1,20 +1,32 @@
 from __future__ import annotations
 
+from functools import partial, wraps
 from typing import Callable
 import time
+
+import numpy as np
+
+from apsuite.common.backend import using_backend
 # -------------------------
 # Packing 1D
 # -------------------------
 from apsuite.packing1d.instances import InstanceSpec, generate_instance
-from apsuite.packing1d.lower_bounds import volume_lower_bound
+from apsuite.packing1d.lower_bounds import combined_lower_bound
+from apsuite.packing1d.lp_bound import lp_lower_bound_info
+from apsuite.packing1d.validate import validate_items_array
 from apsuite.packing1d import algorithms as p1d_algs
+from apsuite.packing1d.lns import ffd_lns
 
 # -------------------------
 # Packing 2D
 # -------------------------
 from apsuite.packing2d.instances import Instance2DSpec, generate_rectangles
-from apsuite.packing2d.lower_bounds import area_lower_bound
-from apsuite.packing2d.algorithms import shelf, guillotine, hybrid_shelf_guillotine
+from apsuite.packing2d.lower_bounds import combined_lower_bound_2d
+from apsuite.packing2d.validate import verify_packing
+from apsuite.packing2d.algorithms import (
+    shelf, ffdh, bfdh, guillotine, guillotine_multibin, hybrid_shelf_guillotine,
+    maxrects, skyline,
+)
 
 # -------------------------
 # Scheduling: identical
@@ -38,10 +50,22 @@ def _get_params(cfg: dict) -> dict:
     return cfg.get("params", {}) or {}
 
 
+def _config_backend(run: Callable[[dict], list[dict]]) -> Callable[[dict], list[dict]]:
+    # params.backend: 'python' | 'numba' (falls back to python if unavailable),
+    # active for this run only so it cannot leak into later configs
+    @wraps(run)
+    def wrapped(cfg: dict) -> list[dict]:
+        name = _get_params(cfg).get("backend")
+        with using_backend(None if name is None else str(name)):
+            return run(cfg)
+    return wrapped
+
+
 # ============================================================
 # Packing 1D
 # ============================================================
 
+@_config_backend
 def run_packing1d(cfg: dict) -> list[dict]:
     rows: list[dict] = []
     grid = cfg["grid"]
@@ -50,13 +74,27 @@ def run_packing1d(cfg: dict) -> list[dict]:
 
     params = _get_params(cfg)
     capacity = float(params.get("capacity", 1.0))
+    engine = str(params.get("engine", "indexed"))  # 'indexed' | 'linear'
+    use_lp = bool(params.get("lp_bound", False))
+    lp_time_limit_s = float(params.get("lp_time_limit_s", 2.0))
+    # rows only record bin counts, so contents are not materialized by default
+    count_only = bool(params.get("count_only", True))
 
     ALG_MAP: dict[str, Callable] = {
-        "FF": p1d_algs.first_fit,
-        "BF": p1d_algs.best_fit,
-        "FFD": p1d_algs.first_fit_decreasing,
-        "BFD": p1d_algs.best_fit_decreasing,
+        "FF": partial(p1d_algs.first_fit, engine=engine, count_only=count_only),
+        "BF": partial(p1d_algs.best_fit, engine=engine, count_only=count_only),
+        "FFD": partial(
+            p1d_algs.first_fit_decreasing, engine=engine, count_only=count_only
+        ),
+        "BFD": partial(
+            p1d_algs.best_fit_decreasing, engine=engine, count_only=count_only
+        ),
     }
+    if params.get("lns_time_limit_s") is not None:
+        # anytime improver: fixed wall-clock budget per instance
+        ALG_MAP["FFD+LNS"] = partial(
+            ffd_lns, engine=engine, time_limit_s=float(params["lns_time_limit_s"])
+        )
 
     for dist in grid["dist"]:
         for n in grid["n"]:
@@ -70,8 +108,16 @@ def run_packing1d(cfg: dict) -> list[dict]:
                     dist=dist,
                     seed=seed,
                 )
-                items = generate_instance(spec)
-                lb = volume_lower_bound(items, capacity=capacity)
+                # validated once; algorithms and bounds skip revalidation
+                items = validate_items_array(generate_instance(spec), capacity)
+                lb = combined_lower_bound(items, capacity=capacity)
+                # ceil of the Gilmore-Gomory LP value (a valid integer bound)
+                lp_T = (
+                    lp_lower_bound_info(
+                        items, capacity=capacity, time_limit_s=lp_time_limit_s
+                    ).bound
+                    if use_lp else None
+                )
 
                 for alg_name, alg in ALG_MAP.items():
                     t0 = time.perf_counter()
@@ -87,10 +133,10 @@ def run_packing1d(cfg: dict) -> list[dict]:
                         "alg": alg_name,
                         "objective": result.num_bins,
                         "lb_trivial": lb,
-                        "lp_T": None,
+                        "lp_T": lp_T,
                         "ratio_vs_trivial_lb": result.num_bins / lb if lb > 0 else None,
-                        "ratio_vs_lp": None,
-                        "gap_vs_lp": None,
+                        "ratio_vs_lp": result.num_bins / lp_T if lp_T else None,
+                        "gap_vs_lp": (result.num_bins - lp_T) / lp_T if lp_T else None,
                         "runtime_s": dt,
                     })
 
@@ -101,6 +147,7 @@ def run_packing1d(cfg: dict) -> list[dict]:
 # Packing 2D
 # ============================================================
 
+@_config_backend
 def run_packing2d(cfg: dict) -> list[dict]:
     rows: list[dict] = []
     grid = cfg["grid"]
@@ -110,11 +157,38 @@ def run_packing2d(cfg: dict) -> list[dict]:
     params = _get_params(cfg)
     W = float(params.get("W", 1.0))
     H = float(params.get("H", 1.0))
+    # params.verify: True or a fraction of results to check for feasibility
+    # (seeded sample); checked results need placements, so count_only is off
+    verify = params.get("verify", False)
+    verify_rate = 1.0 if verify is True else float(verify or 0.0)
+    if verify_rate > 0 and params.get("count_only"):
+        raise ValueError("params.verify needs count_only=False")
+    count_only = bool(params.get("count_only", verify_rate <= 0))
+    verify_rng = np.random.default_rng(base_seed)
+    # guillotine free rects: 'indexed' | 'linear'
+    engine = str(params.get("engine", "indexed"))
+    maxrects_rule = str(params.get("maxrects_rule", "best_short_side"))
+    # rotation is supported by the shelf and guillotine packers (and the
+    # bound); the other packers run unrotated and their rows say so
+    rot = bool(params.get("allow_rotation", False))
+    rotating = {"SHELF", "FFDH", "BFDH", "GUILLOTINE", "HYB(SHELF,GUIL)"}
 
     ALG_MAP: dict[str, Callable] = {
-        "SHELF": shelf,
-        "GUILLOTINE": guillotine,
-        "HYB(SHELF,GUIL)": hybrid_shelf_guillotine,
+        "SHELF": partial(shelf, count_only=count_only, allow_rotation=rot),
+        "FFDH": partial(ffdh, count_only=count_only, allow_rotation=rot),
+        "BFDH": partial(bfdh, count_only=count_only, allow_rotation=rot),
+        "GUILLOTINE": partial(
+            guillotine, count_only=count_only, engine=engine, allow_rotation=rot
+        ),
+        "GUILLOTINE-MB": partial(guillotine_multibin, count_only=count_only),
+        "HYB(SHELF,GUIL)": partial(
+            hybrid_shelf_guillotine,
+            count_only=count_only,
+            engine=engine,
+            allow_rotation=rot,
+        ),
+        "MAXRECTS": partial(maxrects, count_only=count_only, rule=maxrects_rule),
+        "SKYLINE": partial(skyline, count_only=count_only),
     }
 
     for dist in grid["dist"]:
@@ -133,12 +207,19 @@ def run_packing2d(cfg: dict) -> list[dict]:
                 )
 
                 rects = generate_rectangles(spec)
-                lb = area_lower_bound(rects, W=W, H=H)
+                lb = combined_lower_bound_2d(rects, W=W, H=H, allow_rotation=rot)
 
                 for alg_name, alg in ALG_MAP.items():
                     t0 = time.perf_counter()
                     result = alg(rects, W=W, H=H)
                     dt = time.perf_counter() - t0
+                    if verify_rate > 0 and verify_rng.random() < verify_rate:
+                        try:
+                            verify_packing(result, rects, W, H, allow_rotation=rot)
+                        except ValueError as e:
+                            raise ValueError(
+                                f"{alg_name} on {dist} n={n} seed={seed}: {e}"
+                            ) from e
                     rows.append({
                         "task": "packing2d",
                         "dist": dist,
@@ -146,6 +227,7 @@ def run_packing2d(cfg: dict) -> list[dict]:
                         "rep": rep,
                         "seed": seed,
                         "alg": alg_name,
+                        "rotation": rot and alg_name in rotating,
                         "objective": result.num_bins,
                         "lb_trivial": lb,
                         "lp_T": None,
@@ -162,6 +244,7 @@ def run_packing2d(cfg: dict) -> list[dict]:
 # Scheduling: Identical Machines
 # ============================================================
 
+@_config_backend
 def run_sched_identical(cfg: dict) -> list[dict]:
     rows: list[dict] = []
     grid = cfg["grid"]
@@ -217,6 +300,7 @@ def run_sched_identical(cfg: dict) -> list[dict]:
 # Scheduling: Unrelated Machines
 # ============================================================
 
+@_config_backend
 def run_sched_unrelated(cfg: dict) -> list[dict]:
     rows: list[dict] = []
     grid = cfg["grid"]
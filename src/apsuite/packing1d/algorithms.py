@@ -1,51 +1,146 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from typing import List, Optional, Tuple
 
-from apsuite.common.types import PackingResult
-from apsuite.packing1d.validate import validate_items
+import numpy as np
+
+from apsuite.common import kernels
+from apsuite.common.backend import use_kernels
+from apsuite.common.types import BinCountResult, PackingResult
+from apsuite.packing1d.validate import validate_items_array
 from apsuite.packing1d.local_search import local_improve_eliminate_bins
+from apsuite.packing1d.capacity_index import BestFitIndex, FirstFitTree
+from apsuite.packing1d.lower_bounds import combined_lower_bound
 
-def first_fit(items: List[float], capacity: float = 1.0) -> PackingResult:
-    """First-Fit bin packing.
-    Place each item into the first bin where it fits; open a new bin otherwise.
+ENGINES = ("indexed", "linear")
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+
+
+def _result(
+    sizes: np.ndarray,
+    assign: List[int],
+    loads: List[float],
+    order: Optional[np.ndarray] = None,
+) -> PackingResult:
     """
-    items = validate_items(items, capacity)
+    Pack per-item assignments into a compact result.
+    sizes is in input order; assign follows the placement order (= order).
+    """
+    assignment = np.asarray(assign, dtype=np.int32)
+    if order is not None:
+        # scatter back so that index i refers to input item i
+        assignment_in = np.empty_like(assignment)
+        assignment_in[order] = assignment
+        assignment = assignment_in
+    return PackingResult(
+        items=np.asarray(sizes, dtype=np.float64),
+        assignment=assignment,
+        bin_loads=np.asarray(loads, dtype=np.float64),
+        order=order,
+    )
+
+
+def _count_result(loads: List[float]) -> BinCountResult:
+    loads_arr = np.asarray(loads, dtype=np.float64)
+    return BinCountResult(num_bins=int(loads_arr.shape[0]), bin_loads=loads_arr)
+
+
+def _decreasing_order(sizes: np.ndarray) -> Tuple[np.ndarray, List[float]]:
+    order = np.argsort(-sizes, kind="stable")
+    return order, sizes[order].tolist()
+
+
+def _first_fit_assign(
+    items: List[float],
+    capacity: float,
+    engine: str,
+    track: bool = True,
+) -> Tuple[List[int], List[float]]:
+    # track=False skips the per-item assignment list (count-only mode); the
+    # compiled kernel is used for either engine under the 'numba' backend
+    if use_kernels():
+        assign_arr, loads_arr, _ = kernels.first_fit_kernel(
+            np.asarray(items, dtype=np.float64), float(capacity), track
+        )
+        return assign_arr, loads_arr
+
+    assign: List[int] = []
+    loads: List[float] = []
+
+    if engine == "indexed":
+        tree = FirstFitTree(capacity, size_hint=len(items))
+        for x in items:
+            b = tree.insert(x)
+            if b == len(loads):
+                loads.append(x)
+            else:
+                loads[b] += x
+            if track:
+                assign.append(b)
+        return assign, loads
 
-    bins: List[List[float]] = []
     remaining: List[float] = []  # remaining capacity per bin
 
     for x in items:
         placed = False
-        for b in range(len(bins)):
+        for b in range(len(loads)):
             if remaining[b] >= x:
-                bins[b].append(x)
+                if track:
+                    assign.append(b)
+                loads[b] += x
                 remaining[b] -= x
                 placed = True
                 break
         if not placed:
-            bins.append([x])
+            if track:
+                assign.append(len(loads))
+            loads.append(x)
             remaining.append(capacity - x)
 
-    return PackingResult(bins=bins)
+    return assign, loads
 
 
-def best_fit(items: List[float], capacity: float = 1.0) -> PackingResult:
-    """Best-Fit bin packing.
-    Place each item into the bin that will have the least remaining capacity after placement.
-    Open a new bin if no bin can fit the item.
-    """
-    items = validate_items(items, capacity)
+def _best_fit_assign(
+    items: List[float],
+    capacity: float,
+    engine: str,
+    track: bool = True,
+) -> Tuple[List[int], List[float]]:
+    # track=False skips the per-item assignment list (count-only mode); the
+    # compiled kernel is used for either engine under the 'numba' backend
+    if use_kernels():
+        assign_arr, loads_arr, _ = kernels.best_fit_kernel(
+            np.asarray(items, dtype=np.float64), float(capacity), track
+        )
+        return assign_arr, loads_arr
+
+    assign: List[int] = []
+    loads: List[float] = []
+
+    if engine == "indexed":
+        index = BestFitIndex(capacity)
+        for x in items:
+            b = index.insert(x)
+            if b == len(loads):
+                loads.append(x)
+            else:
+                loads[b] += x
+            if track:
+                assign.append(b)
+        return assign, loads
 
-    bins: List[List[float]] = []
     remaining: List[float] = []
 
     for x in items:
         best_bin = None
         best_rem_after = None  # smaller is better
 
-        for b in range(len(bins)):
+        for b in range(len(loads)):
             if remaining[b] >= x:
                 rem_after = remaining[b] - x
                 if best_rem_after is None or rem_after < best_rem_after:
@@ -53,29 +148,119 @@ def best_fit(items: List[float], capacity: float = 1.0) -> PackingResult:
                     best_bin = b
 
         if best_bin is None:
-            bins.append([x])
+            if track:
+                assign.append(len(loads))
+            loads.append(x)
             remaining.append(capacity - x)
         else:
-            bins[best_bin].append(x)
+            if track:
+                assign.append(best_bin)
+            loads[best_bin] += x
             remaining[best_bin] -= x
 
-    return PackingResult(bins=bins)    
+    return assign, loads
+
+
+def first_fit(
+    items: List[float],
+    capacity: float = 1.0,
+    engine: str = "indexed",
+    count_only: bool = False,
+) -> PackingResult | BinCountResult:
+    """First-Fit bin packing.
+    Place each item into the first bin where it fits; open a new bin otherwise.
+    engine:
+      - 'indexed': tournament tree over remaining capacities, O(n log n)
+      - 'linear' : scan all open bins per item, O(n * bins)
+    Both engines produce identical packings. With the 'numba' backend
+    (apsuite.common.backend) a compiled kernel is used for either engine.
+    count_only=True returns a BinCountResult (bin count and loads only).
+    """
+    _check_engine(engine)
+    sizes = validate_items_array(items, capacity)
+    assign, loads = _first_fit_assign(
+        sizes.tolist(), capacity, engine, track=not count_only
+    )
+    if count_only:
+        return _count_result(loads)
+    return _result(sizes, assign, loads)
+
+
+def best_fit(
+    items: List[float],
+    capacity: float = 1.0,
+    engine: str = "indexed",
+    count_only: bool = False,
+) -> PackingResult | BinCountResult:
+    """Best-Fit bin packing.
+    Place each item into the bin that will have the least remaining capacity after placement.
+    Open a new bin if no bin can fit the item.
+    engine:
+      - 'indexed': blocked sorted list of (remaining, bin) keys, O(log bins) lookups
+      - 'linear' : scan all open bins per item, O(n * bins)
+    Both engines produce identical packings (same tie-breaking). With the
+    'numba' backend a compiled kernel is used for either engine.
+    count_only=True returns a BinCountResult (bin count and loads only).
+    """
+    _check_engine(engine)
+    sizes = validate_items_array(items, capacity)
+    assign, loads = _best_fit_assign(
+        sizes.tolist(), capacity, engine, track=not count_only
+    )
+    if count_only:
+        return _count_result(loads)
+    return _result(sizes, assign, loads)
 
 
-def first_fit_decreasing(items: List[float], capacity: float = 1.0) -> PackingResult:
-    items = validate_items(items, capacity)
-    items_sorted = sorted(items, reverse=True)
-    return first_fit(items_sorted, capacity=capacity)
+def first_fit_decreasing(
+    items: List[float],
+    capacity: float = 1.0,
+    engine: str = "indexed",
+    count_only: bool = False,
+) -> PackingResult | BinCountResult:
+    _check_engine(engine)
+    sizes = validate_items_array(items, capacity)
+    if count_only:
+        # sorted values are all that is needed; no permutation to keep
+        _, loads = _first_fit_assign(
+            np.sort(sizes)[::-1].tolist(), capacity, engine, track=False
+        )
+        return _count_result(loads)
+    order, items_sorted = _decreasing_order(sizes)
+    assign, loads = _first_fit_assign(items_sorted, capacity, engine)
+    return _result(sizes, assign, loads, order=order)
 
-def best_fit_decreasing(items: List[float], capacity: float = 1.0) -> PackingResult:
-    items = validate_items(items, capacity)
-    items_sorted = sorted(items, reverse=True)
-    return best_fit(items_sorted, capacity=capacity)
+def best_fit_decreasing(
+    items: List[float],
+    capacity: float = 1.0,
+    engine: str = "indexed",
+    count_only: bool = False,
+) -> PackingResult | BinCountResult:
+    _check_engine(engine)
+    sizes = validate_items_array(items, capacity)
+    if count_only:
+        _, loads = _best_fit_assign(
+            np.sort(sizes)[::-1].tolist(), capacity, engine, track=False
+        )
+        return _count_result(loads)
+    order, items_sorted = _decreasing_order(sizes)
+    assign, loads = _best_fit_assign(items_sorted, capacity, engine)
+    return _result(sizes, assign, loads, order=order)
 
-def ffd_local_improve(items: List[float], capacity: float = 1.0) -> PackingResult:
+def ffd_local_improve(
+    items: List[float],
+    capacity: float = 1.0,
+    engine: str = "indexed",
+    time_limit_s: Optional[float] = None,
+) -> PackingResult:
     """FFD followed by bin-elimination local improvement."""
-    base = first_fit_decreasing(items, capacity=capacity)
-    return local_improve_eliminate_bins(base, capacity=capacity)
+    items = validate_items_array(items, capacity)
+    base = first_fit_decreasing(items, capacity=capacity, engine=engine)
+    if base.num_bins <= combined_lower_bound(items, capacity):
+        return base  # FFD is provably optimal; nothing to improve
+    return local_improve_eliminate_bins(
+        base, capacity=capacity, time_limit_s=time_limit_s
+    )
 
 def best_of_two(a: PackingResult, b: PackingResult) -> PackingResult:
     # Deterministic tie-breaker: fewer bins, then smaller max load (optional),
@@ -85,11 +270,16 @@ def best_of_two(a: PackingResult, b: PackingResult) -> PackingResult:
     return a
 
 
-def hybrid_ffd_bf(items: List[float], capacity: float = 1.0) -> PackingResult:
+def hybrid_ffd_bf(
+    items: List[float],
+    capacity: float = 1.0,
+    engine: str = "indexed",
+) -> PackingResult:
     """
     Run two heuristics and return the better packing (fewer bins).
     Motivation: instance-class dependent performance (uniform vs triplets).
     """
-    r_ffd = first_fit_decreasing(items, capacity=capacity)
-    r_bf = best_fit(items, capacity=capacity)
+    items = validate_items_array(items, capacity)
+    r_ffd = first_fit_decreasing(items, capacity=capacity, engine=engine)
+    r_bf = best_fit(items, capacity=capacity, engine=engine)
     return best_of_two(r_ffd, r_bf)
\ No newline at end of file
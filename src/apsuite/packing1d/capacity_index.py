@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from typing import List, Optional, Tuple
+
+
+class FirstFitTree:
+    """
+    Tournament (max) tree over per-bin remaining capacities.
+
+    Leaf b holds the remaining capacity of bin b. Leaves of bins that have not
+    been opened yet hold the full capacity, so the leftmost leaf with
+    remaining >= x is either the first open bin that fits x or the next bin
+    to open. Both lookup and update are a single O(log n) walk.
+    """
+
+    def __init__(self, capacity: float, size_hint: int = 1):
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self.capacity = float(capacity)
+        self.num_bins = 0  # bins opened so far (a prefix of the leaves)
+        size = 1
+        while size < max(1, size_hint):
+            size *= 2
+        self._size = size
+        self._tree: List[float] = [self.capacity] * (2 * size)
+
+    def _grow(self) -> None:
+        old_size = self._size
+        old_leaves = self._tree[old_size:]
+        self._size = 2 * old_size
+        self._tree = [self.capacity] * (2 * self._size)
+        self._tree[self._size:self._size + old_size] = old_leaves
+        for node in range(self._size - 1, 0, -1):
+            left = self._tree[2 * node]
+            right = self._tree[2 * node + 1]
+            self._tree[node] = left if left >= right else right
+
+    def remaining(self, b: int) -> float:
+        return self._tree[self._size + b]
+
+    def find(self, x: float) -> int:
+        """Index of the leftmost bin with remaining >= x (may be a new bin)."""
+        if self.num_bins >= self._size:
+            self._grow()
+        tree = self._tree
+        node = 1
+        size = self._size
+        while node < size:
+            node *= 2
+            if tree[node] < x:
+                node += 1
+        return node - size
+
+    def update(self, b: int, remaining: float) -> None:
+        """Set the remaining capacity of bin b and refresh its ancestors."""
+        while b >= self._size:
+            self._grow()
+        tree = self._tree
+        node = self._size + b
+        tree[node] = remaining
+        node //= 2
+        while node:
+            left = tree[2 * node]
+            right = tree[2 * node + 1]
+            best = left if left >= right else right
+            if tree[node] == best:
+                break
+            tree[node] = best
+            node //= 2
+        if b >= self.num_bins:
+            self.num_bins = b + 1
+
+    def insert(self, x: float) -> int:
+        """First-Fit placement of an item of size x; returns its bin index."""
+        b = self.find(x)
+        if b >= self.num_bins:
+            # fresh bin: mirror the reference implementation (capacity - x)
+            self.update(b, self.capacity - x)
+        else:
+            self.update(b, self.remaining(b) - x)
+        return b
+
+
+class SortedKeys:
+    """
+    Sorted list of keys split into blocks of at most 2 * LOAD keys, with the
+    last key of every block in `_maxes`. A lookup is two bisects; an insert
+    or delete shifts one block (O(LOAD)) and, on a split or an emptied
+    block, the block list (O(n / LOAD)), instead of the whole list.
+    """
+
+    LOAD = 512
+
+    def __init__(self):
+        self._blocks: List[List[Tuple[float, int]]] = []
+        self._maxes: List[Tuple[float, int]] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, key: Tuple[float, int]) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        self._len += 1
+        if not blocks:
+            blocks.append([key])
+            maxes.append(key)
+            return
+        i = min(bisect_left(maxes, key), len(maxes) - 1)
+        blk = blocks[i]
+        insort(blk, key)
+        maxes[i] = blk[-1]
+        if len(blk) > 2 * self.LOAD:
+            blocks[i:i + 1] = [blk[:self.LOAD], blk[self.LOAD:]]
+            maxes[i:i + 1] = [blk[self.LOAD - 1], blk[-1]]
+
+    def remove(self, key: Tuple[float, int]) -> None:
+        """Remove a key that is present."""
+        i = bisect_left(self._maxes, key)
+        blk = self._blocks[i]
+        del blk[bisect_left(blk, key)]
+        self._len -= 1
+        if blk:
+            self._maxes[i] = blk[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+
+    def first_ge(self, key: Tuple[float, float]) -> Optional[Tuple[float, int]]:
+        """Smallest key >= key, or None."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        blk = self._blocks[i]
+        return blk[bisect_left(blk, key)]
+
+    def head(self, k: int) -> List[Tuple[float, int]]:
+        """The k smallest keys (fewer if the list is shorter)."""
+        out: List[Tuple[float, int]] = []
+        for blk in self._blocks:
+            if len(out) >= k:
+                break
+            out.extend(blk[:k - len(out)])
+        return out
+
+
+class BestFitIndex:
+    """
+    Ordered multiset of (remaining, bin) keys in a blocked sorted list.
+
+    The tightest bin for an item of size x is the first key with
+    remaining >= x; keys with equal remaining are ordered by bin, so that
+    key is also the lowest-index bin among them. Ties are broken exactly
+    like the linear Best-Fit scan: smallest remaining-after-placement, then
+    lowest bin index. Bins whose remaining differs but rounds to the same
+    remaining-after are checked by jumping from one distinct remaining to
+    the next (a few float steps at most), never by walking equal keys.
+    Each lookup or update costs O(log n) comparisons plus the block shifts
+    of SortedKeys.
+    """
+
+    def __init__(self, capacity: float):
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self.capacity = float(capacity)
+        self._keys = SortedKeys()
+        self._remaining: List[float] = []
+        self._active: List[bool] = []  # False while a bin is left out of lookups
+
+    @property
+    def num_bins(self) -> int:
+        return len(self._remaining)
+
+    def remaining(self, b: int) -> float:
+        return self._remaining[b]
+
+    def find(self, x: float) -> Optional[int]:
+        """Tightest open bin with remaining >= x, or None if no bin fits."""
+        key = self._keys.first_ge((x, -1))
+        if key is None:
+            return None
+        rem, best = key
+        best_after = rem - x
+        while True:
+            # lowest bin of the next distinct remaining
+            key = self._keys.first_ge((rem, math.inf))
+            if key is None or key[0] - x != best_after:
+                return best
+            rem = key[0]
+            if key[1] < best:
+                best = key[1]
+
+    def open(self, remaining: float) -> int:
+        """Open a new bin with the given remaining capacity; returns its index."""
+        b = len(self._remaining)
+        self._remaining.append(remaining)
+        self._active.append(True)
+        self._keys.add((remaining, b))
+        return b
+
+    def update(self, b: int, remaining: float) -> None:
+        if not self._active[b]:
+            self._remaining[b] = remaining
+            return
+        self._keys.remove((self._remaining[b], b))
+        self._remaining[b] = remaining
+        self._keys.add((remaining, b))
+
+    def discard(self, b: int) -> None:
+        """Leave bin b out of find() until restore(b); its remaining is kept."""
+        if self._active[b]:
+            self._keys.remove((self._remaining[b], b))
+            self._active[b] = False
+
+    def restore(self, b: int) -> None:
+        if not self._active[b]:
+            self._keys.add((self._remaining[b], b))
+            self._active[b] = True
+
+    def insert(self, x: float) -> int:
+        """Best-Fit placement of an item of size x; returns its bin index."""
+        b = self.find(x)
+        if b is None:
+            return self.open(self.capacity - x)
+        self.update(b, self._remaining[b] - x)
+        return b
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from apsuite.common.types import PackingResult
+from apsuite.packing1d.algorithms import (
+    best_fit_decreasing,
+    best_of_two,
+    first_fit_decreasing,
+)
+from apsuite.packing1d.lower_bounds import combined_lower_bound
+from apsuite.packing1d.validate import validate_items_array
+
+# Relative slack of the waste-budget pruning. Fit tests are exact: a bin's
+# load is summed item by item in decreasing size order and never exceeds C.
+_TOL = 1e-9
+
+
+@dataclass(frozen=True)
+class ExactResult:
+    result: PackingResult  # best packing found
+    lower_bound: int       # best proven lower bound
+    optimal: bool          # True if result.num_bins == lower_bound
+    nodes: int
+    runtime_s: float
+
+    @property
+    def num_bins(self) -> int:
+        return self.result.num_bins
+
+
+def solve_exact(
+    items,
+    capacity: float = 1.0,
+    time_limit_s: float = 10.0,
+    max_nodes: Optional[int] = None,
+) -> ExactResult:
+    """
+    Exact 1D bin packing by bin completion (Korf-style branch-and-bound).
+
+    Bins are filled one at a time: the largest remaining item opens the bin
+    and every maximal set of remaining items that fits next to it (a
+    "completion") is a branch. Copies of equal sizes are treated as one
+    multiset so symmetric completions are generated once. For a target of
+    `t` bins the total waste is limited to t*C - sum(sizes); completions
+    that exceed it are pruned while they are being enumerated.
+
+    The target number of bins starts at combined_lower_bound and is raised
+    by one each time the search proves it infeasible, so the first packing
+    found is optimal. The better of FFD/BFD is the fallback upper bound.
+    When the wall-clock budget or node limit runs out, the heuristic packing
+    is returned with optimal=False and the best bound proven so far.
+    """
+    t0 = time.perf_counter()
+    deadline = t0 + time_limit_s
+    sizes = validate_items_array(items, capacity)
+    n = sizes.size
+
+    incumbent = best_of_two(
+        first_fit_decreasing(sizes, capacity=capacity),
+        best_fit_decreasing(sizes, capacity=capacity),
+    )
+    lb = combined_lower_bound(sizes, capacity)
+    if n == 0 or incumbent.num_bins <= lb:
+        return ExactResult(
+            result=incumbent,
+            lower_bound=incumbent.num_bins,
+            optimal=True,
+            nodes=0,
+            runtime_s=time.perf_counter() - t0,
+        )
+
+    tol = _TOL * capacity
+    vals_arr, inverse, cnt_arr = np.unique(
+        sizes, return_inverse=True, return_counts=True
+    )
+    # distinct sizes in decreasing order, with multiplicities
+    vals = vals_arr[::-1].tolist()
+    cnt = cnt_arr[::-1].tolist()
+    m = len(vals)
+    total = float(sizes.sum())
+
+    nodes = 0
+    timed_out = False
+
+    def out_of_budget() -> bool:
+        nonlocal timed_out
+        if not timed_out:
+            timed_out = (
+                (max_nodes is not None and nodes > max_nodes)
+                or ((nodes & 255) == 0 and time.perf_counter() > deadline)
+            )
+        return timed_out
+
+    def search(target: int) -> Optional[List[List[int]]]:
+        """Look for a packing into `target` bins; per bin: distinct-size indices."""
+        nonlocal nodes
+        waste_budget = target * capacity - total + tol
+
+        def completions(j0: int, load: float, waste_used: float):
+            """Yield maximal completions [(j, copies), ...] of a bin at `load`."""
+            suffix = [0.0] * (m + 1)
+            for j in range(m - 1, j0 - 1, -1):
+                suffix[j] = suffix[j + 1] + cnt[j] * vals[j]
+            chosen: List[tuple] = []
+            slack = waste_budget - waste_used
+
+            def rec(j: int, load: float, min_unchosen: float):
+                nonlocal nodes
+                nodes += 1
+                left = capacity - load
+                if out_of_budget() or left - suffix[j] > slack:
+                    return  # even taking every remaining item wastes too much
+                if j == m:
+                    if load + min_unchosen > capacity:  # maximal: nothing else fits
+                        yield list(chosen), left
+                    return
+                v = vals[j]
+                avail = cnt[j]
+                # loads after 0, 1, 2, ... copies, added one at a time
+                fills = [load]
+                while len(fills) <= avail and fills[-1] + v <= capacity:
+                    fills.append(fills[-1] + v)
+                for c in range(len(fills) - 1, -1, -1):
+                    if c:
+                        chosen.append((j, c))
+                    yield from rec(j + 1, fills[c], v if c < avail else min_unchosen)
+                    if c:
+                        chosen.pop()
+
+            yield from rec(j0, load, math.inf)
+
+        # frame: [completion generator, opening size index, applied completion, waste]
+        stack: List[list] = []
+        used_waste = 0.0
+        left_items = n
+
+        def open_bin() -> None:
+            j0 = next(j for j in range(m) if cnt[j] > 0)
+            cnt[j0] -= 1
+            stack.append([completions(j0, vals[j0], used_waste), j0, None, 0.0])
+
+        open_bin()
+        while stack:
+            frame = stack[-1]
+            if frame[2] is not None:
+                for j, c in frame[2]:
+                    cnt[j] += c
+                left_items += 1 + sum(c for _, c in frame[2])
+                used_waste -= frame[3]
+                frame[2] = None
+            nxt = next(frame[0], None)
+            if nxt is None:
+                stack.pop()
+                cnt[frame[1]] += 1
+                continue
+
+            comp, waste = nxt
+            for j, c in comp:
+                cnt[j] -= c
+            left_items -= 1 + sum(c for _, c in comp)
+            used_waste += waste
+            frame[2] = comp
+            frame[3] = waste
+
+            if left_items == 0:
+                return [[f[1]] + [j for j, c in f[2] for _ in range(c)] for f in stack]
+            if len(stack) < target:
+                open_bin()
+        return None
+
+    # iterative deepening on the number of bins, from the lower bound upwards:
+    # every target that is searched exhaustively without success raises lb
+    best_bins: Optional[List[List[int]]] = None
+    while lb < incumbent.num_bins:
+        found = search(lb)
+        if found is not None:
+            best_bins = found
+            break
+        if timed_out:
+            break
+        lb += 1
+        cnt = cnt_arr[::-1].tolist()
+
+    if best_bins is not None:
+        # hand out original item indices per distinct size
+        pools: List[List[int]] = [[] for _ in range(m)]
+        for i, k in enumerate(inverse.tolist()):
+            pools[m - 1 - k].append(i)
+        assignment = np.empty(n, dtype=np.int32)
+        order: List[int] = []
+        for b, members in enumerate(best_bins):
+            for j in members:
+                i = pools[j].pop()
+                assignment[i] = b
+                order.append(i)
+        # summed in member order, as in the fit test
+        loads = np.asarray([sum(vals[j] for j in members) for members in best_bins])
+        incumbent = PackingResult(
+            items=np.asarray(sizes, dtype=np.float64),
+            assignment=assignment,
+            bin_loads=loads,
+            order=np.asarray(order, dtype=np.int64),
+        )
+    return ExactResult(
+        result=incumbent,
+        lower_bound=lb,
+        optimal=incumbent.num_bins <= lb,
+        nodes=nodes,
+        runtime_s=time.perf_counter() - t0,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List
 import numpy as np
 
 @dataclass(frozen=True)
@@ -10,25 +10,45 @@ class InstanceSpec:
     dist: str
     seed: int
 
-def generate_instance(spec: InstanceSpec) -> List[float]:
-    rng = np.random.default_rng(spec.seed)
-
-    if spec.dist == "uniform":
-        x = rng.random(spec.n)
-    elif spec.dist == "bimodal":
+def _sample_sizes(rng: np.random.Generator, dist: str, n: int) -> np.ndarray:
+    if dist == "uniform":
+        x = rng.random(n)
+    elif dist == "bimodal":
         # half small, half large
-        small = rng.uniform(0.05, 0.3, spec.n // 2)
-        large = rng.uniform(0.6, 0.95, spec.n - spec.n // 2)
+        small = rng.uniform(0.05, 0.3, n // 2)
+        large = rng.uniform(0.6, 0.95, n - n // 2)
         x = np.concatenate([small, large])
         rng.shuffle(x)
-    elif spec.dist == "heavy_tail":
+    elif dist == "heavy_tail":
         # Pareto-like then clipped to (0,1)
-        y = (rng.pareto(a=2.0, size=spec.n) + 1.0)
+        y = (rng.pareto(a=2.0, size=n) + 1.0)
         x = 1.0 / y
         x = np.clip(x, 0.01, 0.99)
     else:
-        raise ValueError(f"Unknown dist: {spec.dist}")
+        raise ValueError(f"Unknown dist: {dist}")
 
     # Avoid tiny numerical weirdness; keep in (0,1)
-    x = np.clip(x, 1e-6, 1 - 1e-6)
-    return x.astype(float).tolist()
\ No newline at end of file
+    return np.clip(x, 1e-6, 1 - 1e-6)
+
+def generate_instance(spec: InstanceSpec) -> List[float]:
+    rng = np.random.default_rng(spec.seed)
+    x = _sample_sizes(rng, spec.dist, spec.n)
+    return x.astype(float).tolist()
+
+def generate_instance_chunks(
+    spec: InstanceSpec, chunk_size: int = 65536
+) -> Iterator[List[float]]:
+    """
+    Chunked variant of generate_instance for streaming packers.
+    Yields spec.n sizes in chunks of at most chunk_size, holding one chunk in
+    memory at a time. Same distributions and seed handling, but the sequence
+    differs from generate_instance (bimodal halves are drawn per chunk).
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be >= 1")
+    rng = np.random.default_rng(spec.seed)
+    left = spec.n
+    while left > 0:
+        c = min(chunk_size, left)
+        yield _sample_sizes(rng, spec.dist, c).astype(float).tolist()
+        left -= c
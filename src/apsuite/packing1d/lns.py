@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from apsuite.common.types import PackingResult
+from apsuite.packing1d.algorithms import first_fit_decreasing
+from apsuite.packing1d.exact import solve_exact
+from apsuite.packing1d.lower_bounds import combined_lower_bound
+from apsuite.packing1d.validate import validate_items_array
+
+# Relative slack of the perfect-fill early stop (fit tests are exact).
+_TOL = 1e-9
+
+
+def _best_subset(
+    cand: List[int], sizes: List[float], capacity: float, max_nodes: int
+) -> List[int]:
+    """
+    Subset of `cand` with the largest total size that fits into one bin
+    (minimum bin slack). Depth-first over sizes in decreasing order with a
+    suffix-sum bound; stops early on a perfect fill or after max_nodes.
+    """
+    cand = sorted(cand, key=lambda i: sizes[i], reverse=True)
+    vals = [sizes[i] for i in cand]
+    suffix = [0.0] * (len(vals) + 1)
+    for j in range(len(vals) - 1, -1, -1):
+        suffix[j] = suffix[j + 1] + vals[j]
+
+    best_sum = -1.0
+    best: List[int] = []
+    chosen: List[int] = []
+    nodes = 0
+
+    def rec(j: int, load: float) -> bool:
+        nonlocal best_sum, best, nodes
+        nodes += 1
+        if load > best_sum:
+            best_sum, best = load, list(chosen)
+            if load >= capacity * (1.0 - _TOL):
+                return True  # perfect fill
+        if j == len(vals) or load + suffix[j] <= best_sum or nodes > max_nodes:
+            return False
+        if load + vals[j] <= capacity:
+            chosen.append(cand[j])
+            if rec(j + 1, load + vals[j]):
+                return True
+            chosen.pop()
+        return rec(j + 1, load)
+
+    rec(0, 0.0)
+    return best
+
+
+class _LNSState:
+    """
+    Packing kept as per-bin member lists with incremental loads. A rejected
+    move is rolled back from the log of the bins it touched.
+    """
+
+    def __init__(self, sizes: List[float], members: List[List[int]], capacity: float):
+        self.sizes = sizes
+        self.capacity = capacity
+        self.members = members
+        self.loads = [sum(sizes[i] for i in b) for b in members]
+        self.alive = [True] * len(members)
+        self.num_alive = len(members)
+
+    def live_bins(self) -> List[int]:
+        return [b for b in range(len(self.members)) if self.alive[b]]
+
+    def try_move(
+        self,
+        destroy: List[int],
+        neighbours: List[int],
+        exact_time_limit_s: float,
+        max_nodes: int,
+    ) -> bool:
+        """
+        Empty the bins in `destroy` into a pool of free items, refill each
+        neighbour bin with the best-fitting subset of its own items plus the
+        pool (exact subset-sum), then re-pack what is left of the pool with
+        solve_exact. Keeps the move if it saves a bin, or if it keeps the
+        bin count and makes the loads more uneven (sum of squared loads
+        grows), which prepares later eliminations; otherwise rolls back.
+        """
+        sizes = self.sizes
+        loads = self.loads
+        members = self.members
+        k = len(destroy)
+
+        log: List[Tuple[int, List[int], float]] = [
+            (c, members[c], loads[c]) for c in destroy
+        ]
+        pool = [i for c in destroy for i in members[c]]
+        for c in destroy:
+            members[c] = []
+            loads[c] = 0.0
+
+        for b in neighbours:
+            if not pool:
+                break
+            keep = _best_subset(members[b] + pool, sizes, self.capacity, max_nodes)
+            new_load = sum(sizes[i] for i in keep)
+            if new_load <= loads[b]:
+                continue
+            log.append((b, members[b], loads[b]))
+            kept = set(keep)
+            pool = [i for i in members[b] + pool if i not in kept]
+            members[b] = keep
+            loads[b] = new_load
+
+        new_bins: List[List[int]] = []
+        if pool:
+            repack = solve_exact(
+                [sizes[i] for i in pool], self.capacity,
+                time_limit_s=exact_time_limit_s,
+            )
+            new_bins = [[] for _ in range(repack.num_bins)]
+            for pos, b in enumerate(repack.result.assignment.tolist()):
+                new_bins[b].append(pool[pos])
+        new_loads = [sum(sizes[i] for i in b) for b in new_bins]
+
+        saved = k - len(new_bins)
+        if saved == 0:
+            gain = sum(load ** 2 for load in new_loads)
+            gain += sum(loads[b] ** 2 for b, _, _ in log[k:])
+            gain -= sum(load ** 2 for _, _, load in log)
+            accept = gain > 1e-12
+        else:
+            accept = saved > 0
+
+        if not accept:
+            for b, old_members, old_load in reversed(log):
+                members[b] = old_members
+                loads[b] = old_load
+            return False
+
+        # reuse the destroyed bin ids for the re-packed bins
+        for j, c in enumerate(destroy):
+            if j < len(new_bins):
+                members[c] = new_bins[j]
+                loads[c] = new_loads[j]
+            else:
+                self.alive[c] = False
+                self.num_alive -= 1
+        return True
+
+    def live_members(self) -> List[List[int]]:
+        return [b for b, ok in zip(self.members, self.alive) if ok]
+
+
+def lns_improve(
+    result: PackingResult,
+    capacity: float = 1.0,
+    time_limit_s: float = 1.0,
+    destroy_bins: int = 2,
+    neighbours: int = 12,
+    exact_time_limit_s: float = 0.05,
+    max_subset_nodes: int = 2000,
+    seed: int = 0,
+    max_iter: Optional[int] = None,
+) -> PackingResult:
+    """
+    Anytime large-neighbourhood search on a packing.
+
+    Each iteration destroys `destroy_bins` bins (the lightest bin plus
+    others drawn at random from the 2*destroy_bins lightest) and exchanges
+    their items with `neighbours` randomly drawn bins before re-packing the
+    leftovers with solve_exact (see _LNSState.try_move). Runs until the
+    wall-clock budget or max_iter is used up, or the bin count reaches
+    combined_lower_bound. Item identity is preserved.
+    """
+    deadline = time.perf_counter() + time_limit_s
+    rng = np.random.default_rng(seed)
+
+    sizes = result.items.tolist()
+    order = range(len(sizes)) if result.order is None else result.order.tolist()
+    members: List[List[int]] = [[] for _ in range(result.num_bins)]
+    assignment = result.assignment.tolist()
+    for i in order:
+        members[assignment[i]].append(i)
+
+    lb = combined_lower_bound(result.items, capacity)
+    state = _LNSState(sizes, members, capacity)
+    improved_any = False
+    it = 0
+    while state.num_alive > lb and time.perf_counter() < deadline:
+        if max_iter is not None and it >= max_iter:
+            break
+        it += 1
+        live = state.live_bins()
+        live.sort(key=lambda b: state.loads[b])
+        k = min(destroy_bins, len(live) - 1)
+        destroy = [live[0]]
+        if k > 1:
+            picks = rng.choice(min(2 * k, len(live)) - 1, size=k - 1, replace=False) + 1
+            destroy += [live[p] for p in sorted(picks.tolist())]
+        taken = set(destroy)
+        others = [b for b in live if b not in taken]
+        sample = rng.choice(
+            len(others), size=min(neighbours, len(others)), replace=False
+        )
+        if state.try_move(
+            destroy,
+            [others[p] for p in sample.tolist()],
+            exact_time_limit_s,
+            max_subset_nodes,
+        ):
+            improved_any = True
+
+    if not improved_any:
+        return result
+
+    members = [
+        sorted(b, key=lambda i: sizes[i], reverse=True) for b in state.live_members()
+    ]
+    new_assignment = np.empty(len(sizes), dtype=np.int32)
+    for b, idx in enumerate(members):
+        new_assignment[idx] = b
+    return PackingResult(
+        items=result.items,
+        assignment=new_assignment,
+        bin_loads=np.asarray(
+            [sum(sizes[i] for i in b) for b in members], dtype=np.float64
+        ),
+        order=np.asarray([i for b in members for i in b], dtype=np.int64),
+    )
+
+
+def ffd_lns(
+    items,
+    capacity: float = 1.0,
+    engine: str = "indexed",
+    time_limit_s: float = 1.0,
+    seed: int = 0,
+) -> PackingResult:
+    """FFD followed by a time-budgeted LNS (see lns_improve)."""
+    items = validate_items_array(items, capacity)
+    base = first_fit_decreasing(items, capacity=capacity, engine=engine)
+    return lns_improve(base, capacity=capacity, time_limit_s=time_limit_s, seed=seed)
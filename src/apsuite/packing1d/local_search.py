@@ -1,12 +1,97 @@
 from __future__ import annotations
 
-from typing import List, Tuple
+import time
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from apsuite.common.types import PackingResult
+from apsuite.packing1d.capacity_index import BestFitIndex, SortedKeys
+
 
+class _BinEliminator:
+    """
+    Incremental state for bin-elimination moves.
+
+    members[b] lists the item indices (into sizes) in bin b. Loads, the
+    Best-Fit index over remaining capacities and the (load, bin) keys of
+    live bins are updated per moved item, and a failed elimination is
+    rolled back move by move instead of copying the packing.
+    """
 
-def _remaining_capacities(bins: List[List[float]], capacity: float) -> List[float]:
-    return [capacity - sum(b) for b in bins]
+    def __init__(
+        self, sizes: Sequence[float], members: List[List[int]], capacity: float
+    ):
+        self.sizes = sizes
+        self.capacity = capacity
+        self.members = members
+        self.loads = [sum(sizes[i] for i in b) for b in members]
+        self.alive = [True] * len(members)
+        self.num_alive = len(members)
+        self.index = BestFitIndex(capacity)
+        self.by_load = SortedKeys()
+        for b, load in enumerate(self.loads):
+            self.index.open(capacity - load)
+            self.by_load.add((load, b))
+
+    def _set_load(self, b: int, load: float) -> None:
+        self.by_load.remove((self.loads[b], b))
+        self.loads[b] = load
+        self.by_load.add((load, b))
+
+    def _try_empty(self, c: int) -> bool:
+        """Move every item of bin c into other bins (best-fit); undo on failure."""
+        sizes = self.sizes
+        index = self.index
+        loads = self.loads
+        members = self.members
+
+        index.discard(c)
+        moves: List[Tuple[int, float, float]] = []  # (bin, old remaining, old load)
+        # place big first
+        for i in sorted(members[c], key=lambda i: sizes[i], reverse=True):
+            x = sizes[i]
+            b = index.find(x)
+            if b is None:
+                # Failed to place one item => roll back and keep bin c
+                for b_prev, rem_prev, load_prev in reversed(moves):
+                    members[b_prev].pop()
+                    self._set_load(b_prev, load_prev)
+                    index.update(b_prev, rem_prev)
+                index.restore(c)
+                return False
+            rem = index.remaining(b)
+            moves.append((b, rem, loads[b]))
+            members[b].append(i)
+            self._set_load(b, loads[b] + x)
+            index.update(b, rem - x)
+
+        # Success: candidate bin eliminated
+        self.by_load.remove((loads[c], c))
+        members[c] = []
+        loads[c] = 0.0
+        self.alive[c] = False
+        self.num_alive -= 1
+        return True
+
+    def eliminate_one(
+        self, max_candidates: int = 1, deadline: Optional[float] = None
+    ) -> bool:
+        """
+        Try the `max_candidates` lightest bins (easiest to empty) in turn and
+        stop at the first one that can be emptied.
+        """
+        if self.num_alive <= 1:
+            return False
+        for _, c in self.by_load.head(max_candidates):
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            if self._try_empty(c):
+                return True
+        return False
+
+    def live_members(self) -> List[List[int]]:
+        return [b for b, ok in zip(self.members, self.alive) if ok]
 
 
 def try_eliminate_one_bin(
@@ -21,39 +106,23 @@ def try_eliminate_one_bin(
       - try to place its items one-by-one into other bins (best-fit style)
       - if successful, remove the emptied bin
 
+    max_passes is accepted for compatibility and ignored: one pass either
+    empties the bin or proves that it cannot be emptied this way.
+
     Returns:
       (improved, new_bins)
     """
-    if len(bins) <= 1:
+    sizes = [x for b in bins for x in b]
+    members: List[List[int]] = []
+    start = 0
+    for b in bins:
+        members.append(list(range(start, start + len(b))))
+        start += len(b)
+
+    elim = _BinEliminator(sizes, members, capacity)
+    if not elim.eliminate_one(max_candidates=1):
         return False, bins
-
-    # Choose candidate: smallest load bin (easiest to empty)
-    loads = [sum(b) for b in bins]
-    cand_idx = min(range(len(bins)), key=lambda i: loads[i])
-    candidate_items = sorted(bins[cand_idx], reverse=True)  # place big first
-
-    # Create a working copy without the candidate bin
-    new_bins = [b.copy() for i, b in enumerate(bins) if i != cand_idx]
-    rem = _remaining_capacities(new_bins, capacity)
-
-    # Attempt to place all candidate items into remaining bins
-    for x in candidate_items:
-        best_bin = None
-        best_rem_after = None
-        for j in range(len(new_bins)):
-            if rem[j] >= x:
-                ra = rem[j] - x
-                if best_rem_after is None or ra < best_rem_after:
-                    best_rem_after = ra
-                    best_bin = j
-        if best_bin is None:
-            # Failed to place one item => cannot eliminate this candidate bin
-            return False, bins
-        new_bins[best_bin].append(x)
-        rem[best_bin] -= x
-
-    # Success: candidate bin eliminated
-    return True, new_bins
+    return True, [[sizes[i] for i in b] for b in elim.live_members()]
 
 
 def local_improve_eliminate_bins(
@@ -61,27 +130,54 @@ def local_improve_eliminate_bins(
     capacity: float = 1.0,
     max_rounds: int = 50,
     max_passes_per_round: int = 2,
+    max_candidates: int = 8,
+    time_limit_s: Optional[float] = None,
 ) -> PackingResult:
     """
     Repeatedly attempt to eliminate bins.
-    Stops when no bin can be eliminated or max_rounds reached.
+    Each round tries up to `max_candidates` of the lightest bins and keeps
+    the first one that can be emptied. Stops when no candidate can be
+    eliminated, max_rounds is reached or time_limit_s (if given) runs out.
+    Works on the item->bin assignment, so item identity is preserved.
+    max_passes_per_round is accepted for compatibility and ignored (see
+    try_eliminate_one_bin).
     """
-    bins = [b.copy() for b in result.bins]
+    deadline = None if time_limit_s is None else time.perf_counter() + time_limit_s
+
+    sizes = result.items.tolist()
+    order = range(len(sizes)) if result.order is None else result.order.tolist()
+    members: List[List[int]] = [[] for _ in range(result.num_bins)]
+    assignment = result.assignment.tolist()
+    for i in order:
+        members[assignment[i]].append(i)
 
+    elim = _BinEliminator(sizes, members, capacity)
     rounds = 0
     improved_any = False
     while rounds < max_rounds:
-        improved, bins2 = try_eliminate_one_bin(
-            bins, capacity=capacity, max_passes=max_passes_per_round
-        )
-        if not improved:
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        if not elim.eliminate_one(max_candidates=max_candidates, deadline=deadline):
             break
-        bins = bins2
         improved_any = True
         rounds += 1
 
-    if improved_any:
-        # optional: stable ordering (not necessary but helps reproducibility)
-        bins = [sorted(b, reverse=True) for b in bins]
-
-    return PackingResult(bins=bins)
\ No newline at end of file
+    if not improved_any:
+        return result
+
+    # optional: stable ordering (not necessary but helps reproducibility)
+    members = [
+        sorted(b, key=lambda i: sizes[i], reverse=True) for b in elim.live_members()
+    ]
+
+    new_assignment = np.empty(len(sizes), dtype=np.int32)
+    for b, idx in enumerate(members):
+        new_assignment[idx] = b
+    return PackingResult(
+        items=result.items,
+        assignment=new_assignment,
+        bin_loads=np.asarray(
+            [sum(sizes[i] for i in b) for b in members], dtype=np.float64
+        ),
+        order=np.asarray([i for b in members for i in b], dtype=np.int64),
+    )
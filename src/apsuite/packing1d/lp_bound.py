@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from scipy.optimize import linprog
+
+from apsuite.packing1d.algorithms import first_fit_decreasing
+from apsuite.packing1d.lower_bounds import combined_lower_bound
+from apsuite.packing1d.validate import validate_items_array
+
+# Slack when rounding LP values up and when testing reduced costs.
+_EPS = 1e-6
+
+
+@dataclass(frozen=True)
+class LPBoundInfo:
+    bound: int            # valid integer lower bound on the number of bins
+    lp_value: float       # final restricted master value (= LP optimum if converged)
+    farley: float         # best Lagrangian (Farley) bound seen, valid at any iteration
+    converged: bool
+    iterations: int
+    num_patterns: int
+    scale: int            # integer capacity used by the pricing knapsack
+    exact_scale: bool     # True if all sizes are integral at that scale
+    runtime_s: float
+
+
+def _integer_scale(values: np.ndarray, max_scale: int) -> Tuple[int, bool]:
+    """
+    Smallest integer capacity K <= max_scale at which every normalized size
+    is integral, or (max_scale, False) if there is none.
+    """
+    k = 1
+    for v in values.tolist():
+        frac = Fraction(v).limit_denominator(max_scale)
+        if abs(float(frac) - v) > 1e-12:
+            return max_scale, False
+        k = k * frac.denominator // math.gcd(k, frac.denominator)
+        if k > max_scale:
+            return max_scale, False
+    return k, True
+
+
+def _max_copies(weight: int, demand: int, cap: int) -> int:
+    """Copies of an item that fit a pattern (weight 0: all of them)."""
+    return demand if weight == 0 else min(demand, cap // weight)
+
+
+def _price(
+    weights: np.ndarray,
+    demand: np.ndarray,
+    duals: np.ndarray,
+    cap: int,
+    max_columns: int = 1,
+) -> Tuple[float, List[np.ndarray]]:
+    """
+    Bounded knapsack max sum(duals*a) s.t. sum(weights*a) <= cap, a <= demand.
+    Copies are split into binary chunks (1, 2, 4, ...) and solved as a 0/1
+    knapsack over the capacity axis with one vectorized step per chunk.
+    Returns the best value and up to max_columns patterns of value > 1.
+    """
+    chunks: List[Tuple[int, int]] = []  # (item, copies)
+    for j in np.flatnonzero(duals > 0).tolist():
+        c = _max_copies(int(weights[j]), int(demand[j]), cap)
+        p = 1
+        while c > 0:
+            take = min(p, c)
+            chunks.append((j, take))
+            c -= take
+            p *= 2
+
+    dp = np.zeros(cap + 1, dtype=np.float64)
+    taken = np.zeros((len(chunks), cap + 1), dtype=bool)
+    for r, (j, c) in enumerate(chunks):
+        w = c * int(weights[j])  # <= cap, copies are capped above
+        cand = dp[:cap + 1 - w] + c * duals[j]
+        better = cand > dp[w:]
+        taken[r, w:] = better
+        dp[w:] = np.where(better, cand, dp[w:])
+
+    # backtrack from the best few end capacities: one column per distinct
+    # pattern, which cuts the number of master re-solves on degenerate LPs
+    value = float(dp.max())
+    patterns: List[np.ndarray] = []
+    for t in np.argsort(-dp, kind="stable")[:4 * max_columns].tolist():
+        if dp[t] <= 1.0 + _EPS or len(patterns) == max_columns:
+            break
+        pattern = np.zeros(weights.size, dtype=np.int64)
+        for r in range(len(chunks) - 1, -1, -1):
+            if taken[r, t]:
+                j, c = chunks[r]
+                pattern[j] += c
+                t -= c * int(weights[j])
+        if not any(np.array_equal(pattern, q) for q in patterns):
+            patterns.append(pattern)
+    return value, patterns
+
+
+def lp_lower_bound_info(
+    items,
+    capacity: float = 1.0,
+    time_limit_s: float = 10.0,
+    max_iter: int = 1000,
+    max_scale: int = 10000,
+    columns_per_iter: int = 5,
+    smoothing: float = 0.5,
+    method: str = "highs",
+) -> LPBoundInfo:
+    """
+    Gilmore-Gomory LP bound by column generation.
+
+    Master: min sum_p x_p s.t. sum_p a_ip x_p >= d_i over cutting patterns p
+    (d_i = copies of distinct size i). Pricing is a bounded knapsack on
+    integer-scaled sizes: if every size is a multiple of C/K for some K <=
+    max_scale the scaling is exact, otherwise sizes are rounded down onto a
+    grid of max_scale, which only relaxes the problem and keeps the bound
+    valid (sizes below one grid unit weigh 0 and are free in pricing).
+    Columns are cached and reused by every later master solve; the start
+    set is the FFD packing plus homogeneous patterns.
+
+    Pricing uses Wentges dual smoothing. The Farley bound d.pi / v*(pi) is
+    valid for any duals pi, so the loop also stops as soon as its ceiling
+    meets the ceiling of the master value, and stopping at the time cap or
+    max_iter still gives a bound (never weaker than combined_lower_bound).
+    """
+    t0 = time.perf_counter()
+    deadline = t0 + time_limit_s
+    sizes = validate_items_array(items, capacity)
+    if sizes.size == 0:
+        return LPBoundInfo(0, 0.0, 0.0, True, 0, 0, 1, True, time.perf_counter() - t0)
+
+    vals, inverse, demand = np.unique(
+        sizes / capacity, return_inverse=True, return_counts=True
+    )
+    scale, exact = _integer_scale(vals, max_scale)
+    weights = np.rint(vals * scale) if exact else np.floor(vals * scale)
+    weights = weights.astype(np.int64)
+    m = vals.size
+
+    # pattern cache: columns of the restricted master, deduplicated
+    cache: Dict[bytes, int] = {}
+    columns: List[np.ndarray] = []
+
+    def add(pattern: np.ndarray) -> bool:
+        key = pattern.tobytes()
+        if key in cache:
+            return False
+        cache[key] = len(columns)
+        columns.append(pattern)
+        return True
+
+    for j in range(m):
+        p = np.zeros(m, dtype=np.int64)
+        p[j] = _max_copies(int(weights[j]), int(demand[j]), scale)
+        add(p)
+    ffd = first_fit_decreasing(sizes, capacity=capacity)
+    for b in range(ffd.num_bins):
+        members = inverse.ravel()[ffd.assignment == b]
+        add(np.bincount(members, minlength=m).astype(np.int64))
+
+    floor_lb = combined_lower_bound(sizes, capacity)
+    b_ub = -demand.astype(np.float64)
+    d = demand.astype(np.float64)
+    farley = 0.0
+    center: Optional[np.ndarray] = None  # duals of the best Farley bound
+    lp_value = math.inf
+    converged = False
+    it = 0
+    while it < max_iter:
+        it += 1
+        A = np.stack(columns, axis=1).astype(np.float64)
+        res = linprog(
+            c=np.ones(A.shape[1]),
+            A_ub=-A, b_ub=b_ub,
+            bounds=[(0.0, None)] * A.shape[1],
+            method=method,
+        )
+        if not res.success:
+            raise RuntimeError(f"LP failed: {res.message}")
+        lp_value = float(res.fun)
+        duals = np.maximum(-np.asarray(res.ineqlin.marginals, dtype=np.float64), 0.0)
+        if center is None:
+            center = duals
+
+        # Wentges smoothing: price at a mix of the stability center and the
+        # master duals first; only on a mispricing fall back to the pure duals
+        added = False
+        for alpha in (smoothing, 0.0):
+            probe = alpha * center + (1.0 - alpha) * duals
+            value, patterns = _price(weights, demand, probe, scale, columns_per_iter)
+            lagrangian = float(d @ probe) / max(value, 1.0)
+            if lagrangian > farley:
+                farley, center = lagrangian, probe
+            for p in patterns:
+                if float(duals @ p) > 1.0 + _EPS and add(p):
+                    added = True
+            if added:
+                break
+        if not added:
+            converged = True  # no column prices out at the master duals
+            break
+        if max(math.ceil(farley - _EPS), floor_lb) >= math.ceil(lp_value - _EPS):
+            break  # integer bound already settled
+        if time.perf_counter() > deadline:
+            break
+
+    best = lp_value if converged else farley
+    return LPBoundInfo(
+        bound=max(int(math.ceil(best - _EPS)), floor_lb),
+        lp_value=lp_value,
+        farley=farley,
+        converged=converged,
+        iterations=it,
+        num_patterns=len(columns),
+        scale=scale,
+        exact_scale=exact,
+        runtime_s=time.perf_counter() - t0,
+    )
+
+
+def lp_lower_bound(items, capacity: float = 1.0, time_limit_s: float = 10.0) -> int:
+    """Integer Gilmore-Gomory LP bound (see lp_lower_bound_info)."""
+    info = lp_lower_bound_info(items, capacity=capacity, time_limit_s=time_limit_s)
+    return info.bound
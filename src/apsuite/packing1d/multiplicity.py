@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from apsuite.common.types import PackingResult
+from apsuite.packing1d.capacity_index import BestFitIndex, FirstFitTree
+from apsuite.packing1d.validate import validate_items_array
+
+
+@dataclass(frozen=True)
+class MultiplicityInstance:
+    # Run-length form of a 1D instance: counts[j] copies of sizes[j].
+    # sizes are distinct and sorted in decreasing order.
+    sizes: np.ndarray    # float64, shape (m,)
+    counts: np.ndarray   # int64, shape (m,)
+    capacity: float = 1.0
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[float], capacity: float = 1.0
+    ) -> "MultiplicityInstance":
+        """Compress a flat list of sizes into (size, multiplicity) runs."""
+        arr = validate_items_array(items, capacity)
+        vals, counts = np.unique(arr, return_counts=True)
+        return cls(
+            sizes=np.array(vals[::-1], dtype=np.float64),
+            counts=counts[::-1].astype(np.int64),
+            capacity=float(capacity),
+        )
+
+    @classmethod
+    def from_counts(
+        cls,
+        sizes: Iterable[float],
+        counts: Iterable[int],
+        capacity: float = 1.0,
+    ) -> "MultiplicityInstance":
+        """Build from (size, count) pairs; repeated sizes are merged."""
+        sizes_arr = validate_items_array(sizes, capacity)
+        if not isinstance(counts, np.ndarray):
+            counts = list(counts)
+        counts_arr = np.asarray(counts)
+        if counts_arr.shape != sizes_arr.shape:
+            raise ValueError("sizes and counts must have the same length")
+        if counts_arr.size and counts_arr.dtype.kind not in "iu":
+            raise TypeError(f"counts must be integers, got {counts_arr.dtype}")
+        if counts_arr.size and counts_arr.min() < 0:
+            raise ValueError("counts must be >= 0")
+        vals, inverse = np.unique(sizes_arr, return_inverse=True)
+        merged = np.bincount(
+            inverse.ravel(), weights=counts_arr, minlength=vals.size
+        ).astype(np.int64)
+        keep = merged > 0
+        return cls(
+            sizes=np.array(vals[keep][::-1], dtype=np.float64),
+            counts=merged[keep][::-1].copy(),
+            capacity=float(capacity),
+        )
+
+    @property
+    def num_items(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def num_distinct(self) -> int:
+        return int(self.sizes.shape[0])
+
+    def to_items(self) -> np.ndarray:
+        """Flat sizes in decreasing order (the order FFD/BFD place them)."""
+        return np.repeat(self.sizes, self.counts)
+
+
+@dataclass(frozen=True, eq=False)
+class MultiplicityPacking:
+    # Run j places run_count[j] copies of instance.sizes[run_size[j]] into
+    # bin run_bin[j]; runs are listed in placement order.
+    instance: MultiplicityInstance
+    run_bin: np.ndarray     # int32
+    run_size: np.ndarray    # int64, index into instance.sizes
+    run_count: np.ndarray   # int64
+    bin_loads: np.ndarray   # float64, shape (num_bins,)
+
+    @property
+    def num_bins(self) -> int:
+        return int(self.bin_loads.shape[0])
+
+    def to_result(self) -> PackingResult:
+        """Expand to a per-item PackingResult over instance.to_items()."""
+        # runs are generated size by size, so expanding them in order yields
+        # exactly the flat decreasing item list
+        return PackingResult(
+            items=np.repeat(self.instance.sizes[self.run_size], self.run_count),
+            assignment=np.repeat(self.run_bin, self.run_count).astype(np.int32),
+            bin_loads=self.bin_loads,
+        )
+
+
+# Below this many copies per bin the scalar loop beats setting up arrays.
+_SCALAR_COPIES = 16
+
+
+def _place_copies(
+    remaining: float, load: float, x: float, available: int
+) -> Tuple[int, float, float]:
+    """
+    Put copies of x into a bin the first of which fits, with the same float
+    updates and fit test (remaining >= x) as the item-by-item packers;
+    returns (copies, remaining, load) afterwards.
+
+    The copy count is estimated in closed form as floor(remaining / x) (+1
+    for rounding) and checked against the fit test on the exact sequence of
+    float updates, computed in one np.subtract.accumulate; a bin that takes
+    more copies than estimated (accumulated rounding) continues from there.
+    """
+    k = 0
+    while k < available and (k == 0 or remaining >= x):
+        n = min(available - k, int(remaining // x) + 1)
+        if n <= _SCALAR_COPIES:
+            remaining -= x
+            load += x
+            k += 1
+            continue
+        steps = np.full(n + 1, x)
+        steps[0] = remaining
+        rems = np.subtract.accumulate(steps)  # remaining after 0..n copies
+        # the first copy fits; copy t + 1 needs rems[t] >= x
+        fits = rems[1:n] >= x
+        t = n if fits.all() else 1 + int(np.argmin(fits))
+        steps[0] = load
+        remaining = float(rems[t])
+        load = float(np.add.accumulate(steps[:t + 1])[t])
+        k += t
+    return k, remaining, load
+
+
+def _as_instance(instance, capacity: float) -> MultiplicityInstance:
+    if isinstance(instance, MultiplicityInstance):
+        return instance
+    return MultiplicityInstance.from_items(instance, capacity)
+
+
+def first_fit_decreasing_runs(
+    instance, capacity: Optional[float] = None
+) -> MultiplicityPacking:
+    """
+    FFD placing a whole run of identical items per step.
+    The leftmost bin that fits one copy takes as many copies as fit, which is
+    exactly where item-by-item FFD puts them; remaining capacities and loads
+    follow the same sequence of float updates as first_fit_decreasing, so
+    the packing matches it exactly, float sizes included. Each step either exhausts a
+    run or leaves a bin too full for that size, so the index work is
+    O((distinct sizes + bins) log bins) instead of O(n log bins).
+    `instance` is a MultiplicityInstance or a flat list of sizes.
+    """
+    inst = _as_instance(instance, 1.0 if capacity is None else capacity)
+    cap = inst.capacity
+    tree = FirstFitTree(cap)
+    run_bin: List[int] = []
+    run_size: List[int] = []
+    run_count: List[int] = []
+    loads: List[float] = []
+
+    for j, (x, c) in enumerate(zip(inst.sizes.tolist(), inst.counts.tolist())):
+        while c:
+            b = tree.find(x)
+            if b == len(loads):
+                loads.append(0.0)
+            k, rem, loads[b] = _place_copies(tree.remaining(b), loads[b], x, c)
+            tree.update(b, rem)
+            run_bin.append(b)
+            run_size.append(j)
+            run_count.append(k)
+            c -= k
+
+    return _packing(inst, run_bin, run_size, run_count, loads)
+
+
+def best_fit_decreasing_runs(
+    instance, capacity: Optional[float] = None
+) -> MultiplicityPacking:
+    """
+    BFD placing a whole run of identical items per step.
+    After taking one copy the tightest bin only gets tighter, so item-by-item
+    BFD keeps filling it until the next copy no longer fits; the run is
+    placed in one step (with the same sequence of float updates) and the
+    result equals best_fit_decreasing.
+    """
+    inst = _as_instance(instance, 1.0 if capacity is None else capacity)
+    cap = inst.capacity
+    index = BestFitIndex(cap)
+    run_bin: List[int] = []
+    run_size: List[int] = []
+    run_count: List[int] = []
+    loads: List[float] = []
+
+    for j, (x, c) in enumerate(zip(inst.sizes.tolist(), inst.counts.tolist())):
+        while c:
+            b = index.find(x)
+            if b is None:
+                k, rem, load = _place_copies(cap, 0.0, x, c)
+                b = index.open(rem)
+                loads.append(load)
+            else:
+                k, rem, loads[b] = _place_copies(index.remaining(b), loads[b], x, c)
+                index.update(b, rem)
+            run_bin.append(b)
+            run_size.append(j)
+            run_count.append(k)
+            c -= k
+
+    return _packing(inst, run_bin, run_size, run_count, loads)
+
+
+def _packing(
+    inst: MultiplicityInstance,
+    run_bin: List[int],
+    run_size: List[int],
+    run_count: List[int],
+    loads: List[float],
+) -> MultiplicityPacking:
+    return MultiplicityPacking(
+        instance=inst,
+        run_bin=np.asarray(run_bin, dtype=np.int32),
+        run_size=np.asarray(run_size, dtype=np.int64),
+        run_count=np.asarray(run_count, dtype=np.int64),
+        bin_loads=np.asarray(loads, dtype=np.float64),
+    )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+
+from apsuite.common.types import PackingResult
+from apsuite.packing1d.capacity_index import BestFitIndex, FirstFitTree
+
+POLICIES = ("first_fit", "best_fit", "next_fit")
+
+
+class OnlinePacker:
+    """
+    Stateful online bin packing session.
+
+    Items arrive one at a time through add(), which places the item
+    immediately and returns its bin index. Item ids are assigned
+    sequentially (0, 1, 2, ...) in arrival order and can be passed to
+    remove() later. Placement lookups use the same logarithmic-time
+    capacity indexes as the batch algorithms:
+      - 'first_fit': FirstFitTree, O(log bins) per arrival
+      - 'best_fit' : BestFitIndex, O(log bins) per arrival
+      - 'next_fit' : only the most recently opened bin is considered, O(1)
+    Without removals the packing is identical to the batch first_fit /
+    best_fit on the same arrival sequence. Bins emptied by removals stay
+    open and are reused.
+    """
+
+    def __init__(self, capacity: float = 1.0, policy: str = "first_fit"):
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy}")
+        self.capacity = float(capacity)
+        self.policy = policy
+
+        self._sizes: List[float] = []
+        self._item_bin: List[int] = []  # -1 once removed
+        self._loads: List[float] = []
+        self._counts: List[int] = []
+        self._num_items = 0
+        self._num_bins = 0  # bins with at least one item
+
+        self._tree: Optional[FirstFitTree] = None
+        self._index: Optional[BestFitIndex] = None
+        if policy == "first_fit":
+            self._tree = FirstFitTree(self.capacity)
+        elif policy == "best_fit":
+            self._index = BestFitIndex(self.capacity)
+
+    @property
+    def num_items(self) -> int:
+        """Number of items currently packed."""
+        return self._num_items
+
+    @property
+    def num_bins(self) -> int:
+        """Number of bins holding at least one item."""
+        return self._num_bins
+
+    def add(self, size: float) -> int:
+        """Place one item and return its bin index; its item id is the arrival index."""
+        x = float(size)
+        if not x > 0:
+            raise ValueError(f"item size must be > 0, got {size}")
+        if x > self.capacity:
+            raise ValueError(f"item size {x} exceeds capacity {self.capacity}")
+
+        if self._tree is not None:
+            b = self._tree.insert(x)
+        elif self._index is not None:
+            b = self._index.insert(x)
+        else:
+            b = len(self._loads) - 1
+            if b < 0 or self._loads[b] + x > self.capacity:
+                b = len(self._loads)
+
+        if b == len(self._loads):
+            self._loads.append(x)
+            self._counts.append(0)
+        else:
+            self._loads[b] += x
+        if self._counts[b] == 0:
+            self._num_bins += 1
+        self._counts[b] += 1
+        self._num_items += 1
+        self._sizes.append(x)
+        self._item_bin.append(b)
+        return b
+
+    def remove(self, item_id: int) -> None:
+        """Remove a previously added item, freeing its space in the bin."""
+        if not 0 <= item_id < len(self._item_bin) or self._item_bin[item_id] < 0:
+            raise KeyError(f"unknown or already removed item id: {item_id}")
+        b = self._item_bin[item_id]
+        x = self._sizes[item_id]
+        self._item_bin[item_id] = -1
+        self._num_items -= 1
+
+        self._counts[b] -= 1
+        if self._counts[b] == 0:
+            self._num_bins -= 1
+            # reset exactly instead of accumulating rounding error
+            self._loads[b] = 0.0
+            remaining = self.capacity
+        else:
+            self._loads[b] -= x
+            remaining = None
+
+        if self._tree is not None:
+            if remaining is None:
+                remaining = self._tree.remaining(b) + x
+            self._tree.update(b, remaining)
+        elif self._index is not None:
+            if remaining is None:
+                remaining = self._index.remaining(b) + x
+            self._index.update(b, remaining)
+
+    def bin_of(self, item_id: int) -> int:
+        """Current bin of an item (-1 if it was removed)."""
+        return self._item_bin[item_id]
+
+    def live_item_ids(self) -> np.ndarray:
+        """Ids of items still packed, in arrival order (rows of snapshot())."""
+        return np.flatnonzero(np.asarray(self._item_bin, dtype=np.int64) >= 0)
+
+    def snapshot(self) -> PackingResult:
+        """
+        Current packing as a PackingResult.
+        Items are the live items in arrival order (see live_item_ids());
+        empty bins are dropped and the remaining bins renumbered in order.
+        """
+        item_bin = np.asarray(self._item_bin, dtype=np.int64)
+        live = item_bin >= 0
+        counts = np.asarray(self._counts, dtype=np.int64)
+        nonempty = counts > 0
+        new_id = np.cumsum(nonempty) - 1
+        return PackingResult(
+            items=np.asarray(self._sizes, dtype=np.float64)[live],
+            assignment=new_id[item_bin[live]].astype(np.int32),
+            bin_loads=np.asarray(self._loads, dtype=np.float64)[nonempty],
+        )
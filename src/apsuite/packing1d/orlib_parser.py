@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Container, Iterator, List, Optional
 
 @dataclass(frozen=True)
 class OrlibBPPInstance:
@@ -10,15 +10,45 @@ class OrlibBPPInstance:
     source: str              # e.g. "binpack1.txt"
     capacity: float
     best_known_bins: int
-    items: List[float]
+    items: List[float]       # ndarray when loaded from the binary store (orlib_store)
 
-def _nonempty_lines(path: Path) -> Iterable[str]:
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        s = line.strip()
-        if s:
-            yield s
+def _nonempty_lines(path: Path) -> Iterator[str]:
+    # streamed line by line; the file is never held in memory as a whole
+    with path.open(encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            s = line.strip()
+            if s:
+                yield s
 
-def load_orlib_file(path: str | Path, normalize_capacity: bool = True) -> List[OrlibBPPInstance]:
+def classify_instance(name: str) -> str:
+    """
+    Instance class from the OR-Library name: 'uniform' (u...), 'triplets'
+    (t...) or 'other'.
+    """
+    name = name.lower()
+    if name.startswith("u"):
+        return "uniform"
+    if name.startswith("t"):
+        return "triplets"
+    return "other"
+
+def _wanted(
+    name: str,
+    names: Optional[Container[str]],
+    classes: Optional[Container[str]],
+) -> bool:
+    if names is not None and name not in names:
+        return False
+    if classes is not None and classify_instance(name) not in classes:
+        return False
+    return True
+
+def iter_orlib_file(
+    path: str | Path,
+    normalize_capacity: bool = True,
+    names: Optional[Container[str]] = None,
+    classes: Optional[Container[str]] = None,
+) -> Iterator[OrlibBPPInstance]:
     """
     OR-Library 1D bin packing format:
       P
@@ -27,75 +57,90 @@ def load_orlib_file(path: str | Path, normalize_capacity: bool = True) -> List[O
         capacity n best_known
         n item sizes (one per line in the original files, but we parse token-wise)
     Format described on OR-Library page. :contentReference[oaicite:1]{index=1}
+
+    Yields instances one at a time while reading the file incrementally.
+    names / classes (see classify_instance) restrict what is yielded; item
+    lines of skipped instances are consumed without converting tokens.
     """
     path = Path(path)
-    lines = list(_nonempty_lines(path))
-    if not lines:
+    lines = _nonempty_lines(path)
+    first = next(lines, None)
+    if first is None:
         raise ValueError(f"Empty file: {path}")
 
     # First line: number of problems
     try:
-        P = int(lines[0].split()[0])
+        P = int(first.split()[0])
     except Exception as e:
-        raise ValueError(f"Cannot parse number of problems in {path}: {lines[0]!r}") from e
-
-    idx = 1
-    instances: List[OrlibBPPInstance] = []
+        raise ValueError(f"Cannot parse number of problems in {path}: {first!r}") from e
 
-    
+    source = path.name
     for _ in range(P):
-        if idx >= len(lines):
+        line = next(lines, None)
+        if line is None:
             raise ValueError(f"Unexpected EOF while reading instance id in {path}")
-        name = lines[idx].split()[0]
-        idx += 1
+        name = line.split()[0]
 
-        if idx >= len(lines):
+        line = next(lines, None)
+        if line is None:
             raise ValueError(f"Unexpected EOF while reading header for {name} in {path}")
-        header_tokens = lines[idx].split()
-        idx += 1
+        header_tokens = line.split()
         if len(header_tokens) < 3:
             raise ValueError(f"Bad header line for {name} in {path}: {header_tokens}")
-        
-        source = path.name
+
         cap = float(header_tokens[0])
         n = int(header_tokens[1])
         best = int(header_tokens[2])
+        keep = _wanted(name, names, classes)
 
         # Read item sizes token-wise until we collect n items
-        items: List[float] = []
-        while len(items) < n:
-            if idx >= len(lines):
+        tokens: List[str] = []
+        while len(tokens) < n:
+            line = next(lines, None)
+            if line is None:
                 raise ValueError(f"Unexpected EOF while reading items for {name} in {path} "
-                                 f"(got {len(items)} of {n})")
-            for tok in lines[idx].split():
-                if len(items) < n:
-                    items.append(float(tok))
-            idx += 1
+                                 f"(got {len(tokens)} of {n})")
+            tokens.extend(line.split()[:n - len(tokens)])
+        if not keep:
+            continue
 
+        items = [float(tok) for tok in tokens]
         if normalize_capacity:
             items = [x / cap for x in items]
             cap_out = 1.0
         else:
             cap_out = cap
 
-        instances.append(
-            OrlibBPPInstance(
-                name=name,
-                source=source,
-                capacity=cap_out,
-                best_known_bins=best,
-                items=items,
-            )
+        yield OrlibBPPInstance(
+            name=name,
+            source=source,
+            capacity=cap_out,
+            best_known_bins=best,
+            items=items,
         )
 
-    return instances
+def load_orlib_file(path: str | Path, normalize_capacity: bool = True) -> List[OrlibBPPInstance]:
+    """All instances of one file as a list (see iter_orlib_file)."""
+    return list(iter_orlib_file(path, normalize_capacity=normalize_capacity))
 
-def load_orlib_dir(dirpath: str | Path, normalize_capacity: bool = True) -> List[OrlibBPPInstance]:
+def iter_orlib_dir(
+    dirpath: str | Path,
+    normalize_capacity: bool = True,
+    names: Optional[Container[str]] = None,
+    classes: Optional[Container[str]] = None,
+) -> Iterator[OrlibBPPInstance]:
+    """Lazily yield the instances of every binpack*.txt in dirpath, file by file."""
     dirpath = Path(dirpath)
     paths = sorted(dirpath.glob("binpack*.txt"))
     if not paths:
         raise FileNotFoundError(f"No binpack*.txt found in {dirpath}")
-    all_instances: List[OrlibBPPInstance] = []
-    for p in paths:
-        all_instances.extend(load_orlib_file(p, normalize_capacity=normalize_capacity))
-    return all_instances
\ No newline at end of file
+    return (
+        inst
+        for p in paths
+        for inst in iter_orlib_file(
+            p, normalize_capacity=normalize_capacity, names=names, classes=classes
+        )
+    )
+
+def load_orlib_dir(dirpath: str | Path, normalize_capacity: bool = True) -> List[OrlibBPPInstance]:
+    return list(iter_orlib_dir(dirpath, normalize_capacity=normalize_capacity))
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from apsuite.packing1d.orlib_parser import OrlibBPPInstance, iter_orlib_dir
+
+# Binary store layout (one directory):
+#   items.npy  - float64 item sizes of all instances, concatenated (mmap-able)
+#   index.npz  - per-instance name, source, capacity, best_known, offset, length
+# The index is written last, so a store without it is treated as missing.
+ITEMS_FILE = "items.npy"
+INDEX_FILE = "index.npz"
+
+
+def build_store(instances: Iterable[OrlibBPPInstance], out_dir: str | Path) -> Path:
+    """Write instances (as given, e.g. with raw capacities) to a binary store."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    names: List[str] = []
+    sources: List[str] = []
+    capacities: List[float] = []
+    best: List[int] = []
+    lengths: List[int] = []
+    chunks: List[np.ndarray] = []
+    for inst in instances:
+        names.append(inst.name)
+        sources.append(inst.source)
+        capacities.append(float(inst.capacity))
+        best.append(int(inst.best_known_bins))
+        arr = np.asarray(inst.items, dtype=np.float64)
+        lengths.append(arr.size)
+        chunks.append(arr)
+
+    length = np.asarray(lengths, dtype=np.int64)
+    offset = length
+    if lengths:
+        offset = np.concatenate([[0], np.cumsum(length)[:-1]]).astype(np.int64)
+    index_path = out_dir / INDEX_FILE
+    if index_path.exists():
+        index_path.unlink()  # invalidate while items.npy is rewritten
+    np.save(out_dir / ITEMS_FILE, np.concatenate(chunks) if chunks else np.empty(0))
+    np.savez(
+        index_path,
+        name=np.asarray(names, dtype=str),
+        source=np.asarray(sources, dtype=str),
+        capacity=np.asarray(capacities, dtype=np.float64),
+        best_known=np.asarray(best, dtype=np.int64),
+        offset=offset,
+        length=length,
+    )
+    return out_dir
+
+
+def convert_orlib_dir(src_dir: str | Path, out_dir: str | Path) -> Path:
+    """One-time conversion of every binpack*.txt in src_dir (raw capacities)."""
+    return build_store(iter_orlib_dir(src_dir, normalize_capacity=False), out_dir)
+
+
+class InstanceStore:
+    """
+    Read-only view of a binary store. Opening it maps items.npy and reads
+    the small index; item sizes of an instance are only touched when that
+    instance is requested.
+    """
+
+    def __init__(self, path: str | Path, normalize_capacity: bool = True):
+        self.path = Path(path)
+        index_path = self.path / INDEX_FILE
+        if not index_path.exists():
+            raise FileNotFoundError(f"No instance store at {self.path}")
+        with np.load(index_path) as idx:
+            self.names: List[str] = idx["name"].tolist()
+            self._source: List[str] = idx["source"].tolist()
+            self._capacity = idx["capacity"]
+            self._best = idx["best_known"]
+            self._offset = idx["offset"]
+            self._length = idx["length"]
+        self._items = np.load(self.path / ITEMS_FILE, mmap_mode="r")
+        self._by_name: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.normalize_capacity = normalize_capacity
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[OrlibBPPInstance]:
+        for i in range(len(self.names)):
+            yield self[i]
+
+    def __getitem__(self, key: int | str) -> OrlibBPPInstance:
+        i = self._by_name[key] if isinstance(key, str) else int(key)
+        start = int(self._offset[i])
+        items = self._items[start:start + int(self._length[i])]
+        cap = float(self._capacity[i])
+        if self.normalize_capacity:
+            items = items / cap  # per-instance copy; the raw slice is a mmap view
+            cap = 1.0
+        return OrlibBPPInstance(
+            name=self.names[i],
+            source=self._source[i],
+            capacity=cap,
+            best_known_bins=int(self._best[i]),
+            items=items,
+        )
+
+
+def load_orlib_cached(
+    src_dir: str | Path,
+    store_dir: Optional[str | Path] = None,
+    normalize_capacity: bool = True,
+) -> InstanceStore:
+    """
+    Open the binary store for an OR-Library directory, (re)building it first
+    if it is missing or older than any binpack*.txt. store_dir defaults to
+    <src_dir>/.store.
+    """
+    src_dir = Path(src_dir)
+    store_dir = src_dir / ".store" if store_dir is None else Path(store_dir)
+    index_path = store_dir / INDEX_FILE
+    sources = list(src_dir.glob("binpack*.txt"))
+    stale = (
+        not index_path.exists()
+        or any(p.stat().st_mtime > index_path.stat().st_mtime for p in sources)
+    )
+    if stale:
+        convert_orlib_dir(src_dir, store_dir)
+    return InstanceStore(store_dir, normalize_capacity=normalize_capacity)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Iterable, List, Optional
+
+# A sink receives the item sizes of every closed bin, in closing order.
+BinSink = Callable[[List[float]], None]
+
+
+@dataclass(frozen=True)
+class StreamSummary:
+    num_items: int
+    num_bins: int
+    total_size: float
+
+
+def _check_item(x: float, capacity: float) -> float:
+    x = float(x)
+    if not x > 0:
+        raise ValueError(f"item size must be > 0, got {x}")
+    if x > capacity:
+        raise ValueError(f"item size {x} exceeds capacity {capacity}")
+    return x
+
+
+class _OpenBin:
+    __slots__ = ("load", "items")
+
+    def __init__(self, track_items: bool):
+        self.load = 0.0
+        self.items: Optional[List[float]] = [] if track_items else None
+
+    def add(self, x: float) -> None:
+        self.load += x
+        if self.items is not None:
+            self.items.append(x)
+
+
+def next_k_fit(
+    items: Iterable[float],
+    capacity: float = 1.0,
+    k: int = 2,
+    sink: Optional[BinSink] = None,
+) -> StreamSummary:
+    """
+    Next-k-Fit over an arbitrary iterable (e.g. a generator) of sizes.
+    At most k bins are open; each item goes to the first (oldest) open bin
+    where it fits. If none fits and k bins are open, the oldest bin is closed
+    and emitted to `sink` before a new bin is opened. Memory is O(k) bins.
+    Without a sink only loads are tracked.
+    """
+    if capacity <= 0:
+        raise ValueError("capacity must be > 0")
+    if k < 1:
+        raise ValueError("k must be >= 1")
+
+    track = sink is not None
+    open_bins: Deque[_OpenBin] = deque()
+    num_items = 0
+    num_bins = 0
+    total = 0.0
+
+    for x in items:
+        x = _check_item(x, capacity)
+        num_items += 1
+        total += x
+
+        target = None
+        for ob in open_bins:
+            if capacity - ob.load >= x:
+                target = ob
+                break
+        if target is None:
+            if len(open_bins) == k:
+                closed = open_bins.popleft()
+                if track:
+                    sink(closed.items)
+            target = _OpenBin(track)
+            open_bins.append(target)
+            num_bins += 1
+        target.add(x)
+
+    if track:
+        for ob in open_bins:
+            sink(ob.items)
+
+    return StreamSummary(num_items=num_items, num_bins=num_bins, total_size=total)
+
+
+def next_fit_stream(
+    items: Iterable[float],
+    capacity: float = 1.0,
+    sink: Optional[BinSink] = None,
+) -> StreamSummary:
+    """Next Fit (a single open bin) over an iterable of sizes."""
+    return next_k_fit(items, capacity=capacity, k=1, sink=sink)
+
+
+def harmonic_k(
+    items: Iterable[float],
+    capacity: float = 1.0,
+    k: int = 4,
+    sink: Optional[BinSink] = None,
+) -> StreamSummary:
+    """
+    Harmonic-k (Lee & Lee) over an iterable of sizes.
+    Items in (C/(j+1), C/j] for j < k belong to class j and are packed j per
+    bin; items <= C/k form class k and are packed with Next Fit. One bin per
+    class is open, so memory is O(k) bins regardless of the stream length.
+    """
+    if capacity <= 0:
+        raise ValueError("capacity must be > 0")
+    if k < 1:
+        raise ValueError("k must be >= 1")
+
+    track = sink is not None
+    open_bins: List[Optional[_OpenBin]] = [None] * (k + 1)  # index = class
+    counts = [0] * (k + 1)
+    num_items = 0
+    num_bins = 0
+    total = 0.0
+
+    for x in items:
+        x = _check_item(x, capacity)
+        num_items += 1
+        total += x
+
+        j = min(k, int(math.floor(capacity / x)))
+        while j > 1 and j * x > capacity:  # guard against rounding at C/j
+            j -= 1
+
+        ob = open_bins[j]
+        if ob is not None and capacity - ob.load < x:
+            # only the Next Fit class can run out of room here
+            if track:
+                sink(ob.items)
+            ob = None
+        if ob is None:
+            ob = _OpenBin(track)
+            open_bins[j] = ob
+            counts[j] = 0
+            num_bins += 1
+        ob.add(x)
+        counts[j] += 1
+
+        if j < k and counts[j] == j:
+            # class-j bin is complete: close it right away
+            if track:
+                sink(ob.items)
+            open_bins[j] = None
+
+    if track:
+        for ob in open_bins:
+            if ob is not None:
+                sink(ob.items)
+
+    return StreamSummary(num_items=num_items, num_bins=num_bins, total_size=total)
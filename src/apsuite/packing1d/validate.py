@@ -1,17 +1,64 @@
 from __future__ import annotations
-from typing import Iterable
+from typing import Iterable, Optional
 
-def validate_items(items: Iterable[float], capacity: float = 1.0) -> list[float]:
-    items = list(items)
+import numpy as np
+
+
+class ValidatedItems(np.ndarray):
+    """
+    Read-only float64 view of item sizes already checked against `capacity`.
+    Passing one to an algorithm or lower bound with the same (or a larger)
+    capacity skips revalidation. Only validate_items_array sets capacity:
+    views, slices and arithmetic results of a validated array start out
+    unvalidated, since they may hold different sizes.
+    """
+
+    capacity: Optional[float]
+
+    def __array_finalize__(self, obj) -> None:
+        self.capacity = None
+
+
+def _is_validated(items, capacity: float) -> bool:
+    return (
+        isinstance(items, ValidatedItems)
+        and items.capacity is not None
+        and items.capacity <= capacity
+    )
+
+
+def validate_items_array(
+    items: Iterable[float], capacity: float = 1.0
+) -> ValidatedItems:
+    """
+    Vectorized validation returning a read-only float64 view.
+    No copy is made when `items` already is a contiguous float64 array.
+    """
+    if _is_validated(items, capacity):
+        return items
     if capacity <= 0:
         raise ValueError("capacity must be > 0")
-    if len(items) == 0:
-        return []
-    for x in items:
-        if not isinstance(x, (int, float)):
-            raise TypeError(f"item size must be numeric, got {type(x)}")
-        if x <= 0:
+    arr = np.asarray(items if isinstance(items, np.ndarray) else list(items))
+    if arr.ndim != 1:
+        raise ValueError(f"items must be one-dimensional, got shape {arr.shape}")
+    if arr.size and arr.dtype.kind not in "biuf":
+        raise TypeError(f"item size must be numeric, got {arr.dtype}")
+    arr = arr.astype(np.float64, copy=False)
+
+    if arr.size:
+        # `not (a > b)` also rejects NaN
+        if not arr.min() > 0:
+            x = arr[np.flatnonzero(~(arr > 0))[0]]
             raise ValueError(f"item size must be > 0, got {x}")
-        if x > capacity:
+        if not arr.max() <= capacity:
+            x = arr[np.flatnonzero(~(arr <= capacity))[0]]
             raise ValueError(f"item size {x} exceeds capacity {capacity}")
-    return [float(x) for x in items]
\ No newline at end of file
+
+    out = arr.view(ValidatedItems)
+    out.flags.writeable = False
+    out.capacity = float(capacity)
+    return out
+
+
+def validate_items(items: Iterable[float], capacity: float = 1.0) -> list[float]:
+    return validate_items_array(items, capacity).tolist()
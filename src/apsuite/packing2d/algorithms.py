@@ -1,24 +1,115 @@
 from __future__ import annotations
 from typing import List
+from apsuite.common.types import BinCountResult
 from apsuite.packing2d.types import Rect, Packing2DResult
-from apsuite.packing2d.shelf import shelf_pack
-from apsuite.packing2d.guillotine import guillotine_pack
+from apsuite.packing2d.shelf import open_shelf_pack, shelf_pack
+from apsuite.packing2d.guillotine import guillotine_pack, guillotine_pack_multibin
+from apsuite.packing2d.maxrects import maxrects_pack
+from apsuite.packing2d.skyline import skyline_pack
 
-def shelf(rects: List[Rect], W: float, H: float) -> Packing2DResult:
-    return shelf_pack(rects, W=W, H=H, decreasing_height=True)
+def shelf(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    return shelf_pack(
+        rects, W=W, H=H, decreasing_height=True,
+        count_only=count_only, allow_rotation=allow_rotation,
+    )
 
-def guillotine(rects: List[Rect], W: float, H: float) -> Packing2DResult:
-    return guillotine_pack(rects, W=W, H=H, order="decreasing_area", score="best_area_fit")
+def ffdh(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    return open_shelf_pack(
+        rects, W=W, H=H, fit="first_fit",
+        count_only=count_only, allow_rotation=allow_rotation,
+    )
+
+def bfdh(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    return open_shelf_pack(
+        rects, W=W, H=H, fit="best_fit",
+        count_only=count_only, allow_rotation=allow_rotation,
+    )
+
+def guillotine(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    engine: str = "indexed",
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    return guillotine_pack(
+        rects, W=W, H=H, order="decreasing_area", score="best_area_fit",
+        count_only=count_only, engine=engine, allow_rotation=allow_rotation,
+    )
+
+def guillotine_multibin(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+) -> Packing2DResult | BinCountResult:
+    return guillotine_pack_multibin(
+        rects, W=W, H=H, order="decreasing_area", score="best_area_fit",
+        count_only=count_only,
+    )
+
+def maxrects(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    rule: str = "best_short_side",
+) -> Packing2DResult | BinCountResult:
+    return maxrects_pack(
+        rects, W=W, H=H, rule=rule, order="decreasing_area", count_only=count_only
+    )
+
+def skyline(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    rule: str = "bottom_left",
+) -> Packing2DResult | BinCountResult:
+    return skyline_pack(
+        rects, W=W, H=H, rule=rule, waste_map=True, count_only=count_only
+    )
 
 def best_of_two(a: Packing2DResult, b: Packing2DResult) -> Packing2DResult:
     # Deterministic tie-breaker: prefer 'a' on ties
     return b if b.num_bins < a.num_bins else a
 
 
-def hybrid_shelf_guillotine(rects: List[Rect], W: float, H: float) -> Packing2DResult:
+def hybrid_shelf_guillotine(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    count_only: bool = False,
+    engine: str = "indexed",
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
     """
     Portfolio heuristic: run both Shelf and Guillotine and keep the better packing (fewer bins).
     """
-    r_shelf = shelf(rects, W=W, H=H)
-    r_gui = guillotine(rects, W=W, H=H)
+    r_shelf = shelf(
+        rects, W=W, H=H, count_only=count_only, allow_rotation=allow_rotation
+    )
+    r_gui = guillotine(
+        rects, W=W, H=H, count_only=count_only, engine=engine,
+        allow_rotation=allow_rotation,
+    )
     return best_of_two(r_shelf, r_gui)
\ No newline at end of file
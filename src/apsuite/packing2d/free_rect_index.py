@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from apsuite.packing2d.types import Rect
+
+_EPS = 1e-12  # containment tolerance (same as the linear prune)
+
+
+@dataclass(slots=True)
+class FreeRect:
+    x: float
+    y: float
+    w: float
+    h: float
+
+
+def _contains(b: FreeRect, a: FreeRect) -> bool:
+    """True if a lies inside b (with tolerance)."""
+    return (a.x >= b.x - _EPS and a.y >= b.y - _EPS
+            and a.x + a.w <= b.x + b.w + _EPS
+            and a.y + a.h <= b.y + b.h + _EPS)
+
+
+def split_guillotine(fr: FreeRect, r: Rect) -> List[FreeRect]:
+    """
+    Place r at (fr.x, fr.y). Split remaining space into:
+      - right piece: (x + r.w, y, fr.w - r.w, r.h)
+      - top piece:   (x, y + r.h, fr.w, fr.h - r.h)
+    Both are guillotine-legal. Some variants use different split rules; this
+    is simple and consistent.
+    """
+    out: List[FreeRect] = []
+    # Right remainder (beside the placed rect, same height as rect)
+    rw = fr.w - r.w
+    if rw > 1e-12:
+        out.append(FreeRect(fr.x + r.w, fr.y, rw, r.h))
+
+    # Top remainder (above the placed rect, full original width)
+    th = fr.h - r.h
+    if th > 1e-12:
+        out.append(FreeRect(fr.x, fr.y + r.h, fr.w, th))
+
+    return out
+
+
+class FreeRectIndex:
+    """
+    Free rectangles of one bin, kept in sorted (w, seq), (h, seq) and
+    (area, seq) key lists.
+
+    seq is an insertion counter. A linear free list only ever appends new
+    pieces and removes entries in place, so seq order equals list order and
+    breaking score ties by the smallest seq reproduces the first-in-list
+    choice of the linear scan.
+
+    Best-fit queries walk the key lists upwards from the smallest feasible
+    width / height / area and stop as soon as the score bound exceeds the
+    best score found. Containment pruning only compares the new pieces of a
+    split with the other rectangles (the rest are pruned already), and only
+    those whose width or height can satisfy the containment.
+    """
+
+    def __init__(self, W: float, H: float):
+        self.W = float(W)
+        self.H = float(H)
+        # prefilter slack on widths/heights: 2*eps plus rounding of coordinates
+        self._margin = 2 * _EPS + 8 * math.ulp(max(self.W, self.H))
+        self._seq = 0
+        self.reset()
+
+    def clear(self) -> None:
+        """Remove all free rectangles."""
+        self._rects: Dict[int, FreeRect] = {}
+        self._by_w: List[Tuple[float, int]] = []
+        self._by_h: List[Tuple[float, int]] = []
+        self._by_area: List[Tuple[float, int]] = []
+
+    def reset(self) -> None:
+        """Empty the index down to the single full-bin free rectangle."""
+        self.clear()
+        self.add(FreeRect(0.0, 0.0, self.W, self.H))
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __getitem__(self, seq: int) -> FreeRect:
+        return self._rects[seq]
+
+    @property
+    def max_w(self) -> float:
+        return self._by_w[-1][0] if self._by_w else 0.0
+
+    @property
+    def max_h(self) -> float:
+        return self._by_h[-1][0] if self._by_h else 0.0
+
+    @property
+    def max_area(self) -> float:
+        return self._by_area[-1][0] if self._by_area else 0.0
+
+    def rects(self) -> List[FreeRect]:
+        """Free rectangles in list order."""
+        return [self._rects[s] for s in sorted(self._rects)]
+
+    def add(self, fr: FreeRect) -> int:
+        seq = self._seq
+        self._seq += 1
+        self._rects[seq] = fr
+        insort(self._by_w, (fr.w, seq))
+        insort(self._by_h, (fr.h, seq))
+        insort(self._by_area, (fr.w * fr.h, seq))
+        return seq
+
+    def remove(self, seq: int) -> FreeRect:
+        fr = self._rects.pop(seq)
+        for keys, k in (
+            (self._by_w, fr.w), (self._by_h, fr.h), (self._by_area, fr.w * fr.h)
+        ):
+            del keys[bisect_left(keys, (k, seq))]
+        return fr
+
+    def best(self, r: Rect, score: str) -> Optional[int]:
+        """seq of the free rectangle the linear scan would choose for r, if any fits."""
+        rects = self._rects
+        best_s = math.inf
+        best_seq: Optional[int] = None
+
+        if score == "best_area_fit":
+            ra = r.w * r.h
+            keys = self._by_area
+            for k in range(bisect_left(keys, (ra, -1)), len(keys)):
+                area, seq = keys[k]
+                s = area - ra
+                if s > best_s:
+                    break
+                fr = rects[seq]
+                if r.w <= fr.w and r.h <= fr.h and (s < best_s or seq < best_seq):
+                    best_s, best_seq = s, seq
+            return best_seq
+
+        if score == "best_short_side":
+            # s = min(dw, dh): any rectangle scoring <= best is reached by
+            # the width walk (if s == dw) or the height walk (if s == dh)
+            keys = self._by_w
+            for k in range(bisect_left(keys, (r.w, -1)), len(keys)):
+                w, seq = keys[k]
+                if w - r.w > best_s:
+                    break
+                fr = rects[seq]
+                if r.h <= fr.h:
+                    s = min(fr.w - r.w, fr.h - r.h)
+                    if s < best_s or (s == best_s and seq < best_seq):
+                        best_s, best_seq = s, seq
+            keys = self._by_h
+            for k in range(bisect_left(keys, (r.h, -1)), len(keys)):
+                h, seq = keys[k]
+                if h - r.h > best_s:
+                    break
+                fr = rects[seq]
+                if r.w <= fr.w:
+                    s = min(fr.w - r.w, fr.h - r.h)
+                    if s < best_s or (s == best_s and seq < best_seq):
+                        best_s, best_seq = s, seq
+            return best_seq
+
+        raise ValueError(f"Unknown score: {score}")
+
+    def best_placement(
+        self, r: Rect, score: str, allow_rotation: bool = False
+    ) -> Tuple[Optional[int], bool]:
+        """
+        (seq, rotated) the linear scan would choose for r or, with
+        allow_rotation, its 90 degree rotation: both orientations are scored
+        in one walk of each key list. Ties go to the smallest seq, then to r
+        unrotated.
+        """
+        if not allow_rotation:
+            return self.best(r, score), False
+        rects = self._rects
+        rw, rh = r.w, r.h
+        best_s = math.inf
+        best_seq: Optional[int] = None
+        best_rot = False
+
+        if score == "best_area_fit":
+            # both orientations have the same area, hence the same score
+            ra = rw * rh
+            keys = self._by_area
+            for k in range(bisect_left(keys, (ra, -1)), len(keys)):
+                area, seq = keys[k]
+                s = area - ra
+                if s > best_s:
+                    break
+                fr = rects[seq]
+                if rw <= fr.w and rh <= fr.h:
+                    rot = False
+                elif rh <= fr.w and rw <= fr.h:
+                    rot = True
+                else:
+                    continue
+                if s < best_s or seq < best_seq:
+                    best_s, best_seq, best_rot = s, seq, rot
+            return best_seq, best_rot
+
+        if score == "best_short_side":
+            # as in best(), walking from the shorter side of r and stopping
+            # once neither orientation can reach the best score on that side
+            lo, hi = min(rw, rh), max(rw, rh)
+            for keys in (self._by_w, self._by_h):
+                for k in range(bisect_left(keys, (lo, -1)), len(keys)):
+                    v, seq = keys[k]
+                    if v - hi > best_s:
+                        break
+                    fr = rects[seq]
+                    for ow, oh, rot in ((rw, rh, False), (rh, rw, True)):
+                        if ow <= fr.w and oh <= fr.h:
+                            s = min(fr.w - ow, fr.h - oh)
+                            tie = s == best_s and (seq, rot) < (best_seq, best_rot)
+                            if s < best_s or tie:
+                                best_s, best_seq, best_rot = s, seq, rot
+            return best_seq, best_rot
+
+        raise ValueError(f"Unknown score: {score}")
+
+    def _containers(self, a: FreeRect, skip: int) -> Iterable[int]:
+        # rectangles wide and high enough to contain a: walk the shorter tail
+        lo_w = bisect_left(self._by_w, (a.w - self._margin, -1))
+        lo_h = bisect_left(self._by_h, (a.h - self._margin, -1))
+        if len(self._by_w) - lo_w <= len(self._by_h) - lo_h:
+            cands = self._by_w[lo_w:]
+        else:
+            cands = self._by_h[lo_h:]
+        return (
+            seq for _, seq in cands if seq != skip and _contains(self._rects[seq], a)
+        )
+
+    def _contained(self, b: FreeRect, skip: int) -> Iterable[int]:
+        # rectangles narrow and low enough to fit inside b: walk the shorter prefix
+        hi_w = bisect_right(self._by_w, (b.w + self._margin, math.inf))
+        hi_h = bisect_right(self._by_h, (b.h + self._margin, math.inf))
+        cands = self._by_w[:hi_w] if hi_w <= hi_h else self._by_h[:hi_h]
+        return (
+            seq for _, seq in cands if seq != skip and _contains(b, self._rects[seq])
+        )
+
+    def replace(self, seq: int, pieces: List[FreeRect]) -> None:
+        """
+        Remove rectangle seq, append pieces and drop every rectangle
+        contained in another one (decided on the list before any removal,
+        like the linear prune, so two identical rectangles drop each other).
+        """
+        self.remove(seq)
+        new = [self.add(p) for p in pieces]
+        drop: Set[int] = set()
+        for s in new:
+            fr = self._rects[s]
+            if any(True for _ in self._containers(fr, s)):
+                drop.add(s)
+            drop.update(self._contained(fr, s))
+        for s in sorted(drop):
+            self.remove(s)
+
+
+class BinSummaryTree:
+    """
+    Max-tree over per-bin summaries (largest free width, height, area).
+
+    Each node holds the componentwise maxima of its subtree, so a subtree
+    in which no bin has a free rectangle wide enough, high enough and large
+    enough for r is skipped without looking at its bins. The summaries are
+    necessary conditions only; candidate bins still need a FreeRectIndex
+    query.
+    """
+
+    def __init__(self, size_hint: int = 1):
+        self.num_bins = 0
+        size = 1
+        while size < max(1, size_hint):
+            size *= 2
+        self._size = size
+        self._w = [0.0] * (2 * size)
+        self._h = [0.0] * (2 * size)
+        self._a = [0.0] * (2 * size)
+
+    def _grow(self) -> None:
+        old = self._size
+        self._size = 2 * old
+        for name in ("_w", "_h", "_a"):
+            arr = [0.0] * (2 * self._size)
+            arr[self._size:self._size + old] = getattr(self, name)[old:2 * old]
+            for node in range(self._size - 1, 0, -1):
+                arr[node] = max(arr[2 * node], arr[2 * node + 1])
+            setattr(self, name, arr)
+
+    def update(self, b: int, max_w: float, max_h: float, max_area: float) -> None:
+        """Set the summary of bin b (opening it if b == num_bins)."""
+        while b >= self._size:
+            self._grow()
+        self.num_bins = max(self.num_bins, b + 1)
+        w, h, a = self._w, self._h, self._a
+        node = self._size + b
+        w[node], h[node], a[node] = max_w, max_h, max_area
+        node //= 2
+        while node:
+            w[node] = max(w[2 * node], w[2 * node + 1])
+            h[node] = max(h[2 * node], h[2 * node + 1])
+            a[node] = max(a[2 * node], a[2 * node + 1])
+            node //= 2
+
+    def _admits(self, node: int, rw: float, rh: float, ra: float) -> bool:
+        return self._w[node] >= rw and self._h[node] >= rh and self._a[node] >= ra
+
+    def candidates(self, r: Rect) -> Iterator[int]:
+        """Open bins whose summary admits r, in increasing bin order."""
+        rw, rh, ra = r.w, r.h, r.w * r.h
+        size = self._size
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if not self._admits(node, rw, rh, ra):
+                continue
+            if node >= size:
+                b = node - size
+                if b >= self.num_bins:
+                    return
+                yield b
+            else:
+                stack.append(2 * node + 1)
+                stack.append(2 * node)
@@ -1,43 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-from apsuite.packing2d.types import Rect, Bin2D, Packing2DResult
-from apsuite.packing2d.validate import validate_rects
+import numpy as np
 
+from apsuite.common import kernels
+from apsuite.common.backend import use_kernels
+from apsuite.common.types import BinCountResult
+from apsuite.packing2d.free_rect_index import (
+    BinSummaryTree, FreeRect, FreeRectIndex, split_guillotine,
+)
+from apsuite.packing2d.types import PlacementColumns, Rect, Packing2DResult
+from apsuite.packing2d.validate import validate_rects
 
-@dataclass
-class FreeRect:
-    x: float
-    y: float
-    w: float
-    h: float
+ENGINES = ("indexed", "linear")
 
 
-def _fits(r: Rect, fr: FreeRect) -> bool:
-    return r.w <= fr.w and r.h <= fr.h
+def _rotated(r: Rect) -> Rect:
+    return Rect(w=r.h, h=r.w, id=r.id)
 
 
-def _split_guillotine(fr: FreeRect, r: Rect) -> List[FreeRect]:
+def _best_linear(
+    free_rects: List[FreeRect],
+    r: Rect,
+    allow_rotation: bool,
+    score: str,
+) -> Tuple[Optional[int], bool]:
     """
-    Place r at (fr.x, fr.y). Split remaining space into:
-      - right piece: (x + r.w, y, fr.w - r.w, r.h)
-      - top piece:   (x, y + r.h, fr.w, fr.h - r.h)
-    Both are guillotine-legal. Some variants use different split rules; this is simple and consistent.
+    (index, rotated) of the lowest-scoring free rectangle for r or, with
+    allow_rotation, its rotation. Both orientations are scored against all
+    free rectangles in one vectorized pass; ties go to the earliest free
+    rectangle, then to r unrotated.
     """
-    out: List[FreeRect] = []
-    # Right remainder (beside the placed rect, same height as rect)
-    rw = fr.w - r.w
-    if rw > 1e-12:
-        out.append(FreeRect(fr.x + r.w, fr.y, rw, r.h))
-
-    # Top remainder (above the placed rect, full original width)
-    th = fr.h - r.h
-    if th > 1e-12:
-        out.append(FreeRect(fr.x, fr.y + r.h, fr.w, th))
-
-    return out
+    n = len(free_rects)
+    if not n:
+        return None, False
+    fw = np.fromiter((fr.w for fr in free_rects), dtype=np.float64, count=n)
+    fh = np.fromiter((fr.h for fr in free_rects), dtype=np.float64, count=n)
+    # one column per orientation, unrotated first: the row-major argmin
+    # then breaks ties like the list scan
+    rw = np.array([r.w, r.h] if allow_rotation else [r.w])
+    rh = np.array([r.h, r.w] if allow_rotation else [r.h])
+    dw = fw[:, None] - rw
+    dh = fh[:, None] - rh
+    if score == "best_area_fit":
+        s = (fw * fh)[:, None] - rw * rh
+    elif score == "best_short_side":
+        s = np.minimum(dw, dh)
+    else:
+        raise ValueError(f"Unknown score: {score}")
+    s = np.where((dw >= 0) & (dh >= 0), s, np.inf)
+    k = int(np.argmin(s))
+    if s.flat[k] == np.inf:
+        return None, False
+    i, rot = divmod(k, rw.size)
+    return i, bool(rot)
 
 
 def _prune_free_rects(free_rects: List[FreeRect]) -> List[FreeRect]:
@@ -61,15 +78,31 @@ def _prune_free_rects(free_rects: List[FreeRect]) -> List[FreeRect]:
     return pruned
 
 
+def _ordered(rects: List[Rect], order: str) -> List[Rect]:
+    items = rects[:]
+    if order == "decreasing_area":
+        items.sort(key=lambda r: r.w * r.h, reverse=True)
+    elif order == "decreasing_maxside":
+        items.sort(key=lambda r: max(r.w, r.h), reverse=True)
+    elif order == "input":
+        pass
+    else:
+        raise ValueError(f"Unknown order: {order}")
+    return items
+
+
 def guillotine_pack(
     rects: List[Rect],
     W: float,
     H: float,
     order: str = "decreasing_area",
     score: str = "best_area_fit",
-) -> Packing2DResult:
+    count_only: bool = False,
+    engine: str = "indexed",
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
     """
-    Simple guillotine heuristic (no rotation).
+    Simple guillotine heuristic.
     order:
       - 'input'
       - 'decreasing_area'
@@ -77,69 +110,196 @@ def guillotine_pack(
     score (select free rectangle):
       - 'best_area_fit': minimizes leftover area (fr.w*fr.h - r.w*r.h)
       - 'best_short_side': minimizes min(fr.w-r.w, fr.h-r.h)
+    count_only=True keeps only the free rectangles and returns a
+    BinCountResult with the used area per bin.
+    engine:
+      - 'indexed': free rectangles in a FreeRectIndex (sorted key lists)
+      - 'linear' : reference list scan with all-pairs pruning
+    Both engines produce identical packings. With the 'numba' backend a
+    compiled kernel is used for either engine.
+    allow_rotation=True scores both orientations of each rectangle against
+    every candidate free rectangle (placements hold the rotated Rect).
     """
-    rects = validate_rects(rects, W, H)
-    items = rects[:]
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}")
+    if score not in _SCORES:
+        raise ValueError(f"Unknown score: {score}")
+    items = _ordered(validate_rects(rects, W, H, allow_rotation=allow_rotation), order)
 
-    if order == "decreasing_area":
-        items.sort(key=lambda r: r.w * r.h, reverse=True)
-    elif order == "decreasing_maxside":
-        items.sort(key=lambda r: max(r.w, r.h), reverse=True)
-    elif order == "input":
-        pass
-    else:
-        raise ValueError(f"Unknown order: {order}")
+    if use_kernels():
+        return _guillotine_pack_kernel(items, W, H, score, count_only, allow_rotation)
+    if engine == "indexed":
+        return _guillotine_pack_indexed(items, W, H, score, count_only, allow_rotation)
 
-    bins: List[Bin2D] = []
+    areas: List[float] = []
 
-    # For each bin we track placements and free rectangles
-    placements: List[Tuple[Rect, float, float]] = []
+    # Per-placement columns, plus the area and free rectangles of the open bin
+    cols = PlacementColumns()
+    area = 0.0
+    count = 0
     free_rects: List[FreeRect] = [FreeRect(0.0, 0.0, W, H)]
 
     def close_bin_and_open_new():
-        nonlocal placements, free_rects
-        if placements:
-            bins.append(Bin2D(placements=placements))
-        placements = []
+        nonlocal area, count, free_rects
+        if count:
+            areas.append(area)
+        area = 0.0
+        count = 0
         free_rects = [FreeRect(0.0, 0.0, W, H)]
 
     for r in items:
-        best_idx: Optional[int] = None
-        best_score: Optional[float] = None
-
-        for i, fr in enumerate(free_rects):
-            if not _fits(r, fr):
-                continue
-
-            if score == "best_area_fit":
-                s = (fr.w * fr.h) - (r.w * r.h)
-            elif score == "best_short_side":
-                s = min(fr.w - r.w, fr.h - r.h)
-            else:
-                raise ValueError(f"Unknown score: {score}")
-
-            if best_score is None or s < best_score:
-                best_score = s
-                best_idx = i
-
+        best_idx, rot = _best_linear(free_rects, r, allow_rotation, score)
         if best_idx is None:
-            # No fit in current bin → open a new bin
+            # No fit in current bin → open a new bin (r fits the fresh one)
             close_bin_and_open_new()
-            # After opening, it must fit in the fresh bin
-            fr0 = free_rects[0]
-            placements.append((r, fr0.x, fr0.y))
-            free_rects = _split_guillotine(fr0, r)
-            free_rects = _prune_free_rects(free_rects)
-            continue
+            best_idx, rot = _best_linear(free_rects, r, allow_rotation, score)
+        if rot:
+            r = _rotated(r)
 
         # Place in chosen free rectangle
         fr = free_rects.pop(best_idx)
-        placements.append((r, fr.x, fr.y))
-        free_rects.extend(_split_guillotine(fr, r))
+        if not count_only:
+            cols.append(r, len(areas), fr.x, fr.y)
+        area += r.w * r.h
+        count += 1
+        free_rects.extend(split_guillotine(fr, r))
         free_rects = _prune_free_rects(free_rects)
 
     # Finalize last bin
-    if placements:
-        bins.append(Bin2D(placements=placements))
+    close_bin_and_open_new()
+
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return cols.result(len(areas))
 
-    return Packing2DResult(bins=bins)
\ No newline at end of file
+
+def _guillotine_pack_indexed(
+    items: List[Rect],
+    W: float,
+    H: float,
+    score: str,
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """guillotine_pack over a FreeRectIndex for pre-ordered items (same placements)."""
+    areas: List[float] = []
+    cols = PlacementColumns()
+    area = 0.0
+    free = FreeRectIndex(W, H)
+
+    for r in items:
+        seq, rot = free.best_placement(r, score, allow_rotation)
+        if seq is None:
+            # No fit in current bin -> close it; r fits the fresh bin
+            areas.append(area)
+            area = 0.0
+            free.reset()
+            seq, rot = free.best_placement(r, score, allow_rotation)
+        if rot:
+            r = _rotated(r)
+
+        fr = free[seq]
+        if not count_only:
+            cols.append(r, len(areas), fr.x, fr.y)
+        area += r.w * r.h
+        free.replace(seq, split_guillotine(fr, r))
+
+    if items:
+        areas.append(area)
+
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return cols.result(len(areas))
+
+
+def guillotine_pack_multibin(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    order: str = "decreasing_area",
+    score: str = "best_area_fit",
+    count_only: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """
+    Guillotine heuristic with all bins kept open (first fit over bins).
+
+    Each rectangle goes to the lowest-index bin that has a fitting free
+    rectangle, at the best free rectangle of that bin by `score`; a new bin
+    is opened only if no open bin fits. Per-bin summaries (largest free
+    width, height, area) in a BinSummaryTree skip bins that cannot fit the
+    rectangle without querying their free rectangles.
+    Orders and scores as in guillotine_pack.
+    """
+    if score not in _SCORES:
+        raise ValueError(f"Unknown score: {score}")
+    items = _ordered(validate_rects(rects, W, H), order)
+
+    free: List[FreeRectIndex] = []
+    cols = PlacementColumns()
+    areas: List[float] = []
+    summary = BinSummaryTree(size_hint=len(items))
+
+    for r in items:
+        b = seq = None
+        for cand in summary.candidates(r):
+            seq = free[cand].best(r, score)
+            if seq is not None:
+                b = cand
+                break
+        if b is None:
+            b = len(free)
+            free.append(FreeRectIndex(W, H))
+            areas.append(0.0)
+            seq = free[b].best(r, score)
+
+        idx = free[b]
+        fr = idx[seq]
+        if not count_only:
+            cols.append(r, b, fr.x, fr.y)
+        areas[b] += r.w * r.h
+        idx.replace(seq, split_guillotine(fr, r))
+        summary.update(b, idx.max_w, idx.max_h, idx.max_area)
+
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return cols.result(len(areas))
+
+
+_SCORES = {"best_area_fit": 0, "best_short_side": 1}
+
+
+def _guillotine_pack_kernel(
+    items: List[Rect],
+    W: float,
+    H: float,
+    score: str,
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """Compiled guillotine_pack for pre-ordered items (identical placements)."""
+    if score not in _SCORES:
+        raise ValueError(f"Unknown score: {score}")
+    if not items:
+        if count_only:
+            return BinCountResult(num_bins=0, bin_loads=np.zeros(0))
+        return Packing2DResult.from_columns([], [], [], [])
+    w = np.asarray([r.w for r in items], dtype=np.float64)
+    h = np.asarray([r.h for r in items], dtype=np.float64)
+    out_bin, out_x, out_y, out_rot = kernels.guillotine_kernel(
+        w, h, float(W), float(H), _SCORES[score], bool(allow_rotation)
+    )
+    if count_only:
+        areas = np.bincount(out_bin, weights=w * h)
+        return BinCountResult(num_bins=int(areas.shape[0]), bin_loads=areas)
+    placed = items
+    if allow_rotation:
+        placed = [_rotated(r) if rot else r for r, rot in zip(items, out_rot.tolist())]
+    return Packing2DResult.from_columns(
+        placed, out_bin, out_x, out_y, num_bins=int(out_bin[-1]) + 1
+    )
@@ -1,12 +1,162 @@
 from __future__ import annotations
 import math
-from typing import Sequence
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from apsuite.packing1d.lower_bounds import combined_lower_bound
 from apsuite.packing2d.types import Rect
 from apsuite.packing2d.validate import validate_rects
 
-def area_lower_bound(rects: Sequence[Rect], W: float, H: float) -> int:
-    rects = validate_rects(rects, W, H)
+# Slack used when rounding float bound values up (see packing1d.lower_bounds).
+_EPS = 1e-9
+
+def _ceil(v: np.ndarray | float) -> np.ndarray:
+    return np.ceil(np.asarray(v) - _EPS)
+
+def _sizes(rects: Sequence[Rect]) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(rects)
+    w = np.fromiter((r.w for r in rects), dtype=np.float64, count=n)
+    h = np.fromiter((r.h for r in rects), dtype=np.float64, count=n)
+    return w, h
+
+def _thresholds(v: np.ndarray, limit: float, max_thresholds: int) -> np.ndarray:
+    """0 plus the distinct values <= limit, thinned evenly to max_thresholds."""
+    u = np.unique(v[v <= limit])
+    if u.size > max_thresholds:
+        picks = np.linspace(0, u.size - 1, max_thresholds).round().astype(np.int64)
+        u = u[np.unique(picks)]
+    return np.concatenate([[0.0], u])
+
+def _dominance(
+    w: np.ndarray, h: np.ndarray, weight: np.ndarray,
+    xs: np.ndarray, ys: np.ndarray, strict: bool,
+) -> np.ndarray:
+    """
+    table[k, l] = sum of weight over items with w >= xs[k] and h >= ys[l]
+    (> instead of >= if strict), for all threshold pairs at once: items are
+    bucketed by how many thresholds they reach, then a 2D suffix sum turns
+    bucket totals into dominance sums.
+    """
+    ox, oy = np.argsort(xs), np.argsort(ys)
+    side = "left" if strict else "right"
+    bi = np.searchsorted(xs[ox], w, side=side)  # thresholds reached by w
+    bj = np.searchsorted(ys[oy], h, side=side)
+    shape = (xs.size + 1, ys.size + 1)
+    grid = np.bincount(
+        bi * shape[1] + bj, weights=weight, minlength=shape[0] * shape[1]
+    ).reshape(shape)
+    suffix = grid[::-1, ::-1].cumsum(axis=0).cumsum(axis=1)[::-1, ::-1]
+    # an item reaches sorted threshold k iff its bucket is >= k + 1
+    table = np.empty((xs.size, ys.size))
+    table[np.ix_(ox, oy)] = suffix[1:, 1:]
+    return table
+
+def area_lower_bound(
+    rects: Sequence[Rect], W: float, H: float, allow_rotation: bool = False
+) -> int:
+    # rotation does not change areas; it only widens what counts as valid input
+    rects = validate_rects(rects, W, H, allow_rotation=allow_rotation)
     if not rects:
         return 0
     total_area = sum(r.w * r.h for r in rects)
-    return int(math.ceil(total_area / (W * H)))
\ No newline at end of file
+    return int(math.ceil(total_area / (W * H)))
+
+def martello_vigo_l2(
+    rects: Sequence[Rect], W: float, H: float, max_thresholds: int = 256
+) -> int:
+    """
+    Martello-Vigo bounds (no rotation).
+      - L1: rectangles with h > H/2 cannot be stacked, so their widths form
+        a 1D instance of capacity W (likewise heights of w > W/2 with H);
+        bounded with packing1d.combined_lower_bound.
+      - L2(p, q) for 0 <= p <= W/2, 0 <= q <= H/2:
+          I1 = {w > W - p and h > H - q}
+          I2 = {w > W/2 and h > H/2} minus I1
+          I3 = {w >= p and h >= q} minus I1, I2
+        every I1 and I2 rectangle needs its own bin and no I3 rectangle
+        fits next to an I1 one, so
+          L2(p, q) = |I1| + |I2| + max(0, ceil((area(I2 u I3) - |I2| W H) / (W H)))
+    p and q range over 0 and the distinct widths / heights up to W/2 / H/2
+    (thinned to max_thresholds each); the dominance counts and areas of all
+    (p, q) pairs come from 2D suffix sums over the sorted thresholds.
+    """
+    rects = validate_rects(rects, W, H)
+    if not rects:
+        return 0
+    w, h = _sizes(rects)
+    area = w * h
+    best = 0
+    for sel, side, cap in ((h > H / 2, w, W), (w > W / 2, h, H)):
+        if sel.any():
+            best = max(best, combined_lower_bound(side[sel], capacity=cap))
+
+    big = (w > W / 2) & (h > H / 2)
+    n_big = int(np.count_nonzero(big))
+    ps = _thresholds(w, W / 2, max_thresholds)
+    qs = _thresholds(h, H / 2, max_thresholds)
+    # every big rectangle has w >= p and h >= q, so dom covers I1, I2 and I3
+    dom = _dominance(w, h, area, ps, qs, strict=False)
+    n1 = _dominance(w, h, np.ones_like(w), W - ps, H - qs, strict=True)
+    a1 = _dominance(w, h, area, W - ps, H - qs, strict=True)
+    bin_area = W * H
+    extra = np.maximum(0.0, _ceil((dom - a1 - (n_big - n1) * bin_area) / bin_area))
+    return max(best, n_big + int(extra.max()))
+
+def _dff_table(x: np.ndarray, lams: np.ndarray, max_k: int) -> np.ndarray:
+    """Rows u(x) for the dual-feasible functions of packing1d.dff_lower_bound."""
+    lams = lams[:, None]  # lam = 0 is the identity
+    f = np.where(x > 1.0 - lams, 1.0, np.where(x >= lams, x, 0.0))
+    ks = np.arange(1, max_k + 1, dtype=np.float64)[:, None]
+    y = (ks + 1) * x
+    integral = np.abs(y - np.rint(y)) <= _EPS
+    u = np.where(integral, x, np.floor(y + _EPS) / ks)
+    return np.vstack([f, u])
+
+def dff_lower_bound_2d(
+    rects: Sequence[Rect],
+    W: float,
+    H: float,
+    allow_rotation: bool = False,
+    max_k: int = 20,
+    max_thresholds: int = 128,
+) -> int:
+    """
+    Fekete-Schepers bound: for dual-feasible functions u and v,
+    sum u(w_i/W) v(h_i/H) <= 1 in every bin, so ceil of that sum is a bound.
+    All (u, v) pairs of the packing1d.dff_lower_bound families (f_lam over
+    0 and the distinct sizes <= 1/2, thinned to max_thresholds, and u_k for
+    k = 1..max_k) are scored with one matrix product.
+
+    With rotation the bound needs u(w) v(h) = u(h) v(w), so only u = v
+    pairs on a square bin are used (otherwise this falls back to the area
+    bound).
+    """
+    rects = validate_rects(rects, W, H, allow_rotation=allow_rotation)
+    if not rects:
+        return 0
+    w, h = _sizes(rects)
+    if allow_rotation:
+        if W != H:
+            return area_lower_bound(rects, W, H, allow_rotation=True)
+        x, y = w / W, h / H
+        lams = _thresholds(np.concatenate([x, y]), 0.5, max_thresholds)
+        ux, uy = _dff_table(x, lams, max_k), _dff_table(y, lams, max_k)
+        return int(_ceil((ux * uy).sum(axis=1).max()))
+    x, y = w / W, h / H
+    ux = _dff_table(x, _thresholds(x, 0.5, max_thresholds), max_k)
+    uy = _dff_table(y, _thresholds(y, 0.5, max_thresholds), max_k)
+    return int(_ceil((ux @ uy.T).max()))
+
+def combined_lower_bound_2d(
+    rects: Sequence[Rect], W: float, H: float, allow_rotation: bool = False
+) -> int:
+    """Best of the area, Martello-Vigo (no rotation) and Fekete-Schepers bounds."""
+    rects = validate_rects(rects, W, H, allow_rotation=allow_rotation)
+    bounds = [
+        area_lower_bound(rects, W, H, allow_rotation=allow_rotation),
+        dff_lower_bound_2d(rects, W, H, allow_rotation=allow_rotation),
+    ]
+    if not allow_rotation:
+        bounds.append(martello_vigo_l2(rects, W, H))
+    return max(bounds)
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from apsuite.common.types import BinCountResult
+from apsuite.packing2d.free_rect_index import BinSummaryTree
+from apsuite.packing2d.types import Packing2DResult, PlacementColumns, Rect
+from apsuite.packing2d.validate import validate_rects
+
+RULES = ("best_short_side", "best_area", "bottom_left", "contact_point")
+
+_EPS = 1e-12
+
+Box = Tuple[float, float, float, float]  # (x, y, w, h)
+
+
+class _Grid:
+    """
+    Uniform bucket grid over a bin: each rectangle id is registered in every
+    cell its (slightly enlarged) box overlaps. A rectangle containing a
+    point is always registered in that point's cell, so containment tests
+    only look at one bucket, and overlap queries only at the covered cells.
+    """
+
+    def __init__(self, W: float, H: float, cells: int):
+        self.n = cells
+        self.cw = W / cells
+        self.ch = H / cells
+        self.pad = 1e-9 * max(W, H)
+        self.buckets: List[Set[int]] = [set() for _ in range(cells * cells)]
+
+    def _cells(self, box: Box) -> List[int]:
+        x, y, w, h = box
+        n, pad = self.n, self.pad
+        i0 = min(max(int((x - pad) / self.cw), 0), n - 1)
+        i1 = min(max(int((x + w + pad) / self.cw), 0), n - 1)
+        j0 = min(max(int((y - pad) / self.ch), 0), n - 1)
+        j1 = min(max(int((y + h + pad) / self.ch), 0), n - 1)
+        return [j * n + i for j in range(j0, j1 + 1) for i in range(i0, i1 + 1)]
+
+    def add(self, rid: int, box: Box) -> None:
+        for c in self._cells(box):
+            self.buckets[c].add(rid)
+
+    def remove(self, rid: int, box: Box) -> None:
+        for c in self._cells(box):
+            self.buckets[c].discard(rid)
+
+    def overlapping(self, box: Box) -> Set[int]:
+        """Ids registered in any cell the box touches (a superset of overlaps)."""
+        out: Set[int] = set()
+        for c in self._cells(box):
+            out |= self.buckets[c]
+        return out
+
+    def at(self, x: float, y: float) -> Set[int]:
+        """Ids registered in the cell of point (x, y)."""
+        i = min(max(int(x / self.cw), 0), self.n - 1)
+        j = min(max(int(y / self.ch), 0), self.n - 1)
+        return self.buckets[j * self.n + i]
+
+
+def _contains(b: Box, a: Box) -> bool:
+    return (a[0] >= b[0] - _EPS and a[1] >= b[1] - _EPS
+            and a[0] + a[2] <= b[0] + b[2] + _EPS
+            and a[1] + a[3] <= b[1] + b[3] + _EPS)
+
+
+def _overlaps(a: Box, b: Box) -> bool:
+    return (a[0] < b[0] + b[2] - _EPS and b[0] < a[0] + a[2] - _EPS
+            and a[1] < b[1] + b[3] - _EPS and b[1] < a[1] + a[3] - _EPS)
+
+
+def _split(f: Box, p: Box) -> List[Box]:
+    """Maximal pieces of free box f left over after placing p (p overlaps f)."""
+    fx, fy, fw, fh = f
+    px, py, pw, ph = p
+    out: List[Box] = []
+    if px > fx + _EPS:
+        out.append((fx, fy, px - fx, fh))
+    if px + pw < fx + fw - _EPS:
+        out.append((px + pw, fy, fx + fw - (px + pw), fh))
+    if py > fy + _EPS:
+        out.append((fx, fy, fw, py - fy))
+    if py + ph < fy + fh - _EPS:
+        out.append((fx, py + ph, fw, fy + fh - (py + ph)))
+    return out
+
+
+def _overlap_len(a0: float, a1: float, b0: float, b1: float) -> float:
+    return max(0.0, min(a1, b1) - max(a0, b0))
+
+
+class MaxRectsBin:
+    """
+    Free space of one bin as the set of maximal free rectangles.
+
+    Free rectangles live in a dict keyed by insertion id, in sorted
+    (w, id) / (h, id) / (area, id) / (y, id) key lists for the placement
+    rules, and in a bucket grid for overlap and containment lookups. After a
+    placement only the free rectangles in the grid cells under it are split,
+    and each new piece is checked for containment against the other new
+    pieces (largest first) and the rectangles in the bucket of its corner.
+    """
+
+    def __init__(self, W: float, H: float, cells: int = 16, track_placed: bool = False):
+        self.W = float(W)
+        self.H = float(H)
+        self._free: Dict[int, Box] = {}
+        self._by_w: List[Tuple[float, int]] = []
+        self._by_h: List[Tuple[float, int]] = []
+        self._by_area: List[Tuple[float, int]] = []
+        self._by_y: List[Tuple[float, int]] = []
+        self._grid = _Grid(self.W, self.H, cells)
+        self._next_id = 0
+        # placed boxes (only needed by the contact-point rule)
+        self._placed: Optional[List[Box]] = [] if track_placed else None
+        self._placed_grid = _Grid(self.W, self.H, cells) if track_placed else None
+        self._add((0.0, 0.0, self.W, self.H))
+
+    @property
+    def max_w(self) -> float:
+        return self._by_w[-1][0] if self._by_w else 0.0
+
+    @property
+    def max_h(self) -> float:
+        return self._by_h[-1][0] if self._by_h else 0.0
+
+    @property
+    def max_area(self) -> float:
+        return self._by_area[-1][0] if self._by_area else 0.0
+
+    def free_rects(self) -> List[Box]:
+        return [self._free[i] for i in sorted(self._free)]
+
+    def _add(self, box: Box) -> None:
+        rid = self._next_id
+        self._next_id += 1
+        self._free[rid] = box
+        x, y, w, h = box
+        insort(self._by_w, (w, rid))
+        insort(self._by_h, (h, rid))
+        insort(self._by_area, (w * h, rid))
+        insort(self._by_y, (y, rid))
+        self._grid.add(rid, box)
+
+    def _remove(self, rid: int) -> None:
+        box = self._free.pop(rid)
+        x, y, w, h = box
+        for keys, k in (
+            (self._by_w, w),
+            (self._by_h, h),
+            (self._by_area, w * h),
+            (self._by_y, y),
+        ):
+            del keys[bisect_left(keys, (k, rid))]
+        self._grid.remove(rid, box)
+
+    # ---- placement rules: each returns the id of the chosen free rectangle
+
+    def _best_short_side(self, w: float, h: float) -> Optional[int]:
+        best: Optional[Tuple[float, float, int]] = None
+        # score min(dw, dh) equals dw or dh: walk widths, then heights
+        for keys, k0 in ((self._by_w, w), (self._by_h, h)):
+            for k in range(bisect_left(keys, (k0, -1)), len(keys)):
+                v, rid = keys[k]
+                if best is not None and v - k0 > best[0]:
+                    break
+                _, _, fw, fh = self._free[rid]
+                if w <= fw and h <= fh:
+                    dw, dh = fw - w, fh - h
+                    key = (min(dw, dh), max(dw, dh), rid)
+                    if best is None or key < best:
+                        best = key
+        return None if best is None else best[2]
+
+    def _best_area(self, w: float, h: float) -> Optional[int]:
+        best: Optional[Tuple[float, float, int]] = None
+        ra = w * h
+        keys = self._by_area
+        for k in range(bisect_left(keys, (ra, -1)), len(keys)):
+            area, rid = keys[k]
+            if best is not None and area - ra > best[0]:
+                break
+            _, _, fw, fh = self._free[rid]
+            if w <= fw and h <= fh:
+                key = (area - ra, min(fw - w, fh - h), rid)
+                if best is None or key < best:
+                    best = key
+        return None if best is None else best[2]
+
+    def _bottom_left(self, w: float, h: float) -> Optional[int]:
+        best: Optional[Tuple[float, float, int]] = None
+        for y, rid in self._by_y:
+            if best is not None and y + h > best[0]:
+                break
+            fx, _, fw, fh = self._free[rid]
+            if w <= fw and h <= fh:
+                key = (y + h, fx, rid)
+                if best is None or key < best:
+                    best = key
+        return None if best is None else best[2]
+
+    def _contact(self, box: Box) -> float:
+        x, y, w, h = box
+        score = 0.0
+        if abs(x) <= _EPS or abs(x + w - self.W) <= _EPS:
+            score += h
+        if abs(y) <= _EPS or abs(y + h - self.H) <= _EPS:
+            score += w
+        for pid in self._placed_grid.overlapping(box):
+            px, py, pw, ph = self._placed[pid]
+            if abs(px + pw - x) <= _EPS or abs(px - (x + w)) <= _EPS:
+                score += _overlap_len(py, py + ph, y, y + h)
+            if abs(py + ph - y) <= _EPS or abs(py - (y + h)) <= _EPS:
+                score += _overlap_len(px, px + pw, x, x + w)
+        return score
+
+    def _contact_point(self, w: float, h: float) -> Optional[int]:
+        best: Optional[Tuple[float, int]] = None
+        keys = self._by_w
+        for k in range(bisect_left(keys, (w, -1)), len(keys)):
+            rid = keys[k][1]
+            fx, fy, fw, fh = self._free[rid]
+            if h <= fh:
+                key = (-self._contact((fx, fy, w, h)), rid)
+                if best is None or key < best:
+                    best = key
+        return None if best is None else best[1]
+
+    def find(self, r: Rect, rule: str) -> Optional[int]:
+        if rule == "best_short_side":
+            return self._best_short_side(r.w, r.h)
+        if rule == "best_area":
+            return self._best_area(r.w, r.h)
+        if rule == "bottom_left":
+            return self._bottom_left(r.w, r.h)
+        if rule == "contact_point":
+            return self._contact_point(r.w, r.h)
+        raise ValueError(f"Unknown rule: {rule}")
+
+    def place(self, r: Rect, rid: int) -> Tuple[float, float]:
+        """Place r at the bottom-left corner of free rectangle rid; returns (x, y)."""
+        x, y = self._free[rid][0], self._free[rid][1]
+        p: Box = (x, y, r.w, r.h)
+        if self._placed is not None:
+            self._placed_grid.add(len(self._placed), p)
+            self._placed.append(p)
+
+        pieces: List[Box] = []
+        for fid in sorted(self._grid.overlapping(p)):
+            f = self._free[fid]
+            if _overlaps(f, p):
+                self._remove(fid)
+                pieces.extend(_split(f, p))
+
+        # untouched free rectangles are maximal already and cannot lie in a
+        # piece (it is part of a former free rectangle); drop pieces lying
+        # in another piece (largest first, so one of two equal pieces stays)
+        # or in an untouched free rectangle
+        pieces.sort(key=lambda b: b[2] * b[3], reverse=True)
+        kept: List[Box] = []
+        for b in pieces:
+            if any(_contains(k, b) for k in kept):
+                continue
+            if any(_contains(self._free[fid], b) for fid in self._grid.at(b[0], b[1])):
+                continue
+            kept.append(b)
+        for b in kept:
+            self._add(b)
+        return x, y
+
+
+def _grid_cells(rects: List[Rect], W: float, H: float) -> int:
+    # about one cell per average rectangle side, capped to keep registration cheap
+    if not rects:
+        return 1
+    mean_w = sum(r.w for r in rects) / len(rects)
+    mean_h = sum(r.h for r in rects) / len(rects)
+    return int(min(max(min(W / mean_w, H / mean_h), 1), 32))
+
+
+def maxrects_pack(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    rule: str = "best_short_side",
+    order: str = "decreasing_area",
+    count_only: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """
+    MaxRects heuristic (no rotation) with all bins kept open.
+    rule (free rectangle choice inside a bin; r goes to its bottom-left corner):
+      - 'best_short_side': minimizes min(fr.w-r.w, fr.h-r.h), then the long side
+      - 'best_area'      : minimizes fr.w*fr.h - r.w*r.h, then the short side
+      - 'bottom_left'    : minimizes the top edge y + r.h, then x
+      - 'contact_point'  : maximizes the perimeter touching the bin or placed rects
+    order: 'input' | 'decreasing_area' | 'decreasing_maxside'
+    Each rectangle goes to the first open bin that fits it (bins whose
+    largest free width/height/area cannot fit it are skipped via a
+    BinSummaryTree); a new bin is opened only if none does.
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unknown rule: {rule}")
+    items = validate_rects(rects, W, H)[:]
+    if order == "decreasing_area":
+        items.sort(key=lambda r: r.w * r.h, reverse=True)
+    elif order == "decreasing_maxside":
+        items.sort(key=lambda r: max(r.w, r.h), reverse=True)
+    elif order != "input":
+        raise ValueError(f"Unknown order: {order}")
+
+    cells = _grid_cells(items, W, H)
+    track_placed = rule == "contact_point"
+    bins: List[MaxRectsBin] = []
+    cols = PlacementColumns()
+    areas: List[float] = []
+    summary = BinSummaryTree(size_hint=len(items))
+
+    for r in items:
+        b = rid = None
+        for cand in summary.candidates(r):
+            rid = bins[cand].find(r, rule)
+            if rid is not None:
+                b = cand
+                break
+        if b is None:
+            b = len(bins)
+            bins.append(MaxRectsBin(W, H, cells=cells, track_placed=track_placed))
+            areas.append(0.0)
+            rid = bins[b].find(r, rule)
+
+        mb = bins[b]
+        x, y = mb.place(r, rid)
+        if not count_only:
+            cols.append(r, b, x, y)
+        areas[b] += r.w * r.h
+        summary.update(b, mb.max_w, mb.max_h, mb.max_area)
+
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return cols.result(len(areas))
@@ -1,31 +1,71 @@
 from __future__ import annotations
 from typing import List
-from apsuite.packing2d.types import Rect, Bin2D, Packing2DResult
+
+import numpy as np
+
+from apsuite.common.types import BinCountResult
+from apsuite.packing1d.capacity_index import BestFitIndex, FirstFitTree
+from apsuite.packing2d.types import Rect, Packing2DResult
 from apsuite.packing2d.validate import validate_rects
 
-def shelf_pack(rects: List[Rect], W: float, H: float, decreasing_height: bool = True) -> Packing2DResult:
-    rects = validate_rects(rects, W, H)
-    items = rects[:]
+def _orient(rects: List[Rect], W: float, H: float, stand_up: bool) -> List[Rect]:
+    """
+    Orientation for shelf packing with rotation, decided for all rectangles
+    at once on NumPy arrays: rotate a rectangle when it only fits rotated,
+    and (stand_up=True) when rotating puts its longer side upright.
+    """
+    if not rects:
+        return rects
+    w = np.fromiter((r.w for r in rects), dtype=np.float64, count=len(rects))
+    h = np.fromiter((r.h for r in rects), dtype=np.float64, count=len(rects))
+    rotate = (w > W) | (h > H)
+    if stand_up:
+        rotate |= (w > h) & (h <= W) & (w <= H)
+    return [
+        Rect(w=r.h, h=r.w, id=r.id) if rot else r
+        for r, rot in zip(rects, rotate.tolist())
+    ]
+
+def shelf_pack(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    decreasing_height: bool = True,
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """
+    Next-Fit shelf packing. count_only=True skips the placement lists and
+    returns a BinCountResult with the used area per bin. allow_rotation=True
+    stands rectangles up first (longer side vertical: narrower items fill
+    the Next-Fit shelves better); placements hold the rotated Rect.
+    """
+    rects = validate_rects(rects, W, H, allow_rotation=allow_rotation)
+    items = _orient(rects, W, H, stand_up=True) if allow_rotation else rects[:]
     if decreasing_height:
         items.sort(key=lambda r: r.h, reverse=True)
 
-    bins: List[Bin2D] = []
-    cur_bin: List[tuple] = []
+    # per-placement columns (rects are placed in `items` order)
+    col_bin: List[int] = []
+    col_x: List[float] = []
+    col_y: List[float] = []
+    areas: List[float] = []
+    cur_area = 0.0
+    cur_count = 0
     x = 0.0
     y = 0.0
     shelf_h = 0.0
 
     def new_bin():
-        nonlocal cur_bin, x, y, shelf_h
-        if cur_bin:
-            bins.append(Bin2D(placements=cur_bin))
-        cur_bin = []
+        nonlocal cur_area, cur_count, x, y, shelf_h
+        if cur_count:
+            areas.append(cur_area)
+        cur_area = 0.0
+        cur_count = 0
         x = 0.0
         y = 0.0
         shelf_h = 0.0
 
-    new_bin()  # initialize empty bin state
-
     for r in items:
         # Start new shelf if doesn't fit in current row
         if x + r.w > W:
@@ -38,12 +78,108 @@ def shelf_pack(rects: List[Rect], W: float, H: float, decreasing_height: bool =
             new_bin()
 
         # Place rectangle
-        cur_bin.append((r, x, y))
+        if not count_only:
+            col_bin.append(len(areas))
+            col_x.append(x)
+            col_y.append(y)
+        cur_area += r.w * r.h
+        cur_count += 1
         x += r.w
         shelf_h = max(shelf_h, r.h)
 
     # push last bin
-    if cur_bin:
-        bins.append(Bin2D(placements=cur_bin))
+    new_bin()
+
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return Packing2DResult.from_columns(
+        items, col_bin, col_x, col_y, num_bins=len(areas)
+    )
+
+SHELF_FITS = ("first_fit", "best_fit")
+
+
+def open_shelf_pack(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    fit: str = "first_fit",
+    count_only: bool = False,
+    allow_rotation: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """
+    Decreasing-height shelf packing with every shelf kept open.
+
+    Rectangles (sorted by decreasing height) go to the first shelf
+    (fit='first_fit', FFDH) or the tightest shelf (fit='best_fit', BFDH)
+    with enough remaining width; a shelf is as high as its first rectangle.
+    Shelves are then packed into bins by First Fit Decreasing on their
+    heights. Remaining shelf widths and bin heights are held in the 1D
+    FirstFitTree / BestFitIndex, so each lookup is O(log shelves).
+    allow_rotation=True only rotates rectangles that do not fit upright:
+    with all shelves open, the given orientation packed better than
+    standing up or laying flat every rectangle.
+    """
+    if fit not in SHELF_FITS:
+        raise ValueError(f"Unknown fit: {fit}")
+    rects = validate_rects(rects, W, H, allow_rotation=allow_rotation)
+    if allow_rotation:
+        rects = _orient(rects, W, H, stand_up=False)
+    items = sorted(rects, key=lambda r: r.h, reverse=True)
+
+    shelf_h: List[float] = []
+    shelf_x: List[float] = []   # next free x per shelf
+    shelf_area: List[float] = []
+    item_shelf: List[int] = []
+    item_x: List[float] = []
+    ff = FirstFitTree(W, size_hint=len(items)) if fit == "first_fit" else None
+    bf = BestFitIndex(W) if fit == "best_fit" else None
+
+    for r in items:
+        if ff is not None:
+            s = ff.insert(r.w)
+        else:
+            s = bf.find(r.w)
+            if s is None:
+                s = bf.open(W - r.w)
+            else:
+                bf.update(s, bf.remaining(s) - r.w)
+        if s == len(shelf_h):
+            shelf_h.append(r.h)
+            shelf_x.append(0.0)
+            shelf_area.append(0.0)
+        if not count_only:
+            item_shelf.append(s)
+            item_x.append(shelf_x[s])
+        shelf_x[s] += r.w
+        shelf_area[s] += r.w * r.h
+
+    # shelves were opened in non-increasing height order: First Fit on them is FFD
+    bin_tree = FirstFitTree(H, size_hint=len(shelf_h))
+    shelf_bin: List[int] = []
+    shelf_y: List[float] = []
+    bin_y: List[float] = []
+    areas: List[float] = []
+    for h, a in zip(shelf_h, shelf_area):
+        b = bin_tree.insert(h)
+        if b == len(bin_y):
+            bin_y.append(0.0)
+            areas.append(0.0)
+        shelf_bin.append(b)
+        shelf_y.append(bin_y[b])
+        bin_y[b] += h
+        areas[b] += a
 
-    return Packing2DResult(bins=bins)
\ No newline at end of file
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return Packing2DResult.from_columns(
+        items,
+        [shelf_bin[s] for s in item_shelf],
+        item_x,
+        [shelf_y[s] for s in item_shelf],
+        num_bins=len(areas),
+    )
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from apsuite.common.types import BinCountResult
+from apsuite.packing2d.free_rect_index import FreeRect, FreeRectIndex, split_guillotine
+from apsuite.packing2d.types import Packing2DResult, PlacementColumns, Rect
+from apsuite.packing2d.validate import validate_rects
+
+RULES = ("bottom_left", "min_waste")
+
+_EPS = 1e-12
+
+
+class Skyline:
+    """
+    Skyline of one bin: segments [xs[i], xs[i+1]) at height ys[i], left to
+    right, covering [0, W]. Neighbouring segments never share a height.
+
+    Candidate positions are segment starts. They are also kept in a sorted
+    (height, x) key list, so the bottom-left search visits starts from the
+    lowest segment upwards and stops once a segment's own height already
+    puts the rectangle above the best top found; computing the resting
+    height of a start only walks the segments under the rectangle.
+
+    Cost per rectangle with s segments, k of them under the rectangle:
+    bottom_left is O(s * k) in the worst case (the height cutoff usually
+    stops it after a few starts), min_waste scores every start, O(s * k);
+    placing rewrites the plain lists in O(s). This is not a logarithmic
+    structure: a sublinear search would need range-max queries over a
+    balanced tree of segments, which does not pay off at the dozen or so
+    segments a bin's skyline reaches on the bundled instance generators.
+    """
+
+    def __init__(self, W: float, H: float):
+        self.W = float(W)
+        self.H = float(H)
+        self.xs: List[float] = [0.0]
+        self.ys: List[float] = [0.0]
+        self._by_y: List[Tuple[float, float]] = [(0.0, 0.0)]
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def _end(self, i: int) -> float:
+        return self.xs[i + 1] if i + 1 < len(self.xs) else self.W
+
+    def _rest(self, i: int, w: float, h: float, limit: float) -> Optional[float]:
+        """Height at which a w-wide rectangle rests when its left edge is xs[i]
+        (None if it sticks out of the bin or its top would exceed limit)."""
+        xe = self.xs[i] + w
+        if xe > self.W + _EPS:
+            return None
+        y = 0.0
+        j = i
+        while j < len(self.xs) and self.xs[j] < xe - _EPS:
+            if self.ys[j] > y:
+                y = self.ys[j]
+                if y + h > limit:
+                    return None
+            j += 1
+        return y
+
+    def _waste(self, i: int, w: float, y: float) -> float:
+        xe = self.xs[i] + w
+        waste = 0.0
+        j = i
+        while j < len(self.xs) and self.xs[j] < xe - _EPS:
+            waste += (min(self._end(j), xe) - self.xs[j]) * (y - self.ys[j])
+            j += 1
+        return waste
+
+    def find(self, r: Rect, rule: str) -> Optional[Tuple[int, float]]:
+        """(segment index, resting y) for r under rule, or None if it does not fit."""
+        best: Optional[Tuple[float, ...]] = None
+        best_pos: Optional[Tuple[int, float]] = None
+        if rule == "bottom_left":
+            # key (top, x); a segment's height bounds the top from below
+            for seg_y, x in self._by_y:
+                if best is not None and seg_y + r.h > best[0]:
+                    break
+                i = bisect_left(self.xs, x)
+                limit = self.H + _EPS if best is None else best[0]
+                y = self._rest(i, r.w, r.h, limit)
+                if y is None:
+                    continue
+                key = (y + r.h, x)
+                if best is None or key < best:
+                    best, best_pos = key, (i, y)
+            return best_pos
+        if rule == "min_waste":
+            # key (waste, top, x); waste is not monotone in the segment
+            # height, so every start is scored (zero waste ends the search
+            # once no lower top is possible)
+            for seg_y, x in self._by_y:
+                if best is not None and best[0] <= 0.0 and seg_y + r.h > best[1]:
+                    break
+                i = bisect_left(self.xs, x)
+                y = self._rest(i, r.w, r.h, self.H + _EPS)
+                if y is None:
+                    continue
+                key = (self._waste(i, r.w, y), y + r.h, x)
+                if best is None or key < best:
+                    best, best_pos = key, (i, y)
+            return best_pos
+        raise ValueError(f"Unknown rule: {rule}")
+
+    def _insert(self, k: int, x: float, y: float) -> None:
+        self.xs.insert(k, x)
+        self.ys.insert(k, y)
+        insort(self._by_y, (y, x))
+
+    def _delete(self, k: int) -> None:
+        x, y = self.xs.pop(k), self.ys.pop(k)
+        del self._by_y[bisect_left(self._by_y, (y, x))]
+
+    def place(self, i: int, w: float, h: float, y: float) -> List[FreeRect]:
+        """
+        Raise [xs[i], xs[i] + w) to y + h; returns the gaps left below the
+        rectangle (the waste) as free rectangles.
+        """
+        x = self.xs[i]
+        xe = x + w
+        top = y + h
+        gaps: List[FreeRect] = []
+        j = i
+        while j < len(self.xs) and self.xs[j] < xe - _EPS:
+            j += 1
+        # segments i..j-1 lie under the rectangle; the last may stick out
+        tail_h = self.ys[j - 1]
+        tail = self._end(j - 1) > xe + _EPS
+        for k in range(i, j):
+            gw = min(self._end(k), xe) - self.xs[k]
+            if y - self.ys[k] > _EPS:
+                gaps.append(FreeRect(self.xs[k], self.ys[k], gw, y - self.ys[k]))
+        for _ in range(i, j):
+            self._delete(i)
+        if tail:
+            self._insert(i, xe, tail_h)
+        self._insert(i, x, top)
+        # merge equal heights with the neighbours
+        if i + 1 < len(self.xs) and self.ys[i + 1] == top:
+            self._delete(i + 1)
+        if i > 0 and self.ys[i - 1] == top:
+            self._delete(i)
+        return gaps
+
+
+def skyline_pack(
+    rects: List[Rect],
+    W: float,
+    H: float,
+    rule: str = "bottom_left",
+    order: str = "decreasing_height",
+    waste_map: bool = True,
+    count_only: bool = False,
+) -> Packing2DResult | BinCountResult:
+    """
+    Skyline heuristic (no rotation), one open bin at a time like shelf_pack.
+    rule:
+      - 'bottom_left': lowest top edge, then leftmost
+      - 'min_waste'  : least area trapped below the rectangle, then bottom-left
+    order: 'input' | 'decreasing_height' | 'decreasing_area' | 'decreasing_maxside'
+    waste_map=True keeps the gaps trapped below the skyline in a
+    FreeRectIndex and tries them first (best area fit, guillotine split).
+    count_only=True returns a BinCountResult with the used area per bin.
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unknown rule: {rule}")
+    items = validate_rects(rects, W, H)[:]
+    if order == "decreasing_height":
+        items.sort(key=lambda r: r.h, reverse=True)
+    elif order == "decreasing_area":
+        items.sort(key=lambda r: r.w * r.h, reverse=True)
+    elif order == "decreasing_maxside":
+        items.sort(key=lambda r: max(r.w, r.h), reverse=True)
+    elif order != "input":
+        raise ValueError(f"Unknown order: {order}")
+
+    areas: List[float] = []
+    cols = PlacementColumns()
+    area = 0.0
+    sky = Skyline(W, H)
+    waste = FreeRectIndex(W, H)
+    waste.clear()
+
+    for r in items:
+        if waste_map and len(waste):
+            seq = waste.best(r, "best_area_fit")
+            if seq is not None:
+                fr = waste[seq]
+                if not count_only:
+                    cols.append(r, len(areas), fr.x, fr.y)
+                area += r.w * r.h
+                waste.replace(seq, split_guillotine(fr, r))
+                continue
+
+        pos = sky.find(r, rule)
+        if pos is None:
+            # nothing fits: close the bin; r rests on the floor of a new one
+            areas.append(area)
+            area = 0.0
+            sky = Skyline(W, H)
+            waste.clear()
+            pos = (0, 0.0)
+
+        i, y = pos
+        x = sky.xs[i]
+        if not count_only:
+            cols.append(r, len(areas), x, y)
+        area += r.w * r.h
+        gaps = sky.place(i, r.w, r.h, y)
+        if waste_map:
+            for g in gaps:
+                waste.add(g)
+
+    if items:
+        areas.append(area)
+
+    if count_only:
+        return BinCountResult(
+            num_bins=len(areas), bin_loads=np.asarray(areas, dtype=np.float64)
+        )
+    return cols.result(len(areas))
@@ -1,22 +1,132 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import cached_property
+from typing import List, Optional, Sequence, Tuple
 
-@dataclass(frozen=True)
+import numpy as np
+
+@dataclass(frozen=True, slots=True)
 class Rect:
     w: float
     h: float
     id: Optional[int] = None  # optional identifier
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bin2D:
     # list of placed rectangles: (rect, x, y)
     placements: List[Tuple[Rect, float, float]]
 
-@dataclass(frozen=True)
+# One row per placed rectangle; id is Rect.id (-1 if unset), w/h as placed.
+PLACEMENT_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("bin", np.int32),
+    ("x", np.float64),
+    ("y", np.float64),
+    ("w", np.float64),
+    ("h", np.float64),
+])
+
+@dataclass(frozen=True, eq=False, init=False)
 class Packing2DResult:
-    bins: List[Bin2D]
+    # layout is a PLACEMENT_DTYPE array in placement order; rects[i] is the
+    # (possibly rotated) Rect of row i and only backs the nested `bins` view.
+    layout: np.ndarray
+    rects: List[Rect]
+    num_bins: int
+
+    def __init__(
+        self,
+        layout: Optional[np.ndarray] = None,
+        rects: Optional[List[Rect]] = None,
+        num_bins: Optional[int] = None,
+        *,
+        bins: Optional[Sequence[Bin2D]] = None,
+    ):
+        # Packing2DResult(bins=...) is the list-of-Bin2D form of earlier versions
+        if bins is not None:
+            if layout is not None or rects is not None or num_bins is not None:
+                raise TypeError(
+                    "Packing2DResult takes either bins or layout/rects/num_bins"
+                )
+            columnar = Packing2DResult.from_bins(bins)
+            layout, rects, num_bins = columnar.layout, columnar.rects, columnar.num_bins
+        elif layout is None or rects is None or num_bins is None:
+            raise TypeError(
+                "Packing2DResult needs layout, rects and num_bins (or bins=)"
+            )
+        object.__setattr__(self, "layout", layout)
+        object.__setattr__(self, "rects", rects)
+        object.__setattr__(self, "num_bins", num_bins)
+
+    @classmethod
+    def from_columns(
+        cls,
+        rects: Sequence[Rect],
+        bins: Sequence[int] | np.ndarray,
+        xs: Sequence[float] | np.ndarray,
+        ys: Sequence[float] | np.ndarray,
+        num_bins: Optional[int] = None,
+    ) -> "Packing2DResult":
+        """Build the columnar result from per-placement columns."""
+        n = len(rects)
+        layout = np.empty(n, dtype=PLACEMENT_DTYPE)
+        layout["id"] = np.fromiter(
+            (-1 if r.id is None else r.id for r in rects), dtype=np.int64, count=n
+        )
+        layout["bin"] = bins
+        layout["x"] = xs
+        layout["y"] = ys
+        layout["w"] = np.fromiter((r.w for r in rects), dtype=np.float64, count=n)
+        layout["h"] = np.fromiter((r.h for r in rects), dtype=np.float64, count=n)
+        if num_bins is None:
+            num_bins = int(layout["bin"].max()) + 1 if n else 0
+        return cls(layout=layout, rects=list(rects), num_bins=num_bins)
+
+    @classmethod
+    def from_bins(cls, bins: Sequence[Bin2D]) -> "Packing2DResult":
+        """Build the columnar result from the list-of-Bin2D representation."""
+        rows = [
+            (r, b, x, y) for b, bin_ in enumerate(bins) for r, x, y in bin_.placements
+        ]
+        return cls.from_columns(
+            [r for r, _, _, _ in rows],
+            [b for _, b, _, _ in rows],
+            [x for _, _, x, _ in rows],
+            [y for _, _, _, y in rows],
+            num_bins=len(bins),
+        )
+
+    @cached_property
+    def bins(self) -> List[Bin2D]:
+        # materialized lazily for callers that still need the nested view
+        placements: List[List[Tuple[Rect, float, float]]] = [
+            [] for _ in range(self.num_bins)
+        ]
+        layout = self.layout
+        columns = (layout["bin"].tolist(), layout["x"].tolist(), layout["y"].tolist())
+        for r, b, x, y in zip(self.rects, *columns):
+            placements[b].append((r, x, y))
+        return [Bin2D(placements=p) for p in placements]
+
+
+class PlacementColumns:
+    """Append-only per-placement columns, turned into a Packing2DResult at the end."""
+
+    __slots__ = ("rects", "bins", "xs", "ys")
+
+    def __init__(self):
+        self.rects: List[Rect] = []
+        self.bins: List[int] = []
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+
+    def append(self, r: Rect, b: int, x: float, y: float) -> None:
+        self.rects.append(r)
+        self.bins.append(b)
+        self.xs.append(x)
+        self.ys.append(y)
 
-    @property
-    def num_bins(self) -> int:
-        return len(self.bins)
\ No newline at end of file
+    def result(self, num_bins: int) -> Packing2DResult:
+        return Packing2DResult.from_columns(
+            self.rects, self.bins, self.xs, self.ys, num_bins=num_bins
+        )
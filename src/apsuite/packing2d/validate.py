@@ -1,14 +1,104 @@
 from __future__ import annotations
-from typing import Iterable, List
-from apsuite.packing2d.types import Rect
+from bisect import bisect_left
+from heapq import heappop, heappush
+from typing import Iterable, List, Sequence, Tuple
 
-def validate_rects(rects: Iterable[Rect], W: float, H: float) -> List[Rect]:
+import numpy as np
+
+from apsuite.packing2d.types import Packing2DResult, Rect
+
+def fits_bin(r: Rect, W: float, H: float, allow_rotation: bool = False) -> bool:
+    return (r.w <= W and r.h <= H) or (allow_rotation and r.h <= W and r.w <= H)
+
+def validate_rects(
+    rects: Iterable[Rect], W: float, H: float, allow_rotation: bool = False
+) -> List[Rect]:
     if W <= 0 or H <= 0:
         raise ValueError("Bin dimensions must be > 0")
     rects = list(rects)
     for r in rects:
         if r.w <= 0 or r.h <= 0:
             raise ValueError(f"Rectangle must have positive size: {r}")
-        if r.w > W or r.h > H:
+        if not fits_bin(r, W, H, allow_rotation):
             raise ValueError(f"Rectangle {r} does not fit in bin ({W}, {H})")
-    return rects
\ No newline at end of file
+    return rects
+
+def _rect_keys(
+    ids: np.ndarray, w: np.ndarray, h: np.ndarray, allow_rotation: bool
+) -> np.ndarray:
+    if allow_rotation:
+        w, h = np.minimum(w, h), np.maximum(w, h)
+    keys = np.empty(
+        ids.size, dtype=[("id", np.int64), ("w", np.float64), ("h", np.float64)]
+    )
+    keys["id"], keys["w"], keys["h"] = ids, w, h
+    return np.sort(keys, order=("id", "w", "h"))
+
+def verify_packing(
+    result: Packing2DResult,
+    rects: Sequence[Rect],
+    W: float,
+    H: float,
+    allow_rotation: bool = False,
+    tol: float = 1e-9,
+) -> None:
+    """
+    Raise ValueError unless result is a feasible packing of rects:
+      - every input rectangle is placed exactly once (matched by id and
+        size, sides in either order if allow_rotation),
+      - every placement lies inside its bin (within tol),
+      - no two placements in the same bin overlap by more than tol.
+    Overlaps are found with one sweep over (bin, x): placements whose x-span
+    covers the sweep position are kept in a y-sorted list. That list never
+    holds two overlapping intervals (the first overlap is reported), so a
+    new interval only needs comparing with its two neighbours and the sweep
+    takes O(n log n) comparisons.
+    """
+    layout = result.layout
+    n = len(rects)
+    ids = np.fromiter(
+        (-1 if r.id is None else r.id for r in rects), dtype=np.int64, count=n
+    )
+    w = np.fromiter((r.w for r in rects), dtype=np.float64, count=n)
+    h = np.fromiter((r.h for r in rects), dtype=np.float64, count=n)
+    if layout.size != n or not np.array_equal(
+        _rect_keys(ids, w, h, allow_rotation),
+        _rect_keys(layout["id"], layout["w"], layout["h"], allow_rotation),
+    ):
+        raise ValueError(
+            f"Placed rectangles do not match the input "
+            f"({layout.size} placed, {n} given)"
+        )
+
+    b, x, y = layout["bin"], layout["x"], layout["y"]
+    x1, y1 = x + layout["w"], y + layout["h"]
+    bad = (
+        (b < 0) | (b >= result.num_bins)
+        | (x < -tol) | (y < -tol) | (x1 > W + tol) | (y1 > H + tol)
+    )
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"Placement {layout[i]} lies outside bin ({W}, {H})")
+
+    order = np.lexsort((x, b)).tolist()
+    b, x, y, x1, y1 = b.tolist(), x.tolist(), y.tolist(), x1.tolist(), y1.tolist()
+    active: List[Tuple[float, float, int]] = []  # (y, y1, i), sorted by y
+    ends: List[Tuple[float, int]] = []           # heap of (x1, i) for active
+    cur = None
+    for i in order:
+        if b[i] != cur:
+            cur = b[i]
+            active, ends = [], []
+        while ends and ends[0][0] <= x[i] + tol:
+            j = heappop(ends)[1]
+            del active[bisect_left(active, (y[j], y1[j], j))]
+        k = bisect_left(active, (y[i], y1[i], i))
+        below = active[k - 1][2] if k else None
+        above = active[k][2] if k < len(active) else None
+        for j in (below, above):
+            if j is not None and min(y1[i], y1[j]) - max(y[i], y[j]) > tol:
+                raise ValueError(
+                    f"Placements {layout[j]} and {layout[i]} overlap in bin {cur}"
+                )
+        active.insert(k, (y[i], y1[i], i))
+        heappush(ends, (x1[i], i))
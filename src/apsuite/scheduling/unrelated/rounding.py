@@ -3,6 +3,9 @@ from __future__ import annotations
 import time
 import numpy as np
 
+from apsuite.common import kernels
+from apsuite.common.backend import use_kernels
+
 
 def makespan_from_assignment(p: np.ndarray, assignment: list[int]) -> float:
     p = np.asarray(p, dtype=float)
@@ -25,6 +28,11 @@ def round_by_argmax_with_load_tiebreak(x: np.ndarray, p: np.ndarray) -> list[int
     if x.shape != (m, n):
         raise ValueError(f"x must have shape {(m, n)}")
 
+    if use_kernels():
+        return kernels.round_argmax_kernel(
+            np.ascontiguousarray(x), np.ascontiguousarray(p)
+        ).tolist()
+
     loads = np.zeros(m, dtype=float)
     assignment = [-1] * n
 
@@ -67,6 +75,17 @@ def local_improve_single_moves(
     for j, i in enumerate(a):
         loads[i] += p[i, j]
 
+    if use_kernels():
+        # compiled passes; the time limit is checked between passes
+        a_arr = np.asarray(a, dtype=np.int64)
+        p_c = np.ascontiguousarray(p)
+        for _ in range(max_passes):
+            if time.perf_counter() - start > time_limit_s:
+                break
+            if not kernels.single_moves_pass_kernel(a_arr, loads, p_c):
+                break
+        return a_arr.tolist()
+
     for _ in range(max_passes):
         if time.perf_counter() - start > time_limit_s:
             break
@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from apsuite.common.backend import BACKENDS, NUMBA_AVAILABLE, using_backend
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _reference_backend():
+    # run on the pure-Python engines unless APSUITE_BACKEND picks a backend;
+    # the compiled kernels are covered by test_kernels and `any_backend`
+    with using_backend(None if "APSUITE_BACKEND" in os.environ else "python"):
+        yield
+
+
+@pytest.fixture
+def python_backend():
+    # compare the engines themselves, not the compiled kernel both would use
+    with using_backend("python"):
+        yield
+
+
+@pytest.fixture(params=BACKENDS)
+def any_backend(request):
+    if request.param == "numba" and not NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    with using_backend(request.param) as active:
+        yield active
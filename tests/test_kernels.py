@@ -0,0 +1,101 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from apsuite.common import backend, kernels
+from apsuite.packing1d.algorithms import best_fit, first_fit
+from apsuite.packing2d.guillotine import _guillotine_pack_kernel, guillotine_pack
+from apsuite.packing2d.instances import Instance2DSpec, generate_rectangles
+from apsuite.scheduling.unrelated.rounding import (
+    local_improve_single_moves,
+    round_by_argmax_with_load_tiebreak,
+)
+
+# The kernels run as plain Python when numba is missing, so they are checked
+# against the reference implementations either way.
+
+def test_packing1d_kernels_match_reference(python_backend):
+    rng = np.random.default_rng(0)
+    items = rng.uniform(0.05, 0.7, size=400)
+    pairs = ((kernels.first_fit_kernel, first_fit), (kernels.best_fit_kernel, best_fit))
+    for kernel, ref in pairs:
+        assign, loads, num_bins = kernel(items, 1.0)
+        res = ref(items, engine="linear")
+        assert num_bins == res.num_bins
+        assert assign.tolist() == res.assignment.tolist()
+        assert loads.tolist() == res.loads
+
+def test_packing1d_kernels_skip_assignment_when_not_tracking():
+    items = np.random.default_rng(2).uniform(0.05, 0.7, size=200)
+    for kernel in (kernels.first_fit_kernel, kernels.best_fit_kernel):
+        assign, loads, num_bins = kernel(items, 1.0, False)
+        _, full_loads, full_bins = kernel(items, 1.0)
+        assert assign.shape == (0,)
+        assert num_bins == full_bins and loads.tolist() == full_loads.tolist()
+
+def test_best_fit_kernel_breaks_ties_like_the_index(python_backend):
+    # tenths leave many bins with equal remaining and remaining-after values
+    # that round alike; decreasing sizes open bins in key order
+    rng = np.random.default_rng(1)
+    tenths = rng.integers(1, 10, 3000) / 10
+    decreasing = np.sort(rng.uniform(0.05, 0.6, 3000))[::-1].copy()
+    for items in (tenths, decreasing):
+        assign, loads, num_bins = kernels.best_fit_kernel(items, 1.0)
+        res = best_fit(items, engine="indexed")
+        assert num_bins == res.num_bins
+        assert assign.tolist() == res.assignment.tolist()
+        assert loads.tolist() == res.loads
+
+@pytest.mark.parametrize("score", ["best_area_fit", "best_short_side"])
+def test_guillotine_kernel_matches_reference(python_backend, score):
+    rects = generate_rectangles(
+        Instance2DSpec(name="t", n=150, dist="uniform", seed=3, W=1.0, H=1.0)
+    )
+    ref = guillotine_pack(rects, 1.0, 1.0, order="input", score=score)
+    got = _guillotine_pack_kernel(list(rects), 1.0, 1.0, score)
+    assert got.num_bins == ref.num_bins
+    assert [b.placements for b in got.bins] == [b.placements for b in ref.bins]
+
+    ref = guillotine_pack(
+        rects, 1.0, 1.0, order="input", score=score, allow_rotation=True
+    )
+    got = _guillotine_pack_kernel(list(rects), 1.0, 1.0, score, allow_rotation=True)
+    assert [b.placements for b in got.bins] == [b.placements for b in ref.bins]
+
+def test_rounding_kernels_match_reference(python_backend):
+    rng = np.random.default_rng(1)
+    p = rng.uniform(1, 10, size=(5, 40))
+    x = rng.dirichlet(np.ones(5), size=40).T
+    x[:, :5] = 0.5  # exact ties resolved by load
+    ref = round_by_argmax_with_load_tiebreak(x, p)
+    assert kernels.round_argmax_kernel(x, p).tolist() == ref
+
+    improved = local_improve_single_moves(ref, p, max_passes=5, time_limit_s=10.0)
+    a = np.asarray(ref, dtype=np.int64)
+    loads = np.zeros(5)
+    for j, i in enumerate(ref):
+        loads[i] += p[i, j]
+    for _ in range(5):
+        if not kernels.single_moves_pass_kernel(a, loads, p):
+            break
+    assert a.tolist() == improved
+
+def test_set_backend_fallback(python_backend):
+    with pytest.raises(ValueError):
+        backend.set_backend("cuda")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        active = backend.set_backend("numba")
+    assert active == ("numba" if backend.NUMBA_AVAILABLE else "python")
+
+def test_using_backend_restores_previous_backend():
+    before = backend.get_backend()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with backend.using_backend("numba"):
+            with backend.using_backend("python") as active:
+                assert active == "python" and not backend.use_kernels()
+    assert backend.get_backend() == before
+    with backend.using_backend(None) as active:
+        assert active == before
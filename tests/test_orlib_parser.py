@@ -1,5 +1,12 @@
 from pathlib import Path
-from apsuite.packing1d.orlib_parser import load_orlib_file
+
+from apsuite.packing1d.orlib_parser import (
+    classify_instance,
+    iter_orlib_dir,
+    load_orlib_dir,
+    load_orlib_file,
+)
+
 
 def test_orlib_parser_reads_first_file_if_present():
     p = Path("data/raw/orlib_1d/binpack1.txt")
@@ -10,4 +17,19 @@ def test_orlib_parser_reads_first_file_if_present():
     inst0 = instances[0]
     assert inst0.capacity == 1.0
     assert len(inst0.items) > 0
-    assert all(0 < x <= 1.0 for x in inst0.items)
\ No newline at end of file
+    assert all(0 < x <= 1.0 for x in inst0.items)
+
+def test_iter_orlib_dir_filters_lazily(tmp_path):
+    (tmp_path / "binpack1.txt").write_text(
+        "2\nu1\n100 3 2\n50\n60 40\nt1\n100 3 1\n20\n30\n50\n"
+    )
+    (tmp_path / "binpack2.txt").write_text("1\nu2\n10 2 1\n4\n6\n")
+
+    it = iter_orlib_dir(tmp_path, classes={"uniform"})
+    first = next(it)
+    assert (first.name, first.items) == ("u1", [0.5, 0.6, 0.4])
+    assert [inst.name for inst in it] == ["u2"]
+
+    assert [i.name for i in iter_orlib_dir(tmp_path, names={"t1"})] == ["t1"]
+    assert [i.name for i in load_orlib_dir(tmp_path)] == ["u1", "t1", "u2"]
+    assert classify_instance("t1") == "triplets"
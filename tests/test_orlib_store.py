@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pytest
+
+from apsuite.packing1d.orlib_parser import load_orlib_file
+from apsuite.packing1d.orlib_store import (
+    InstanceStore,
+    convert_orlib_dir,
+    load_orlib_cached,
+)
+
+ORLIB_TEXT = """2
+ u_a
+ 150 5 2
+ 60
+ 50
+ 40
+ 70 30
+ v_b
+ 100 3 2
+ 50
+ 60
+ 40
+"""
+
+def _write(tmp_path, name="binpack1.txt", text=ORLIB_TEXT):
+    p = tmp_path / name
+    p.write_text(text)
+    return p
+
+def test_store_roundtrip_matches_parser(tmp_path):
+    src = _write(tmp_path)
+    store = InstanceStore(convert_orlib_dir(tmp_path, tmp_path / "store"))
+    ref = load_orlib_file(src, normalize_capacity=True)
+    assert len(store) == len(ref) == 2
+    for got, exp in zip(store, ref):
+        assert (got.name, got.source, got.capacity, got.best_known_bins) == (
+            exp.name, exp.source, exp.capacity, exp.best_known_bins)
+        assert got.items.tolist() == exp.items
+    raw = InstanceStore(tmp_path / "store", normalize_capacity=False)["v_b"]
+    assert raw.capacity == 100.0 and raw.items.tolist() == [50.0, 60.0, 40.0]
+    assert isinstance(raw.items.base, np.memmap) or isinstance(raw.items, np.memmap)
+
+def test_cached_store_rebuilds_when_stale(tmp_path):
+    src = _write(tmp_path)
+    store_dir = tmp_path / "cache"
+    assert load_orlib_cached(tmp_path, store_dir).names == ["u_a", "v_b"]
+
+    src.write_text(ORLIB_TEXT.replace("u_a", "u_c"))
+    later = os.stat(store_dir / "index.npz").st_mtime + 10
+    os.utime(src, (later, later))
+    assert load_orlib_cached(tmp_path, store_dir).names == ["u_c", "v_b"]
+
+def test_missing_store(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        InstanceStore(tmp_path)
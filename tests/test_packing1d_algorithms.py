@@ -1,10 +1,14 @@
+import pytest
+
 from apsuite.packing1d.algorithms import (
-    first_fit,
     best_fit,
-    first_fit_decreasing,
     best_fit_decreasing,
+    first_fit,
+    first_fit_decreasing,
 )
 
+pytestmark = pytest.mark.usefixtures("any_backend")
+
 def test_all_algorithms_respect_capacity():
     items = [0.51, 0.49, 0.7, 0.3, 0.3, 0.2]
     for alg in [first_fit, best_fit, first_fit_decreasing, best_fit_decreasing]:
@@ -16,4 +20,14 @@ def test_decreasing_not_worse_on_simple_case():
     items = [0.4, 0.4, 0.4, 0.6, 0.6]
     ff = first_fit(items).num_bins
     ffd = first_fit_decreasing(items).num_bins
-    assert ffd <= ff
\ No newline at end of file
+    assert ffd <= ff
+
+def test_count_only_matches_full_result():
+    items = [0.51, 0.49, 0.7, 0.3, 0.3, 0.2, 0.45, 0.05, 0.9]
+    for alg in [first_fit, best_fit, first_fit_decreasing, best_fit_decreasing]:
+        for engine in ("indexed", "linear"):
+            full = alg(items, capacity=1.0, engine=engine)
+            counted = alg(items, capacity=1.0, engine=engine, count_only=True)
+            assert counted.num_bins == full.num_bins
+            assert counted.loads == full.loads
+            assert not hasattr(counted, "bins")
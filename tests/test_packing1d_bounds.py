@@ -1,8 +1,50 @@
-from apsuite.packing1d.lower_bounds import volume_lower_bound
+import numpy as np
+
+from apsuite.packing1d.algorithms import first_fit_decreasing
+from apsuite.packing1d.lower_bounds import (
+    combined_lower_bound,
+    dff_lower_bound,
+    martello_toth_l2,
+    volume_lower_bound,
+)
+
 
 def test_volume_lb_basic():
     items = [0.5, 0.7, 0.2, 0.4]
     assert volume_lower_bound(items) == 2  # sum=1.8 -> ceil=2
 
+def test_volume_lb_ignores_rounding_noise_above_an_integer():
+    items = [0.06, 0.47, 0.02, 0.31, 0.04, 0.1]
+    assert np.sum(items) > 1.0
+    assert first_fit_decreasing(items).num_bins == 1
+    assert volume_lower_bound(items) == 1
+    # beyond the 1e-9 slack the excess counts
+    assert volume_lower_bound([0.5, 0.5 + 2e-9]) == 2
+
 def test_volume_lb_empty():
-    assert volume_lower_bound([]) == 0
\ No newline at end of file
+    assert volume_lower_bound([]) == 0
+
+def test_l2_dominates_volume_bound():
+    # three items > C/2 that cannot take a 0.45 partner, plus three 0.45s
+    items = [0.6, 0.6, 0.6, 0.45, 0.45, 0.45]
+    assert volume_lower_bound(items) == 4
+    assert martello_toth_l2(items) == 5
+    assert combined_lower_bound(items) == 5
+
+
+def test_bounds_never_exceed_ffd():
+    rng = np.random.default_rng(7)
+    for dist_lo, dist_hi in [(0.05, 0.95), (0.2, 0.5), (0.3, 0.7)]:
+        items = rng.uniform(dist_lo, dist_hi, 300)
+        ffd = first_fit_decreasing(items).num_bins
+        assert volume_lower_bound(items) <= combined_lower_bound(items)
+        for bound in [martello_toth_l2, dff_lower_bound, combined_lower_bound]:
+            assert bound(items) <= ffd
+
+
+def test_dff_bound_beats_l2_on_items_just_above_one_third():
+    # at most two items of size 0.34 share a bin, so 5 of them need 3 bins
+    items = [0.34] * 5
+    assert volume_lower_bound(items) == 2
+    assert martello_toth_l2(items) == 2
+    assert dff_lower_bound(items) == 3
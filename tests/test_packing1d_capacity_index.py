@@ -0,0 +1,58 @@
+import numpy as np
+
+from apsuite.packing1d.algorithms import (
+    best_fit,
+    best_fit_decreasing,
+    first_fit,
+    first_fit_decreasing,
+)
+from apsuite.packing1d.capacity_index import BestFitIndex, FirstFitTree, SortedKeys
+
+
+def test_first_fit_tree_finds_leftmost_fitting_bin():
+    tree = FirstFitTree(capacity=1.0)
+    assert [tree.insert(x) for x in [0.6, 0.6, 0.3, 0.5, 0.1]] == [0, 1, 0, 2, 0]
+    assert tree.num_bins == 3
+    assert tree.find(0.35) == 1
+    assert tree.find(0.45) == 2
+
+
+def test_indexed_first_fit_matches_linear_engine(python_backend):
+    rng = np.random.default_rng(0)
+    for n in [1, 10, 257, 1000]:
+        items = rng.uniform(0.01, 0.7, n).tolist()
+        for alg in [first_fit, first_fit_decreasing]:
+            fast = alg(items, engine="indexed")
+            ref = alg(items, engine="linear")
+            assert fast.bins == ref.bins
+
+
+def test_best_fit_index_picks_tightest_bin_lowest_index_on_ties():
+    index = BestFitIndex(capacity=1.0)
+    assert [index.insert(x) for x in [0.6, 0.6, 0.7]] == [0, 1, 2]
+    assert index.find(0.25) == 2  # remaining 0.3 is the tightest fit
+    assert index.find(0.35) == 0  # bins 0 and 1 tie, lowest index wins
+    assert index.find(0.6) is None
+
+
+def test_indexed_best_fit_matches_linear_engine(python_backend):
+    rng = np.random.default_rng(1)
+    for n in [1, 10, 257, 1000]:
+        # coarse sizes create many exact ties in remaining capacity
+        items = (rng.integers(1, 40, n) / 50).tolist()
+        for alg in [best_fit, best_fit_decreasing]:
+            fast = alg(items, engine="indexed")
+            ref = alg(items, engine="linear")
+            assert fast.bins == ref.bins
+
+
+def test_best_fit_index_across_blocks_matches_linear_engine(
+    python_backend, monkeypatch
+):
+    # tiny blocks force splits and emptied blocks; 0.1-multiples leave many
+    # bins with equal remaining and remaining-after values that round alike
+    monkeypatch.setattr(SortedKeys, "LOAD", 4)
+    rng = np.random.default_rng(2)
+    items = (rng.integers(1, 10, 3000) / 10).tolist()
+    for alg in [best_fit, best_fit_decreasing]:
+        assert alg(items, engine="indexed").bins == alg(items, engine="linear").bins
@@ -0,0 +1,49 @@
+import numpy as np
+
+from apsuite.packing1d.algorithms import first_fit_decreasing
+from apsuite.packing1d.exact import solve_exact
+
+
+def _check_packing(res, items, capacity=1.0):
+    assert sorted(x for b in res.bins for x in b) == sorted(items)
+    assert all(sum(b) <= capacity for b in res.bins)
+
+def test_exact_beats_ffd():
+    items = [0.44, 0.44, 0.26, 0.26, 0.3, 0.3]
+    assert first_fit_decreasing(items).num_bins == 3
+    ex = solve_exact(items)
+    assert ex.num_bins == 2
+    assert ex.optimal and ex.lower_bound == 2
+    _check_packing(ex.result, items)
+
+def test_exact_triplets_proven_optimal():
+    # sizes on a 1/1024 grid, so every triplet sums to exactly one bin
+    rng = np.random.default_rng(1)
+    items = []
+    for _ in range(8):
+        a = int(rng.integers(256, 512))
+        b = int(rng.integers(256, 768 - a))
+        items += [a / 1024, b / 1024, (1024 - a - b) / 1024]
+    ex = solve_exact(items, time_limit_s=5.0)
+    assert ex.optimal
+    assert ex.num_bins == 8
+    _check_packing(ex.result, items)
+
+def test_exact_never_overfills_a_bin():
+    # the two perfect bins of test_exact_beats_ffd, overfull by 5e-10 each
+    items = [0.44, 0.44, 0.26, 0.26, 0.3 + 5e-10, 0.3 + 5e-10]
+    ex = solve_exact(items)
+    assert ex.num_bins == 3 and ex.optimal
+    _check_packing(ex.result, items)
+
+def test_exact_respects_node_limit():
+    rng = np.random.default_rng(0)
+    items = rng.uniform(0.1, 0.5, 200).tolist()
+    ex = solve_exact(items, time_limit_s=5.0, max_nodes=1000)
+    assert ex.runtime_s < 5.0
+    assert ex.lower_bound <= ex.num_bins
+    _check_packing(ex.result, items)
+
+def test_exact_empty():
+    ex = solve_exact([])
+    assert ex.num_bins == 0 and ex.optimal
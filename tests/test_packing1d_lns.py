@@ -0,0 +1,44 @@
+import numpy as np
+
+from apsuite.packing1d.algorithms import first_fit_decreasing
+from apsuite.packing1d.lns import _best_subset, ffd_lns, lns_improve
+from apsuite.packing1d.lower_bounds import combined_lower_bound
+
+
+def _triplets(k, seed=0):
+    rng = np.random.default_rng(seed)
+    items = []
+    for _ in range(k):
+        a = int(rng.integers(250, 500))
+        b = int(rng.integers(250, 751 - a))
+        items += [a / 1000, b / 1000, (1000 - a - b) / 1000]
+    return rng.permutation(items).tolist()
+
+def test_lns_improves_ffd_and_keeps_items():
+    items = _triplets(20)
+    base = first_fit_decreasing(items)
+    res = lns_improve(base, time_limit_s=1.0, seed=0)
+    assert res.num_bins < base.num_bins
+    assert res.num_bins >= combined_lower_bound(items)
+    assert sorted(res.items[res.order].tolist()) == sorted(items)
+    assert all(sum(b) <= 1.0 for b in res.bins)
+    np.testing.assert_allclose(res.bin_loads, [sum(b) for b in res.bins])
+
+def test_lns_deterministic_for_seed():
+    items = _triplets(15, seed=4)
+    a = ffd_lns(items, time_limit_s=0.5, seed=7)
+    base = first_fit_decreasing(items)
+    b = lns_improve(base, time_limit_s=5.0, seed=7, max_iter=50)
+    c = lns_improve(base, time_limit_s=5.0, seed=7, max_iter=50)
+    assert b.assignment.tolist() == c.assignment.tolist()
+    assert a.num_bins <= base.num_bins
+
+def test_lns_stops_at_lower_bound():
+    items = [0.5, 0.5, 0.5, 0.5]
+    base = first_fit_decreasing(items)
+    assert lns_improve(base, time_limit_s=1.0) is base
+
+def test_best_subset_never_overfills_the_bin():
+    items = [0.44, 0.44, 0.26, 0.26, 0.3 + 5e-10, 0.3 + 5e-10]
+    keep = _best_subset(list(range(len(items))), items, 1.0, max_nodes=1000)
+    assert sum(items[i] for i in keep) <= 1.0
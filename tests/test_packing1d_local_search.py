@@ -1,5 +1,11 @@
+from apsuite.common.types import PackingResult
 from apsuite.packing1d.algorithms import first_fit_decreasing
-from apsuite.packing1d.local_search import local_improve_eliminate_bins
+from apsuite.packing1d.local_search import (
+    _BinEliminator,
+    local_improve_eliminate_bins,
+    try_eliminate_one_bin,
+)
+
 
 def test_local_improvement_never_violates_capacity():
     items = [0.51, 0.49, 0.7, 0.3, 0.3, 0.2, 0.2]
@@ -11,4 +17,36 @@ def test_local_improvement_does_not_increase_bins():
     items = [0.6, 0.6, 0.4, 0.4, 0.2, 0.2]
     res = first_fit_decreasing(items)
     improved = local_improve_eliminate_bins(res, capacity=1.0)
-    assert improved.num_bins <= res.num_bins
\ No newline at end of file
+    assert improved.num_bins <= res.num_bins
+
+def test_local_improvement_tries_more_than_the_lightest_bin():
+    # the lightest bin (0.45) cannot be emptied, the second one can
+    res = PackingResult.from_bins([[0.45], [0.3, 0.3], [0.7], [0.7]])
+    single = local_improve_eliminate_bins(res, max_candidates=1)
+    multi = local_improve_eliminate_bins(res, max_candidates=2)
+    assert single.num_bins == 4
+    assert multi.num_bins == 3
+    assert sorted(multi.items.tolist()) == sorted(res.items.tolist())
+    assert all(load <= 1.0 + 1e-12 for load in multi.loads)
+
+
+def test_try_eliminate_one_bin_keeps_input_on_failure():
+    bins = [[0.45], [0.3, 0.3], [0.7], [0.7]]
+    improved, out = try_eliminate_one_bin(bins)
+    assert not improved and out is bins
+
+
+def test_pass_limits_are_accepted_and_ignored():
+    res = PackingResult.from_bins([[0.45], [0.3, 0.3], [0.7], [0.7]])
+    a = local_improve_eliminate_bins(res, max_passes_per_round=1)
+    b = local_improve_eliminate_bins(res)
+    assert a.assignment.tolist() == b.assignment.tolist()
+    assert try_eliminate_one_bin([[0.3], [0.5]], max_passes=1) == (True, [[0.5, 0.3]])
+
+
+def test_load_keys_follow_moves_and_rollbacks():
+    sizes = [0.45, 0.3, 0.3, 0.7, 0.7]
+    elim = _BinEliminator(sizes, [[0], [1, 2], [3], [4]], capacity=1.0)
+    assert elim.eliminate_one(max_candidates=2)  # bin 0 rolls back, bin 1 empties
+    live = [b for b in range(4) if elim.alive[b]]
+    assert elim.by_load.head(4) == sorted((elim.loads[b], b) for b in live)
@@ -0,0 +1,51 @@
+import numpy as np
+
+from apsuite.packing1d.algorithms import first_fit_decreasing
+from apsuite.packing1d.exact import solve_exact
+from apsuite.packing1d.lower_bounds import combined_lower_bound
+from apsuite.packing1d.lp_bound import lp_lower_bound, lp_lower_bound_info
+
+
+def test_lp_bound_small_exact_scale():
+    info = lp_lower_bound_info([0.6] * 3 + [0.45] * 3)
+    assert info.converged and info.exact_scale
+    assert abs(info.lp_value - 4.5) < 1e-6
+    assert info.bound == 5
+
+def test_lp_bound_between_bounds_and_heuristic():
+    rng = np.random.default_rng(3)
+    items = (rng.integers(20, 101, size=200) / 150).tolist()
+    info = lp_lower_bound_info(items, time_limit_s=5.0)
+    assert info.scale == 150 and info.exact_scale
+    ffd_bins = first_fit_decreasing(items).num_bins
+    assert combined_lower_bound(items) <= info.bound <= ffd_bins
+    assert info.farley <= info.lp_value + 1e-6
+
+def test_lp_bound_triplets_tight():
+    rng = np.random.default_rng(0)
+    items = []
+    for _ in range(10):
+        a = int(rng.integers(250, 500))
+        b = int(rng.integers(250, 751 - a))
+        items += [a / 1000, b / 1000, (1000 - a - b) / 1000]
+    assert lp_lower_bound(items, time_limit_s=5.0) == 10
+
+def test_lp_bound_time_cap_still_valid():
+    rng = np.random.default_rng(1)
+    items = rng.uniform(0.1, 0.5, size=150)
+    info = lp_lower_bound_info(items, time_limit_s=0.05)
+    assert info.runtime_s < 2.0
+    ffd_bins = first_fit_decreasing(items).num_bins
+    assert combined_lower_bound(items) <= info.bound <= ffd_bins
+
+def test_lp_bound_empty():
+    assert lp_lower_bound([]) == 0
+
+def test_lp_bound_off_grid_tiny_items_stay_valid():
+    # sizes below one grid unit must not be rounded up in pricing
+    items = [0.4, 0.4, 0.25, 0.25, 0.3, 0.3] + [9e-5] * 1100
+    info = lp_lower_bound_info(items)
+    assert not info.exact_scale
+    exact = solve_exact(items)
+    assert exact.optimal and exact.num_bins == 2
+    assert info.bound <= exact.num_bins
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from apsuite.packing1d.algorithms import best_fit_decreasing, first_fit_decreasing
+from apsuite.packing1d.multiplicity import (
+    MultiplicityInstance,
+    best_fit_decreasing_runs,
+    first_fit_decreasing_runs,
+)
+
+
+def _repeated_instance(seed=0, n=2000):
+    rng = np.random.default_rng(seed)
+    return rng.choice([20.0, 25.0, 33.0, 45.0, 50.0, 61.0], size=n).tolist()
+
+def test_roundtrip_items():
+    items = [0.5, 0.2, 0.5, 0.3, 0.2, 0.5]
+    inst = MultiplicityInstance.from_items(items)
+    assert inst.sizes.tolist() == [0.5, 0.3, 0.2]
+    assert inst.counts.tolist() == [3, 1, 2]
+    assert inst.num_items == 6 and inst.num_distinct == 3
+    assert inst.to_items().tolist() == sorted(items, reverse=True)
+
+def test_from_counts_merges_and_validates():
+    inst = MultiplicityInstance.from_counts([0.2, 0.4, 0.2], [2, 1, 3])
+    assert inst.sizes.tolist() == [0.4, 0.2]
+    assert inst.counts.tolist() == [1, 5]
+    with pytest.raises(ValueError):
+        MultiplicityInstance.from_counts([0.2], [-1])
+    with pytest.raises(ValueError):
+        MultiplicityInstance.from_counts([1.5], [1])
+
+@pytest.mark.parametrize("runs, flat", [
+    (first_fit_decreasing_runs, first_fit_decreasing),
+    (best_fit_decreasing_runs, best_fit_decreasing),
+])
+def test_runs_match_item_by_item(runs, flat):
+    items = _repeated_instance()
+    inst = MultiplicityInstance.from_items(items, capacity=100.0)
+    packing = runs(inst)
+    ref = flat(items, capacity=100.0)
+    assert packing.num_bins == ref.num_bins
+    assert packing.bin_loads.tolist() == ref.loads
+    # one step per run or per bin left too full for the current size
+    max_steps = inst.num_distinct + inst.num_distinct * packing.num_bins
+    assert packing.run_count.size <= max_steps
+    assert packing.run_count.size < len(items)
+
+    res = packing.to_result()
+    assert res.num_bins == ref.num_bins
+    assert sorted(map(sorted, res.bins)) == sorted(map(sorted, ref.bins))
+
+@pytest.mark.parametrize("runs, flat", [
+    (first_fit_decreasing_runs, first_fit_decreasing),
+    (best_fit_decreasing_runs, best_fit_decreasing),
+])
+def test_runs_match_item_by_item_on_decimal_sizes(runs, flat):
+    # sums of decimal sizes round differently than k * x, so the run
+    # packers must follow the flat ones' sequence of float updates
+    for seed in range(40):
+        rng = np.random.default_rng(seed)
+        pool = np.round(rng.uniform(0.05, 0.6, 8), 2)
+        items = rng.choice(pool, size=300).tolist()
+        packing = runs(items)
+        ref = flat(items)
+        assert packing.num_bins == ref.num_bins
+        assert packing.bin_loads.tolist() == ref.loads
+
+@pytest.mark.parametrize("runs, flat", [
+    (first_fit_decreasing_runs, first_fit_decreasing),
+    (best_fit_decreasing_runs, best_fit_decreasing),
+])
+def test_runs_match_item_by_item_with_many_copies_per_bin(runs, flat):
+    # hundreds of copies per bin take the vectorized path of _place_copies
+    for seed in range(10):
+        rng = np.random.default_rng(seed)
+        sizes = np.round(rng.uniform(0.001, 0.01, 4), 4).tolist() + [0.37]
+        items = rng.choice(sizes, size=5000).tolist()
+        packing = runs(items)
+        ref = flat(items)
+        assert packing.num_bins == ref.num_bins
+        assert packing.bin_loads.tolist() == ref.loads
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from apsuite.packing1d.algorithms import best_fit, first_fit
+from apsuite.packing1d.online import OnlinePacker
+
+
+def test_online_packer_matches_batch_algorithms():
+    items = np.random.default_rng(3).uniform(0.01, 0.6, 300).tolist()
+    for policy, alg in [("first_fit", first_fit), ("best_fit", best_fit)]:
+        packer = OnlinePacker(capacity=1.0, policy=policy)
+        bins = [packer.add(x) for x in items]
+        ref = alg(items)
+        assert bins == ref.assignment.tolist()
+        assert packer.snapshot().bins == ref.bins
+
+
+def test_online_next_fit_only_uses_last_bin():
+    packer = OnlinePacker(policy="next_fit")
+    assert [packer.add(x) for x in [0.6, 0.5, 0.3, 0.5]] == [0, 1, 1, 2]
+
+
+def test_online_remove_frees_space_and_snapshot_drops_empty_bins():
+    packer = OnlinePacker(policy="first_fit")
+    for x in [0.7, 0.7, 0.7]:
+        packer.add(x)
+    packer.remove(0)
+    assert packer.num_bins == 2
+    assert packer.add(0.9) == 0  # emptied bin is reused
+    packer.remove(1)
+    snap = packer.snapshot()
+    assert packer.live_item_ids().tolist() == [2, 3]
+    assert snap.num_bins == 2
+    assert snap.bins == [[0.9], [0.7]]
+    with pytest.raises(KeyError):
+        packer.remove(1)
@@ -0,0 +1,32 @@
+from itertools import chain
+
+from apsuite.packing1d.instances import (
+    InstanceSpec,
+    generate_instance_chunks,
+)
+from apsuite.packing1d.streaming import harmonic_k, next_fit_stream, next_k_fit
+
+
+def test_next_k_fit_emits_every_item_once_within_capacity():
+    items = [0.6, 0.5, 0.3, 0.5, 0.45, 0.2, 0.9]
+    closed = []
+    summary = next_k_fit(iter(items), k=2, sink=closed.append)
+    assert summary.num_bins == len(closed)
+    assert sorted(chain.from_iterable(closed)) == sorted(items)
+    assert all(sum(b) <= 1.0 + 1e-12 for b in closed)
+    assert next_fit_stream(items).num_bins >= summary.num_bins
+
+
+def test_harmonic_k_packs_large_items_alone_and_pairs_halves():
+    closed = []
+    summary = harmonic_k([0.7, 0.4, 0.45, 0.1, 0.1], k=3, sink=closed.append)
+    assert summary.num_items == 5
+    assert [0.7] in closed and [0.4, 0.45] in closed and [0.1, 0.1] in closed
+
+
+def test_streaming_over_chunked_generator():
+    spec = InstanceSpec(name="s", n=10_000, dist="uniform", seed=0)
+    chunks = generate_instance_chunks(spec, chunk_size=1000)
+    summary = harmonic_k(chain.from_iterable(chunks), k=5)
+    assert summary.num_items == 10_000
+    assert summary.num_bins >= summary.total_size
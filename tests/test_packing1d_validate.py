@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from apsuite.packing1d.algorithms import first_fit, first_fit_decreasing
+from apsuite.packing1d.lower_bounds import volume_lower_bound
+from apsuite.packing1d.validate import ValidatedItems, validate_items_array
+
+
+def test_validate_array_is_zero_copy_read_only_view():
+    raw = np.array([0.5, 0.25, 0.75])
+    items = validate_items_array(raw, capacity=1.0)
+    assert isinstance(items, ValidatedItems)
+    assert np.shares_memory(items, raw)
+    assert not items.flags.writeable
+    assert validate_items_array(items, capacity=1.0) is items
+
+
+def test_validate_array_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        validate_items_array(np.array([0.5, 0.0]))
+    with pytest.raises(ValueError):
+        validate_items_array(np.array([0.5, np.nan]))
+    with pytest.raises(ValueError):
+        validate_items_array([0.5, 1.5], capacity=1.0)
+    with pytest.raises(TypeError):
+        validate_items_array(["a", "b"])
+
+
+def test_prevalidated_items_accepted_by_algorithms_and_bounds():
+    items = validate_items_array([0.5, 0.7, 0.2, 0.4], capacity=1.0)
+    assert volume_lower_bound(items) == 2
+    assert first_fit_decreasing(items).num_bins == 2
+
+
+def test_derived_arrays_are_validated_again():
+    items = validate_items_array([0.5, 0.6], capacity=1.0)
+    for derived in (items * 3, items - 1):
+        assert derived.capacity is None
+        with pytest.raises(ValueError):
+            first_fit(derived)
+    assert items[:1].capacity is None
+    assert first_fit(items[:1]).loads == [0.5]
@@ -0,0 +1,49 @@
+from apsuite.packing2d.algorithms import guillotine, guillotine_multibin, maxrects
+from apsuite.packing2d.instances import Instance2DSpec, generate_rectangles
+from apsuite.packing2d.lower_bounds import (
+    area_lower_bound,
+    combined_lower_bound_2d,
+    dff_lower_bound_2d,
+    martello_vigo_l2,
+)
+from apsuite.packing2d.types import Rect
+
+
+def test_bounds_empty():
+    assert combined_lower_bound_2d([], W=1, H=1) == 0
+
+def test_l1_projection_on_tall_narrow_rects():
+    # full-height strips just over a third wide: two per bin
+    rects = [Rect(0.34, 1.0)] * 5
+    assert area_lower_bound(rects, W=1, H=1) == 2
+    assert martello_vigo_l2(rects, W=1, H=1) == 3
+    assert combined_lower_bound_2d(rects, W=1, H=1) == 3
+
+def test_l2_counts_rects_that_cannot_join_big_ones():
+    # no 0.45 square fits next to a 0.6 square
+    rects = [Rect(0.6, 0.6)] * 3 + [Rect(0.45, 0.45)] * 3
+    assert area_lower_bound(rects, W=1, H=1) == 2
+    assert martello_vigo_l2(rects, W=1, H=1) == 4
+    assert dff_lower_bound_2d(rects, W=1, H=1) == 4
+
+def test_bounds_never_exceed_heuristics():
+    for dist in ["uniform", "bimodal", "heavy_tail"]:
+        for seed in range(3):
+            spec = Instance2DSpec(name="t", n=120, dist=dist, seed=seed, W=2.0, H=1.0)
+            rects = generate_rectangles(spec)
+            ub = min(
+                maxrects(rects, W=2.0, H=1.0).num_bins,
+                guillotine_multibin(rects, W=2.0, H=1.0).num_bins,
+            )
+            lb = combined_lower_bound_2d(rects, W=2.0, H=1.0)
+            assert area_lower_bound(rects, W=2.0, H=1.0) <= lb <= ub
+
+def test_rotation_bound_on_square_bin():
+    # strips just over a third thick: two per bin once all lie the same way
+    rects = [Rect(1.0, 0.34), Rect(0.34, 1.0)] * 3
+    lb = combined_lower_bound_2d(rects, W=1, H=1, allow_rotation=True)
+    assert area_lower_bound(rects, W=1, H=1, allow_rotation=True) == 3
+    assert lb == 3
+    assert lb <= guillotine(rects, W=1, H=1, allow_rotation=True).num_bins
+    # on a non-square bin rotation falls back to the area bound
+    assert dff_lower_bound_2d([Rect(0.5, 1.5)] * 3, W=2, H=1, allow_rotation=True) == 2
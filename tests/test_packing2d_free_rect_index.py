@@ -0,0 +1,40 @@
+from apsuite.packing2d.free_rect_index import BinSummaryTree, FreeRect, FreeRectIndex
+from apsuite.packing2d.types import Rect
+
+
+def test_best_prefers_smallest_score_then_list_order():
+    idx = FreeRectIndex(W=4, H=4)
+    idx.replace(0, [FreeRect(2, 0, 2, 1), FreeRect(0, 1, 4, 3), FreeRect(0, 0, 2, 1)])
+    # the last piece is contained in nothing and ties with the first piece
+    assert idx.best(Rect(2, 1), "best_area_fit") == 1
+    assert idx.best(Rect(3, 1), "best_area_fit") == 2
+    assert idx.best(Rect(5, 1), "best_area_fit") is None
+
+def test_best_placement_scores_both_orientations():
+    idx = FreeRectIndex(W=4, H=4)
+    idx.replace(0, [FreeRect(1, 0, 3, 1), FreeRect(0, 1, 1, 3)])
+    for score in ("best_area_fit", "best_short_side"):
+        assert idx.best_placement(Rect(1, 3), score) == (2, False)
+        # equal scores: the earlier piece wins, even if r must be rotated
+        assert idx.best_placement(Rect(1, 3), score, allow_rotation=True) == (1, True)
+        assert idx.best_placement(Rect(3, 1), score, allow_rotation=True) == (1, False)
+        no_fit = idx.best_placement(Rect(3, 2), score, allow_rotation=True)
+        assert no_fit == (None, False)
+
+def test_replace_prunes_contained_rectangles():
+    idx = FreeRectIndex(W=4, H=4)
+    idx.replace(0, [FreeRect(0, 0, 4, 2), FreeRect(1, 0, 1, 1)])
+    assert [(r.x, r.y, r.w, r.h) for r in idx.rects()] == [(0, 0, 4, 2)]
+    # identical rectangles contain each other and are both dropped
+    idx.replace(1, [FreeRect(0, 0, 1, 1), FreeRect(0, 0, 1, 1)])
+    assert len(idx) == 0
+
+def test_bin_summary_tree_skips_bins_that_cannot_fit():
+    tree = BinSummaryTree()
+    tree.update(0, 1.0, 4.0, 4.0)
+    tree.update(1, 4.0, 1.0, 4.0)
+    tree.update(2, 3.0, 3.0, 9.0)
+    assert list(tree.candidates(Rect(2, 2))) == [2]
+    assert list(tree.candidates(Rect(1, 1))) == [0, 1, 2]
+    tree.update(0, 0.0, 0.0, 0.0)
+    assert list(tree.candidates(Rect(1, 1))) == [1, 2]
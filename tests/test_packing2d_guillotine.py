@@ -1,17 +1,20 @@
+import random
+
+from apsuite.packing2d.guillotine import guillotine_pack, guillotine_pack_multibin
 from apsuite.packing2d.types import Rect
-from apsuite.packing2d.guillotine import guillotine_pack
 
-def test_guillotine_pack_simple_fit_one_bin():
+
+def test_guillotine_pack_simple_fit_one_bin(any_backend):
     rects = [Rect(2,1), Rect(2,1), Rect(2,1)]
     res = guillotine_pack(rects, W=4, H=2)
     assert res.num_bins == 1
 
-def test_guillotine_pack_multiple_bins():
+def test_guillotine_pack_multiple_bins(any_backend):
     rects = [Rect(4,2), Rect(4,2)]
     res = guillotine_pack(rects, W=4, H=2)
     assert res.num_bins == 2
 
-def test_guillotine_never_places_outside_bin():
+def test_guillotine_never_places_outside_bin(any_backend):
     rects = [Rect(3,1), Rect(1,1), Rect(2,1)]
     W, H = 4, 2
     res = guillotine_pack(rects, W=W, H=H)
@@ -19,4 +22,62 @@ def test_guillotine_never_places_outside_bin():
         for r, x, y in b.placements:
             assert x >= -1e-12 and y >= -1e-12
             assert x + r.w <= W + 1e-12
-            assert y + r.h <= H + 1e-12
\ No newline at end of file
+            assert y + r.h <= H + 1e-12
+
+def test_guillotine_pack_count_only_matches_full_result(any_backend):
+    rects = [Rect(3,1), Rect(1,1), Rect(2,1), Rect(4,2), Rect(1,2)]
+    full = guillotine_pack(rects, W=4, H=2)
+    counted = guillotine_pack(rects, W=4, H=2, count_only=True)
+    assert counted.num_bins == full.num_bins
+    areas = [sum(r.w * r.h for r, _, _ in b.placements) for b in full.bins]
+    assert counted.loads == areas
+
+def test_guillotine_indexed_engine_matches_linear(python_backend):
+    rng = random.Random(3)
+    for _ in range(20):
+        rects = [
+            Rect(rng.choice([0.1, 0.25, 0.3, 0.5]), rng.uniform(0.05, 0.6))
+            for _ in range(40)
+        ]
+        for score in ("best_area_fit", "best_short_side"):
+            a = guillotine_pack(rects, W=1, H=1, score=score, engine="linear")
+            b = guillotine_pack(rects, W=1, H=1, score=score, engine="indexed")
+            assert [p.placements for p in a.bins] == [p.placements for p in b.bins]
+
+def test_guillotine_multibin_reuses_space_in_earlier_bins():
+    # single-bin packing closes bin 0 with a 4x1 gap that a later rect fits
+    rects = [Rect(4, 3), Rect(4, 3), Rect(4, 1), Rect(4, 1)]
+    W, H = 4, 4
+    assert guillotine_pack(rects, W=W, H=H, order="input").num_bins == 3
+    res = guillotine_pack_multibin(rects, W=W, H=H, order="input")
+    assert res.num_bins == 2
+    assert [len(b.placements) for b in res.bins] == [2, 2]
+    counted = guillotine_pack_multibin(rects, W=W, H=H, order="input", count_only=True)
+    assert counted.loads == [16.0, 16.0]
+
+def test_guillotine_rotation_engines_agree(python_backend):
+    rng = random.Random(5)
+    rects = [
+        Rect(
+            rng.choice([0.2, 0.5, 0.9]),
+            rng.choice([0.1, 0.3, rng.uniform(0.05, 0.5)]),
+        )
+        for _ in range(60)
+    ]
+    for score in ("best_area_fit", "best_short_side"):
+        a = guillotine_pack(
+            rects, W=1, H=0.6, score=score, engine="linear", allow_rotation=True
+        )
+        b = guillotine_pack(
+            rects, W=1, H=0.6, score=score, engine="indexed", allow_rotation=True
+        )
+        assert [p.placements for p in a.bins] == [p.placements for p in b.bins]
+
+def test_guillotine_rotation_fills_tall_gap(any_backend):
+    # a 1x3 gap is left beside the 3x3; the 3x1 only fits it rotated
+    rects = [Rect(3,3), Rect(3,1)]
+    assert guillotine_pack(rects, W=4, H=3, order="input").num_bins == 2
+    res = guillotine_pack(rects, W=4, H=3, order="input", allow_rotation=True)
+    assert res.num_bins == 1
+    r, x, y = res.bins[0].placements[1]
+    assert (r.w, r.h, x, y) == (1, 3, 3.0, 0.0)
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from apsuite.packing2d.maxrects import RULES, MaxRectsBin, maxrects_pack
+from apsuite.packing2d.types import Rect
+
+
+def _assert_valid(res, W, H, n):
+    assert sum(len(b.placements) for b in res.bins) == n
+    for b in res.bins:
+        P = b.placements
+        for i, (r, x, y) in enumerate(P):
+            assert x >= -1e-12 and y >= -1e-12
+            assert x + r.w <= W + 1e-12 and y + r.h <= H + 1e-12
+            for s, u, v in P[:i]:
+                assert (x >= u + s.w - 1e-12 or u >= x + r.w - 1e-12
+                        or y >= v + s.h - 1e-12 or v >= y + r.h - 1e-12)
+
+@pytest.mark.parametrize("rule", RULES)
+def test_maxrects_packings_are_valid(rule):
+    rng = random.Random(7)
+    rects = [Rect(rng.uniform(0.5, 4), rng.uniform(0.5, 4)) for _ in range(120)]
+    res = maxrects_pack(rects, W=10, H=10, rule=rule)
+    _assert_valid(res, 10, 10, len(rects))
+    counted = maxrects_pack(rects, W=10, H=10, rule=rule, count_only=True)
+    assert counted.num_bins == res.num_bins
+
+def test_maxrects_fills_l_shaped_space():
+    # after a 3x3 square in a 4x4 bin the free space is an L: maxrects
+    # keeps both full-length strips, so 4x1 and 1x3 still fit
+    rects = [Rect(3, 3), Rect(4, 1), Rect(1, 3)]
+    res = maxrects_pack(rects, W=4, H=4, order="input")
+    assert res.num_bins == 1
+    _assert_valid(res, 4, 4, 3)
+
+def test_maxrects_bin_keeps_only_maximal_free_rectangles():
+    mb = MaxRectsBin(W=4, H=4)
+    mb.place(Rect(2, 2), mb.find(Rect(2, 2), "bottom_left"))
+    assert sorted(mb.free_rects()) == [(0.0, 2.0, 4.0, 2.0), (2.0, 0.0, 2.0, 4.0)]
+    mb.place(Rect(2, 2), mb.find(Rect(2, 2), "bottom_left"))
+    assert mb.free_rects() == [(0.0, 2.0, 4.0, 2.0)]
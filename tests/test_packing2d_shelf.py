@@ -1,6 +1,9 @@
-from apsuite.packing2d.types import Rect
+import pytest
+
 from apsuite.packing2d.lower_bounds import area_lower_bound
-from apsuite.packing2d.shelf import shelf_pack
+from apsuite.packing2d.shelf import open_shelf_pack, shelf_pack
+from apsuite.packing2d.types import Rect
+
 
 def test_area_lower_bound_simple():
     rects = [Rect(1,1), Rect(1,1)]
@@ -14,4 +17,36 @@ def test_shelf_pack_produces_valid_bin_count():
 def test_shelf_pack_multiple_bins():
     rects = [Rect(4,2), Rect(4,2)]
     res = shelf_pack(rects, W=4, H=2)
-    assert res.num_bins == 2
\ No newline at end of file
+    assert res.num_bins == 2
+
+def test_shelf_pack_count_only_matches_full_result():
+    rects = [Rect(2,1), Rect(3,1), Rect(1,2), Rect(4,1), Rect(2,2)]
+    full = shelf_pack(rects, W=4, H=2)
+    counted = shelf_pack(rects, W=4, H=2, count_only=True)
+    assert counted.num_bins == full.num_bins
+    areas = [sum(r.w * r.h for r, _, _ in b.placements) for b in full.bins]
+    assert counted.loads == areas
+
+def test_open_shelf_pack_reuses_earlier_shelves():
+    # Next-Fit opens a third shelf for the 2x1; FFDH/BFDH put it on shelf 0
+    rects = [Rect(2,2), Rect(3,1), Rect(2,1), Rect(1,1)]
+    assert shelf_pack(rects, W=4, H=3).num_bins == 2
+    for fit in ("first_fit", "best_fit"):
+        res = open_shelf_pack(rects, W=4, H=3, fit=fit)
+        assert res.num_bins == 1
+        placed = {(r.w, r.h): (x, y) for r, x, y in res.bins[0].placements}
+        assert placed[(2, 1)] == (2.0, 0.0)
+        assert placed[(1, 1)] == (3.0, 2.0)
+        counted = open_shelf_pack(rects, W=4, H=3, fit=fit, count_only=True)
+        assert counted.loads == [10.0]
+
+def test_rotation_accepts_rects_that_only_fit_rotated():
+    rects = [Rect(1,4), Rect(1,4)]
+    with pytest.raises(ValueError):
+        area_lower_bound(rects, W=4, H=2)
+    assert area_lower_bound(rects, W=4, H=2, allow_rotation=True) == 1
+    for pack in (shelf_pack, open_shelf_pack):
+        res = pack(rects, W=4, H=2, allow_rotation=True)
+        assert res.num_bins == 1
+        placed = [(r.w, r.h, y) for r, _, y in res.bins[0].placements]
+        assert placed == [(4, 1, 0.0), (4, 1, 1.0)]
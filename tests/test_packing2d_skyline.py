@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from apsuite.packing2d.skyline import RULES, Skyline, skyline_pack
+from apsuite.packing2d.types import Rect
+
+
+def _assert_valid(res, W, H, n):
+    assert sum(len(b.placements) for b in res.bins) == n
+    for b in res.bins:
+        P = b.placements
+        for i, (r, x, y) in enumerate(P):
+            assert x >= -1e-12 and y >= -1e-12
+            assert x + r.w <= W + 1e-12 and y + r.h <= H + 1e-12
+            for s, u, v in P[:i]:
+                assert (x >= u + s.w - 1e-12 or u >= x + r.w - 1e-12
+                        or y >= v + s.h - 1e-12 or v >= y + r.h - 1e-12)
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("waste_map", [True, False])
+def test_skyline_packings_are_valid(rule, waste_map):
+    rng = random.Random(11)
+    rects = [Rect(rng.uniform(0.3, 4), rng.uniform(0.3, 4)) for _ in range(150)]
+    res = skyline_pack(rects, W=10, H=10, rule=rule, waste_map=waste_map)
+    _assert_valid(res, 10, 10, len(rects))
+    counted = skyline_pack(
+        rects, W=10, H=10, rule=rule, waste_map=waste_map, count_only=True
+    )
+    assert counted.num_bins == res.num_bins
+
+def test_skyline_segments_merge_and_report_gaps():
+    sky = Skyline(W=4, H=4)
+    assert sky.place(0, 2, 2, 0.0) == []
+    i, y = sky.find(Rect(2, 1), "bottom_left")
+    assert (sky.xs[i], y) == (2.0, 0.0)
+    sky.place(i, 2, 2, y)
+    assert (sky.xs, sky.ys) == ([0.0], [2.0])  # equal heights merged
+    sky.place(0, 1, 1, 2.0)
+    i, y = sky.find(Rect(3, 1), "bottom_left")
+    assert (sky.xs[i], y) == (1.0, 2.0)
+    gaps = sky.place(0, 2, 1, 3.0)
+    assert [(g.x, g.y, g.w, g.h) for g in gaps] == [(1.0, 2.0, 1.0, 1.0)]
+
+def test_skyline_waste_map_fills_gaps():
+    # the 4x1 rests on the 1x2 and traps a 3x1 gap that only the waste map reuses
+    rects = [Rect(1, 2), Rect(3, 1), Rect(4, 1), Rect(3, 1)]
+    W, H = 4, 3
+    assert skyline_pack(rects, W=W, H=H, order="input", waste_map=True).num_bins == 1
+    assert skyline_pack(rects, W=W, H=H, order="input", waste_map=False).num_bins == 2
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from apsuite.packing2d.guillotine import guillotine_pack_multibin
+from apsuite.packing2d.shelf import shelf_pack
+from apsuite.packing2d.types import PLACEMENT_DTYPE, Bin2D, Packing2DResult, Rect
+
+
+def test_shelf_result_layout_columns_and_bins_view():
+    rects = [Rect(0.5, 0.5, id=0), Rect(0.5, 0.25, id=1), Rect(0.75, 0.75)]
+    res = shelf_pack(rects, 1.0, 1.0, decreasing_height=False)
+    assert res.layout.dtype == PLACEMENT_DTYPE
+    assert res.num_bins == 2
+    assert res.layout["id"].tolist() == [0, 1, -1]
+    assert res.layout["bin"].tolist() == [0, 0, 1]
+    assert res.layout["x"].tolist() == [0.0, 0.5, 0.0]
+    assert res.layout["w"].tolist() == [0.5, 0.5, 0.75]
+    assert [len(b.placements) for b in res.bins] == [2, 1]
+    assert res.bins[0].placements[1] == (rects[1], 0.5, 0.0)
+
+
+def test_from_bins_round_trip():
+    a, b, c = Rect(0.5, 0.5, id=7), Rect(0.25, 0.5), Rect(1.0, 0.5, id=3)
+    bins = [
+        Bin2D(placements=[(a, 0.0, 0.0), (b, 0.5, 0.0)]),
+        Bin2D(placements=[(c, 0.0, 0.5)]),
+    ]
+    res = Packing2DResult.from_bins(bins)
+    assert res.num_bins == 2
+    assert res.layout["bin"].tolist() == [0, 0, 1]
+    assert res.layout["id"].tolist() == [7, -1, 3]
+    assert res.bins == bins
+
+
+def test_bins_keyword_builds_columnar_result():
+    a, b = Rect(0.5, 0.5, id=1), Rect(0.5, 1.0, id=2)
+    bins = [Bin2D(placements=[(a, 0.0, 0.0)]), Bin2D(placements=[(b, 0.0, 0.0)])]
+    res = Packing2DResult(bins=bins)
+    assert res.num_bins == 2
+    assert res.layout["id"].tolist() == [1, 2]
+    assert res.bins == bins
+    with pytest.raises(TypeError):
+        Packing2DResult(res.layout, bins=bins)
+    with pytest.raises(TypeError):
+        Packing2DResult(res.layout)
+
+
+def test_multibin_bins_view_grouped_by_bin():
+    rects = [Rect(0.6, 0.6, id=i) for i in range(3)] + [Rect(0.3, 0.3, id=3)]
+    res = guillotine_pack_multibin(rects, 1.0, 1.0, order="input")
+    assert res.num_bins == 3
+    assert res.layout["bin"].tolist() == [0, 1, 2, 0]
+    assert [[r.id for r, _, _ in b.placements] for b in res.bins] == [[0, 3], [1], [2]]
+
+
+def test_geometry_types_are_slotted():
+    r = Rect(1.0, 2.0)
+    assert not hasattr(r, "__dict__")
+    with pytest.raises(AttributeError):
+        r.w = 3.0
+    names = np.empty(0, dtype=PLACEMENT_DTYPE).dtype.names
+    assert names == ("id", "bin", "x", "y", "w", "h")
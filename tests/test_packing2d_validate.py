@@ -0,0 +1,86 @@
+import warnings
+
+import pytest
+
+from apsuite.common.backend import get_backend
+from apsuite.experiments.registry import run_packing2d
+from apsuite.packing2d.algorithms import (
+    bfdh,
+    ffdh,
+    guillotine,
+    guillotine_multibin,
+    maxrects,
+    shelf,
+    skyline,
+)
+from apsuite.packing2d.instances import Instance2DSpec, generate_rectangles
+from apsuite.packing2d.types import Bin2D, Packing2DResult, Rect
+from apsuite.packing2d.validate import verify_packing
+
+
+def _result(*bins):
+    return Packing2DResult.from_bins([Bin2D(placements=list(p)) for p in bins])
+
+def test_verify_accepts_touching_rects():
+    a, b, c = Rect(0.5, 1.0, id=0), Rect(0.5, 0.5, id=1), Rect(0.5, 0.5, id=2)
+    res = _result([(a, 0.0, 0.0), (b, 0.5, 0.0), (c, 0.5, 0.5)])
+    verify_packing(res, [a, b, c], W=1, H=1)
+
+def test_verify_rejects_overlap_outside_and_missing():
+    a, b = Rect(0.6, 0.5, id=0), Rect(0.6, 0.5, id=1)
+    with pytest.raises(ValueError, match="overlap"):
+        verify_packing(_result([(a, 0.0, 0.0), (b, 0.3, 0.2)]), [a, b], W=1, H=1)
+    with pytest.raises(ValueError, match="outside"):
+        verify_packing(_result([(a, 0.0, 0.0), (b, 0.5, 0.5)]), [a, b], W=1, H=1)
+    with pytest.raises(ValueError, match="do not match"):
+        verify_packing(_result([(a, 0.0, 0.0)], [(a, 0.0, 0.0)]), [a, b], W=1, H=1)
+    # rects far apart in y must not hide an overlap between their neighbours
+    c, d = Rect(0.2, 0.2, id=2), Rect(0.3, 0.3, id=3)
+    res = _result([(c, 0.0, 0.0), (a, 0.0, 0.5), (d, 0.1, 0.1)])
+    with pytest.raises(ValueError, match="overlap"):
+        verify_packing(res, [a, c, d], W=1, H=1)
+
+def test_verify_rotated_placements():
+    r = Rect(2.0, 1.0, id=0)
+    res = _result([(Rect(1.0, 2.0, id=0), 0.0, 0.0)])
+    verify_packing(res, [r], W=1, H=2, allow_rotation=True)
+    with pytest.raises(ValueError, match="do not match"):
+        verify_packing(res, [r], W=2, H=2)
+
+@pytest.mark.parametrize(
+    "alg", [shelf, ffdh, bfdh, guillotine, guillotine_multibin, maxrects, skyline]
+)
+def test_packers_produce_feasible_layouts(alg):
+    for dist in ["uniform", "bimodal", "heavy_tail"]:
+        rects = generate_rectangles(
+            Instance2DSpec(name="t", n=150, dist=dist, seed=3, W=2.0, H=1.0)
+        )
+        rects = [Rect(r.w, r.h, id=i) for i, r in enumerate(rects)]
+        verify_packing(alg(rects, W=2.0, H=1.0), rects, W=2.0, H=1.0)
+
+def test_run_packing2d_verifies_results():
+    cfg = {"grid": {"dist": ["uniform"], "n": [40]}, "params": {"verify": True}}
+    rows = run_packing2d(cfg)
+    assert rows and all(row["objective"] >= row["lb_trivial"] for row in rows)
+    with pytest.raises(ValueError, match="count_only"):
+        run_packing2d({**cfg, "params": {"verify": 0.5, "count_only": True}})
+
+def test_run_packing2d_records_rotation_per_algorithm():
+    cfg = {
+        "grid": {"dist": ["uniform"], "n": [30]},
+        "params": {"verify": True, "allow_rotation": True},
+    }
+    rotated = {row["alg"]: row["rotation"] for row in run_packing2d(cfg)}
+    assert rotated["GUILLOTINE"] and rotated["FFDH"]
+    assert not any(rotated[alg] for alg in ("GUILLOTINE-MB", "MAXRECTS", "SKYLINE"))
+    rows = run_packing2d({**cfg, "params": {"verify": True}})
+    assert not any(row["rotation"] for row in rows)
+
+def test_run_packing2d_restores_backend():
+    before = get_backend()
+    other = "numba" if before == "python" else "python"
+    cfg = {"grid": {"dist": ["uniform"], "n": [20]}, "params": {"backend": other}}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # numba may be missing
+        run_packing2d(cfg)
+    assert get_backend() == before
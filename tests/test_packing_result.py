@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from apsuite.common.metrics import packing_metrics
+from apsuite.common.types import PackingResult
+from apsuite.packing1d.algorithms import ffd_local_improve, first_fit_decreasing
+
+
+def test_ffd_result_keeps_item_identity_and_bins_view():
+    items = [0.2, 0.7, 0.5, 0.3]
+    res = first_fit_decreasing(items)
+    assert res.assignment.dtype == np.int32
+    assert res.bin_loads.dtype == np.float64
+    assert res.items.tolist() == items
+    assert res.assignment.tolist() == [1, 0, 1, 0]
+    assert res.bins == [[0.7, 0.3], [0.5, 0.2]]
+    assert res.loads == [sum(b) for b in res.bins]
+
+
+def test_from_bins_round_trip_and_metrics():
+    res = PackingResult.from_bins([[0.5, 0.25], [0.75]])
+    assert res.num_bins == 2
+    assert res.bins == [[0.5, 0.25], [0.75]]
+    met = packing_metrics(res, lower_bound=2)
+    assert met.approx_ratio_vs_lb == 1.0
+
+
+def test_bins_keyword_builds_compact_result():
+    res = PackingResult(bins=[[0.5, 0.25], [0.75]])
+    assert res.assignment.tolist() == [0, 0, 1]
+    assert res.loads == [0.75, 0.75]
+    assert res.bins == [[0.5, 0.25], [0.75]]
+    with pytest.raises(TypeError):
+        PackingResult(items=res.items, bins=[[0.5]])
+
+
+def test_local_improvement_preserves_items():
+    items = [0.6, 0.6, 0.4, 0.4, 0.2, 0.2, 0.35]
+    res = ffd_local_improve(items)
+    assert sorted(res.items.tolist()) == sorted(items)
+    for b, load in enumerate(res.bin_loads):
+        assert abs(res.items[res.assignment == b].sum() - load) < 1e-12
@@ -1,10 +1,14 @@
 import numpy as np
+import pytest
+
 from apsuite.scheduling.unrelated.rounding import (
     round_by_argmax_with_load_tiebreak,
     makespan_from_assignment,
     local_improve_single_moves,
 )
 
+pytestmark = pytest.mark.usefixtures("any_backend")
+
 def test_rounding_returns_valid_assignment():
     p = np.array([[3,2,7],[4,1,3]], dtype=float)
     x = np.array([[0.2,0.9,0.1],[0.8,0.1,0.9]], dtype=float)  # shape (2,3)